@@ -19,7 +19,9 @@ from ._column import Column
 from .dbapi20 import BINARY, DATETIME, NUMBER, ROWID, STRING, Binary, Date
 from .dbapi20 import DateFromTicks, Time, TimeFromTicks, Timestamp, TimestampFromTicks
 from .version import __version__ as __version__  # noqa: F401
+from ._queries import QueryCache, query_cache
 from ._pipeline import Pipeline
+from ._preparing import LatencyPreparePolicy, PreparePolicy
 from .connection import Connection
 from .raw_cursor import AsyncRawCursor, AsyncRawServerCursor, RawCursor, RawServerCursor
 from .transaction import AsyncTransaction, Rollback, Transaction
@@ -77,8 +79,12 @@ __all__ = [
     "Copy",
     "Cursor",
     "IsolationLevel",
+    "LatencyPreparePolicy",
     "Notify",
     "Pipeline",
+    "PreparePolicy",
+    "QueryCache",
+    "query_cache",
     "RawCursor",
     "RawServerCursor",
     "Rollback",
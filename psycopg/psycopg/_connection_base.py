@@ -25,7 +25,7 @@ from .adapt import AdaptersMap
 from ._enums import IsolationLevel
 from ._compat import LiteralString, Self, TypeVar
 from .pq.misc import connection_summary
-from ._preparing import PrepareManager
+from ._preparing import PrepareManager, PreparePolicy
 from ._capabilities import capabilities
 from ._pipeline_base import BasePipeline
 from ._connection_info import ConnectionInfo
@@ -130,6 +130,12 @@ class BaseConnection(Generic[Row]):
         # Time after which the connection should be closed
         self._expire_at: float
 
+        # Time since the connection is idle in the pool
+        self._idle_since: float
+
+        # Number of statements prepared when last returned to the pool
+        self._pool_prepared_num: int
+
         self._isolation_level: IsolationLevel | None = None
         self._read_only: bool | None = None
         self._deferrable: bool | None = None
@@ -404,6 +410,17 @@ class BaseConnection(Generic[Row]):
     def prepare_threshold(self, value: int | None) -> None:
         self._prepared.prepare_threshold = value
 
+    @property
+    def prepare_policy(self) -> PreparePolicy:
+        """
+        The object deciding which queries to prepare and which to deallocate.
+        """
+        return self._prepared.policy
+
+    @prepare_policy.setter
+    def prepare_policy(self, value: PreparePolicy) -> None:
+        self._prepared.policy = value
+
     @property
     def prepared_max(self) -> int | None:
         """
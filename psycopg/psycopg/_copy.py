@@ -11,17 +11,21 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
-from collections.abc import Iterator, Sequence
+from typing import IO, TYPE_CHECKING, Any
+from itertools import islice
+from collections.abc import Iterable, Iterator, Sequence
 
 from . import errors as e
 from . import pq
 from ._compat import Self
 from ._acompat import Queue, Worker, gather, spawn
-from ._copy_base import MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE, BaseCopy
+from ._copy_base import BUFFER_SIZE, IOV_MAX, MAX_BUFFER_SIZE, QUEUE_SIZE, BaseCopy
+from ._copy_base import FlushPolicy, check_copy_params, flush_from_policy, write_fd
 from .generators import copy_end, copy_to
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from .abc import Buffer
     from .cursor import Cursor
     from .connection import Connection  # noqa: F401
@@ -39,6 +43,13 @@ class Copy(BaseCopy["Connection[Any]"]):
     :param binary: if `!True`, write binary format.
     :param writer: the object to write to destination. If not specified, write
         to the `!cursor` connection.
+    :param buffer_size: the size of the data accumulated by `write_row()`
+        before passing it to the writer.
+    :param queue_size: if specified, write to the `!cursor` connection using
+        an `~psycopg.copy.QueuedLibpqWriter` with a queue of this size.
+    :param flush_policy: when to flush the data written to the `!cursor`
+        connection: ``"always"``, ``"never"`` (leaving the choice to the
+        libpq), or ``"auto"`` to choose according to the platform.
 
     Choosing `!binary` is not necessary if the cursor has executed a
     :sql:`COPY` operation, because the operation result describes the format
@@ -57,10 +68,19 @@ class Copy(BaseCopy["Connection[Any]"]):
         *,
         binary: bool | None = None,
         writer: Writer | None = None,
+        buffer_size: int = BUFFER_SIZE,
+        queue_size: int | None = None,
+        flush_policy: FlushPolicy | None = None,
     ):
-        super().__init__(cursor, binary=binary)
+        check_copy_params(writer, buffer_size, queue_size, flush_policy)
+        super().__init__(cursor, binary=binary, buffer_size=buffer_size)
         if not writer:
-            writer = LibpqWriter(cursor)
+            if queue_size is not None:
+                writer = QueuedLibpqWriter(
+                    cursor, queue_size=queue_size, flush_policy=flush_policy
+                )
+            else:
+                writer = LibpqWriter(cursor, flush_policy=flush_policy)
 
         self.writer = writer
         self._write = writer.write
@@ -113,6 +133,42 @@ class Copy(BaseCopy["Connection[Any]"]):
         """
         return self.connection.wait(self._read_row_gen())
 
+    def copy_to_file(self, file: IO[bytes] | int) -> None:
+        """
+        Write the data of a :sql:`COPY TO` operation to a file.
+
+        `!file` can be a file object open in binary mode or a file descriptor.
+        On a file descriptor, several blocks of data are written at once,
+        using :py:func:`os.writev` where available. In async code, the writes
+        to a file descriptor run in a worker thread, whereas a file object is
+        written to in the event loop.
+        """
+        self._check_direction(COPY_OUT)
+        if not isinstance(file, int):
+            while data := self.read():
+                file.write(data)
+            return
+
+        chunks: list[Buffer] = []
+        size = 0
+        while data := self.read():
+            chunks.append(data)
+            size += len(data)
+            if size >= self.formatter.buffer_size or len(chunks) >= IOV_MAX:
+                self._write_fd(file, chunks)
+                chunks = []
+                size = 0
+
+        self._write_fd(file, chunks)
+
+    def _write_fd(self, fd: int, chunks: list[Buffer]) -> None:
+        write_fd(fd, chunks)
+
+    def copy_to_path(self, path: str | PathLike[str]) -> None:
+        """Write the data of a :sql:`COPY TO` operation to a file by name."""
+        with open(path, "wb", buffering=0) as f:
+            self.copy_to_file(f.fileno())
+
     def write(self, buffer: Buffer | str) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -128,6 +184,76 @@ class Copy(BaseCopy["Connection[Any]"]):
         if data := self.formatter.write_row(row):
             self._write(data)
 
+    def write_rows(self, rows: Iterable[Sequence[Any]], batch_size: int = 1000) -> None:
+        """
+        Write many records to a table after a :sql:`COPY FROM` operation.
+
+        The records are converted in batches of `!batch_size` records. In async
+        code, the conversion runs in a worker thread while the data of the
+        previous batch is written, so that the event loop is not blocked.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        it = iter(rows)
+        pending: list[Buffer] = []
+        while batch := list(islice(it, batch_size)):
+            for data in pending:
+                self._write(data)
+            pending = self._format_rows(batch)
+
+        for data in pending:
+            self._write(data)
+
+    def write_columns(self, columns: Sequence[Any]) -> None:
+        """
+        Write records to a table after a :sql:`COPY FROM` operation.
+
+        Every item in `!columns` is a NumPy array, or another object exposing
+        the buffer protocol, containing the values of a column. All the
+        columns must have the same length.
+        """
+        for data in self.formatter.write_columns(columns):
+            self._write(data)
+
+    def copy_from_file(
+        self, file: IO[bytes] | int, chunk_size: int = MAX_BUFFER_SIZE
+    ) -> None:
+        """
+        Write the data of a file to a table after a :sql:`COPY FROM` operation.
+
+        `!file` can be a file object or a file descriptor; its content must be
+        in the format of the :sql:`COPY` operation. The data is read in blocks
+        of `!chunk_size` bytes, using the same buffer for every block where
+        possible.
+        """
+        self._check_direction(COPY_IN)
+        if isinstance(file, int):
+            with open(file, "rb", buffering=0, closefd=False) as f:
+                self.copy_from_file(f, chunk_size)
+            return
+
+        if not (readinto := getattr(file, "readinto", None)):
+            while data := file.read(chunk_size):
+                self.write(data)
+            return
+
+        # The libpq copies the data we pass it, so the buffer can be reused
+        # unless the writer keeps a reference to it, e.g. to queue it.
+        reuse = isinstance(self.writer, LibpqWriter) and (
+            not isinstance(self.writer, QueuedLibpqWriter)
+        )
+        buffer = bytearray(chunk_size)
+        while nbytes := readinto(buffer):
+            self.write(memoryview(buffer)[:nbytes])
+            if not reuse:
+                buffer = bytearray(chunk_size)
+
+    def copy_from_path(self, path: str | PathLike[str]) -> None:
+        """Write the data of a file, by name, to a table after a :sql:`COPY FROM`."""
+        with open(path, "rb", buffering=0) as f:
+            self.copy_from_file(f)
+
     def finish(self, exc: BaseException | None) -> None:
         """Terminate the copy operation and free the resources allocated.
 
@@ -178,27 +304,31 @@ class Writer(ABC):
 class LibpqWriter(Writer):
     """
     An `Writer` to write copy data to a Postgres database.
+
+    :param flush_policy: when to flush the data written to the connection, as
+        in `Copy`.
     """
 
     __module__ = "psycopg.copy"
 
-    def __init__(self, cursor: Cursor[Any]):
+    def __init__(self, cursor: Cursor[Any], *, flush_policy: FlushPolicy | None = None):
         self.cursor = cursor
         self.connection = cursor.connection
         self._pgconn = self.connection.pgconn
+        self._flush = flush_from_policy(flush_policy)
 
     def write(self, data: Buffer) -> None:
         if len(data) <= MAX_BUFFER_SIZE:
             # Most used path: we don't need to split the buffer in smaller
             # bits, so don't make a copy.
-            self.connection.wait(copy_to(self._pgconn, data, flush=PREFER_FLUSH))
+            self.connection.wait(copy_to(self._pgconn, data, flush=self._flush))
         else:
             # Copy a buffer too large in chunks to avoid causing a memory
             # error in the libpq, which may cause an infinite loop (#255).
             for i in range(0, len(data), MAX_BUFFER_SIZE):
                 self.connection.wait(
                     copy_to(
-                        self._pgconn, data[i : i + MAX_BUFFER_SIZE], flush=PREFER_FLUSH
+                        self._pgconn, data[i : i + MAX_BUFFER_SIZE], flush=self._flush
                     )
                 )
 
@@ -229,14 +359,26 @@ class QueuedLibpqWriter(LibpqWriter):
     `write()` returns immediately, so that the main thread can be CPU-bound
     formatting messages, while a worker thread can be IO-bound waiting to write
     on the connection.
+
+    :param queue_size: the number of buffers that can be queued before
+        `!write()` blocks.
     """
 
     __module__ = "psycopg.copy"
 
-    def __init__(self, cursor: Cursor[Any]):
-        super().__init__(cursor)
+    def __init__(
+        self,
+        cursor: Cursor[Any],
+        *,
+        queue_size: int = QUEUE_SIZE,
+        flush_policy: FlushPolicy | None = None,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        super().__init__(cursor, flush_policy=flush_policy)
 
-        self._queue: Queue[Buffer] = Queue(maxsize=QUEUE_SIZE)
+        self._queue: Queue[Buffer] = Queue(maxsize=queue_size)
         self._worker: Worker | None = None
         self._worker_error: BaseException | None = None
 
@@ -250,7 +392,7 @@ class QueuedLibpqWriter(LibpqWriter):
         """
         try:
             while data := self._queue.get():
-                self.connection.wait(copy_to(self._pgconn, data, flush=PREFER_FLUSH))
+                self.connection.wait(copy_to(self._pgconn, data, flush=self._flush))
         except BaseException as ex:
             # Propagate the error to the main thread.
             self._worker_error = ex
@@ -8,17 +8,24 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
-from collections.abc import AsyncIterator, Sequence
+from typing import IO, TYPE_CHECKING, Any
+from itertools import islice
+from collections.abc import AsyncIterator, Iterable, Sequence
 
 from . import errors as e
 from . import pq
 from ._compat import Self
 from ._acompat import AQueue, AWorker, agather, aspawn
-from ._copy_base import MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE, BaseCopy
+from ._copy_base import BUFFER_SIZE, IOV_MAX, MAX_BUFFER_SIZE, QUEUE_SIZE, BaseCopy
+from ._copy_base import FlushPolicy, check_copy_params, flush_from_policy, write_fd
 from .generators import copy_end, copy_to
 
+if True:  # ASYNC
+    import asyncio
+
 if TYPE_CHECKING:
+    from os import PathLike
+
     from .abc import Buffer
     from .cursor_async import AsyncCursor
     from .connection_async import AsyncConnection  # noqa: F401
@@ -36,6 +43,13 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
     :param binary: if `!True`, write binary format.
     :param writer: the object to write to destination. If not specified, write
         to the `!cursor` connection.
+    :param buffer_size: the size of the data accumulated by `write_row()`
+        before passing it to the writer.
+    :param queue_size: if specified, write to the `!cursor` connection using
+        an `~psycopg.copy.AsyncQueuedLibpqWriter` with a queue of this size.
+    :param flush_policy: when to flush the data written to the `!cursor`
+        connection: ``"always"``, ``"never"`` (leaving the choice to the
+        libpq), or ``"auto"`` to choose according to the platform.
 
     Choosing `!binary` is not necessary if the cursor has executed a
     :sql:`COPY` operation, because the operation result describes the format
@@ -54,10 +68,19 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         *,
         binary: bool | None = None,
         writer: AsyncWriter | None = None,
+        buffer_size: int = BUFFER_SIZE,
+        queue_size: int | None = None,
+        flush_policy: FlushPolicy | None = None,
     ):
-        super().__init__(cursor, binary=binary)
+        check_copy_params(writer, buffer_size, queue_size, flush_policy)
+        super().__init__(cursor, binary=binary, buffer_size=buffer_size)
         if not writer:
-            writer = AsyncLibpqWriter(cursor)
+            if queue_size is not None:
+                writer = AsyncQueuedLibpqWriter(
+                    cursor, queue_size=queue_size, flush_policy=flush_policy
+                )
+            else:
+                writer = AsyncLibpqWriter(cursor, flush_policy=flush_policy)
 
         self.writer = writer
         self._write = writer.write
@@ -110,6 +133,45 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         """
         return await self.connection.wait(self._read_row_gen())
 
+    async def copy_to_file(self, file: IO[bytes] | int) -> None:
+        """
+        Write the data of a :sql:`COPY TO` operation to a file.
+
+        `!file` can be a file object open in binary mode or a file descriptor.
+        On a file descriptor, several blocks of data are written at once,
+        using :py:func:`os.writev` where available. In async code, the writes
+        to a file descriptor run in a worker thread, whereas a file object is
+        written to in the event loop.
+        """
+        self._check_direction(COPY_OUT)
+        if not isinstance(file, int):
+            while data := (await self.read()):
+                file.write(data)
+            return
+
+        chunks: list[Buffer] = []
+        size = 0
+        while data := (await self.read()):
+            chunks.append(data)
+            size += len(data)
+            if size >= self.formatter.buffer_size or len(chunks) >= IOV_MAX:
+                await self._write_fd(file, chunks)
+                chunks = []
+                size = 0
+
+        await self._write_fd(file, chunks)
+
+    async def _write_fd(self, fd: int, chunks: list[Buffer]) -> None:
+        if True:  # ASYNC
+            await asyncio.to_thread(write_fd, fd, chunks)
+        else:
+            write_fd(fd, chunks)
+
+    async def copy_to_path(self, path: str | PathLike[str]) -> None:
+        """Write the data of a :sql:`COPY TO` operation to a file by name."""
+        with open(path, "wb", buffering=0) as f:
+            await self.copy_to_file(f.fileno())
+
     async def write(self, buffer: Buffer | str) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -125,6 +187,89 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         if data := self.formatter.write_row(row):
             await self._write(data)
 
+    async def write_rows(
+        self, rows: Iterable[Sequence[Any]], batch_size: int = 1000
+    ) -> None:
+        """
+        Write many records to a table after a :sql:`COPY FROM` operation.
+
+        The records are converted in batches of `!batch_size` records. In async
+        code, the conversion runs in a worker thread while the data of the
+        previous batch is written, so that the event loop is not blocked.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        it = iter(rows)
+        pending: list[Buffer] = []
+        while batch := list(islice(it, batch_size)):
+            if True:  # ASYNC
+                task = asyncio.ensure_future(
+                    asyncio.to_thread(self._format_rows, batch)
+                )
+                try:
+                    for data in pending:
+                        await self._write(data)
+                finally:
+                    # Don't leave the thread using the formatter behind.
+                    pending = await task
+            else:
+                for data in pending:
+                    self._write(data)
+                pending = self._format_rows(batch)
+
+        for data in pending:
+            await self._write(data)
+
+    async def write_columns(self, columns: Sequence[Any]) -> None:
+        """
+        Write records to a table after a :sql:`COPY FROM` operation.
+
+        Every item in `!columns` is a NumPy array, or another object exposing
+        the buffer protocol, containing the values of a column. All the
+        columns must have the same length.
+        """
+        for data in self.formatter.write_columns(columns):
+            await self._write(data)
+
+    async def copy_from_file(
+        self, file: IO[bytes] | int, chunk_size: int = MAX_BUFFER_SIZE
+    ) -> None:
+        """
+        Write the data of a file to a table after a :sql:`COPY FROM` operation.
+
+        `!file` can be a file object or a file descriptor; its content must be
+        in the format of the :sql:`COPY` operation. The data is read in blocks
+        of `!chunk_size` bytes, using the same buffer for every block where
+        possible.
+        """
+        self._check_direction(COPY_IN)
+        if isinstance(file, int):
+            with open(file, "rb", buffering=0, closefd=False) as f:
+                await self.copy_from_file(f, chunk_size)
+            return
+
+        if not (readinto := getattr(file, "readinto", None)):
+            while data := file.read(chunk_size):
+                await self.write(data)
+            return
+
+        # The libpq copies the data we pass it, so the buffer can be reused
+        # unless the writer keeps a reference to it, e.g. to queue it.
+        reuse = isinstance(self.writer, AsyncLibpqWriter) and not isinstance(
+            self.writer, AsyncQueuedLibpqWriter
+        )
+        buffer = bytearray(chunk_size)
+        while nbytes := readinto(buffer):
+            await self.write(memoryview(buffer)[:nbytes])
+            if not reuse:
+                buffer = bytearray(chunk_size)
+
+    async def copy_from_path(self, path: str | PathLike[str]) -> None:
+        """Write the data of a file, by name, to a table after a :sql:`COPY FROM`."""
+        with open(path, "rb", buffering=0) as f:
+            await self.copy_from_file(f)
+
     async def finish(self, exc: BaseException | None) -> None:
         """Terminate the copy operation and free the resources allocated.
 
@@ -177,27 +322,33 @@ class AsyncWriter(ABC):
 class AsyncLibpqWriter(AsyncWriter):
     """
     An `AsyncWriter` to write copy data to a Postgres database.
+
+    :param flush_policy: when to flush the data written to the connection, as
+        in `AsyncCopy`.
     """
 
     __module__ = "psycopg.copy"
 
-    def __init__(self, cursor: AsyncCursor[Any]):
+    def __init__(
+        self, cursor: AsyncCursor[Any], *, flush_policy: FlushPolicy | None = None
+    ):
         self.cursor = cursor
         self.connection = cursor.connection
         self._pgconn = self.connection.pgconn
+        self._flush = flush_from_policy(flush_policy)
 
     async def write(self, data: Buffer) -> None:
         if len(data) <= MAX_BUFFER_SIZE:
             # Most used path: we don't need to split the buffer in smaller
             # bits, so don't make a copy.
-            await self.connection.wait(copy_to(self._pgconn, data, flush=PREFER_FLUSH))
+            await self.connection.wait(copy_to(self._pgconn, data, flush=self._flush))
         else:
             # Copy a buffer too large in chunks to avoid causing a memory
             # error in the libpq, which may cause an infinite loop (#255).
             for i in range(0, len(data), MAX_BUFFER_SIZE):
                 await self.connection.wait(
                     copy_to(
-                        self._pgconn, data[i : i + MAX_BUFFER_SIZE], flush=PREFER_FLUSH
+                        self._pgconn, data[i : i + MAX_BUFFER_SIZE], flush=self._flush
                     )
                 )
 
@@ -228,14 +379,26 @@ class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
     `write()` returns immediately, so that the main thread can be CPU-bound
     formatting messages, while a worker thread can be IO-bound waiting to write
     on the connection.
+
+    :param queue_size: the number of buffers that can be queued before
+        `!write()` blocks.
     """
 
     __module__ = "psycopg.copy"
 
-    def __init__(self, cursor: AsyncCursor[Any]):
-        super().__init__(cursor)
+    def __init__(
+        self,
+        cursor: AsyncCursor[Any],
+        *,
+        queue_size: int = QUEUE_SIZE,
+        flush_policy: FlushPolicy | None = None,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        super().__init__(cursor, flush_policy=flush_policy)
 
-        self._queue: AQueue[Buffer] = AQueue(maxsize=QUEUE_SIZE)
+        self._queue: AQueue[Buffer] = AQueue(maxsize=queue_size)
         self._worker: AWorker | None = None
         self._worker_error: BaseException | None = None
 
@@ -250,7 +413,7 @@ class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
         try:
             while data := (await self._queue.get()):
                 await self.connection.wait(
-                    copy_to(self._pgconn, data, flush=PREFER_FLUSH)
+                    copy_to(self._pgconn, data, flush=self._flush)
                 )
         except BaseException as ex:
             # Propagate the error to the main thread.
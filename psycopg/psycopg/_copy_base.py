@@ -6,12 +6,13 @@ psycopg copy support
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 import struct
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic
-from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias
+from collections.abc import Iterator, Sequence
 
 from . import adapt
 from . import errors as e
@@ -20,6 +21,7 @@ from .abc import Buffer, ConnectionType, PQGen, Transformer
 from .pq.misc import connection_summary
 from ._cmodule import _psycopg
 from .generators import copy_from
+from .types.numpy import dump_arrays
 
 if TYPE_CHECKING:
     from ._cursor_base import BaseCursor
@@ -35,7 +37,8 @@ COPY_OUT = pq.ExecStatus.COPY_OUT
 
 # Size of data to accumulate before sending it down the network. We fill a
 # buffer this size field by field, and when it passes the threshold size
-# we ship it, so it may end up being bigger than this.
+# we ship it, so it may end up being bigger than this. Default for the Copy
+# buffer_size parameter.
 BUFFER_SIZE = 32 * 1024
 
 # Maximum data size we want to queue to send to the libpq copy. Sending a
@@ -48,13 +51,21 @@ MAX_BUFFER_SIZE = 4 * BUFFER_SIZE
 # in the libpq memory management and data sending.
 
 # Max size of the write queue of buffers. More than that copy will block
-# Each buffer should be around BUFFER_SIZE size.
+# Each buffer should be around BUFFER_SIZE size. Default for the queue_size
+# parameter of the queued writers.
 QUEUE_SIZE = 1024
 
 # On certain systems, memmove seems particularly slow and flushing often is
 # more performing than accumulating a larger buffer. See #746 for details.
 PREFER_FLUSH = sys.platform == "darwin"
 
+# Max number of buffers to write to a file descriptor with a single call.
+IOV_MAX = 1024
+
+# When to flush the data sent to the libpq: after every buffer ("always"),
+# only when the libpq decides to ("never"), or according to the platform.
+FlushPolicy: TypeAlias = Literal["auto", "always", "never"]
+
 
 class BaseCopy(Generic[ConnectionType]):
     """
@@ -74,7 +85,11 @@ class BaseCopy(Generic[ConnectionType]):
     formatter: Formatter
 
     def __init__(
-        self, cursor: BaseCursor[ConnectionType, Any], *, binary: bool | None = None
+        self,
+        cursor: BaseCursor[ConnectionType, Any],
+        *,
+        binary: bool | None = None,
+        buffer_size: int = BUFFER_SIZE,
     ):
         self.cursor = cursor
         self.connection = cursor.connection
@@ -95,9 +110,11 @@ class BaseCopy(Generic[ConnectionType]):
 
         tx: Transformer = getattr(cursor, "_tx", None) or adapt.Transformer(cursor)
         if binary:
-            self.formatter = BinaryFormatter(tx)
+            self.formatter = BinaryFormatter(tx, buffer_size=buffer_size)
         else:
-            self.formatter = TextFormatter(tx, encoding=self._pgconn._encoding)
+            self.formatter = TextFormatter(
+                tx, encoding=self._pgconn._encoding, buffer_size=buffer_size
+            )
 
         self._finished = False
 
@@ -137,6 +154,15 @@ class BaseCopy(Generic[ConnectionType]):
         else:
             self.formatter.transformer.set_loader_types(oids, self.formatter.format)
 
+    def _format_rows(self, rows: Sequence[Sequence[Any]]) -> list[Buffer]:
+        """Convert records to copy data, returning the buffers ready to write."""
+        return [data for row in rows if (data := self.formatter.write_row(row))]
+
+    def _check_direction(self, direction: pq.ExecStatus) -> None:
+        if self._direction != direction:
+            op = "COPY FROM" if direction == COPY_IN else "COPY TO"
+            raise e.ProgrammingError(f"this operation is only valid in a {op}")
+
     # High level copy protocol generators (state change of the Copy object)
 
     def _read_gen(self) -> PQGen[Buffer]:
@@ -178,6 +204,65 @@ class BaseCopy(Generic[ConnectionType]):
             pass
 
 
+def write_fd(fd: int, chunks: list[Buffer]) -> None:
+    """
+    Write a list of buffers to a file descriptor, retrying on partial writes.
+
+    Use :py:func:`os.writev` if available, to avoid concatenating the buffers.
+    """
+    while chunks:
+        if _writev:
+            nbytes = _writev(fd, chunks)
+        else:
+            nbytes = os.write(fd, b"".join(chunks))
+
+        # Drop the buffers written, keep what is left of a partial one.
+        for i, chunk in enumerate(chunks):
+            if nbytes < len(chunk):
+                chunks = [memoryview(chunk)[nbytes:], *chunks[i + 1 :]]
+                break
+            nbytes -= len(chunk)
+        else:
+            break
+
+
+_writev = getattr(os, "writev", None)
+
+
+def flush_from_policy(policy: FlushPolicy | None) -> bool:
+    """Return `!True` if the data written to the libpq should be flushed."""
+    if policy is None or policy == "auto":
+        return PREFER_FLUSH
+    elif policy == "always":
+        return True
+    elif policy == "never":
+        return False
+    else:
+        raise ValueError(
+            f"bad flush_policy: {policy!r}; it should be 'auto', 'always', or 'never'"
+        )
+
+
+def check_copy_params(
+    writer: object,
+    buffer_size: int,
+    queue_size: int | None,
+    flush_policy: FlushPolicy | None,
+) -> None:
+    """
+    Validate the parameters of a copy operation.
+
+    Raise an exception before the operation is started on the server.
+    """
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be at least 1")
+    if queue_size is not None and queue_size < 1:
+        raise ValueError("queue_size must be at least 1")
+    flush_from_policy(flush_policy)
+    if writer and (queue_size is not None or flush_policy is not None):
+        raise TypeError("'queue_size' and 'flush_policy' can't be used with 'writer'")
+
+
 class Formatter(ABC):
     """
     A class which understand a copy format (text, binary).
@@ -185,8 +270,9 @@ class Formatter(ABC):
 
     format: pq.Format
 
-    def __init__(self, transformer: Transformer):
+    def __init__(self, transformer: Transformer, *, buffer_size: int = BUFFER_SIZE):
         self.transformer = transformer
+        self.buffer_size = buffer_size
         self._write_buffer = bytearray()
         self._row_mode = False  # true if the user is using write_row()
 
@@ -199,6 +285,9 @@ class Formatter(ABC):
     @abstractmethod
     def write_row(self, row: Sequence[Any]) -> Buffer: ...
 
+    @abstractmethod
+    def write_columns(self, columns: Sequence[Any]) -> Iterator[Buffer]: ...
+
     @abstractmethod
     def end(self) -> Buffer: ...
 
@@ -206,8 +295,14 @@ class Formatter(ABC):
 class TextFormatter(Formatter):
     format = TEXT
 
-    def __init__(self, transformer: Transformer, encoding: str = "utf-8"):
-        super().__init__(transformer)
+    def __init__(
+        self,
+        transformer: Transformer,
+        encoding: str = "utf-8",
+        *,
+        buffer_size: int = BUFFER_SIZE,
+    ):
+        super().__init__(transformer, buffer_size=buffer_size)
         self._encoding = encoding
 
     def parse_row(self, data: Buffer) -> tuple[Any, ...] | None:
@@ -228,12 +323,49 @@ class TextFormatter(Formatter):
         self._row_mode = True
 
         format_row_text(row, self.transformer, self._write_buffer)
-        if len(self._write_buffer) > BUFFER_SIZE:
+        if len(self._write_buffer) > self.buffer_size:
             buffer, self._write_buffer = self._write_buffer, bytearray()
             return buffer
         else:
             return b""
 
+    def write_columns(self, columns: Sequence[Any]) -> Iterator[Buffer]:
+        self._row_mode = True
+
+        # No bulk conversion in text format: convert the arrays to Python
+        # objects (masked values become None) and write them row by row.
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "writing columns requires the package 'numpy' to be installed"
+            ) from None
+
+        def to_list(col: Any) -> list[Any]:
+            # tolist() returns integers for time units finer than us.
+            if col.dtype.kind in "mM":
+                if np.datetime_data(col.dtype)[0] in ("ns", "ps", "fs", "as"):
+                    col = col.astype(f"{col.dtype.kind}8[us]")
+            rv: list[Any] = col.tolist()
+            return rv
+
+        arrays = [np.ma.asarray(col) for col in columns]
+        nrows = len(arrays[0]) if arrays else 0
+        if any(len(col) != nrows for col in arrays):
+            raise e.DataError("all the columns must have the same length")
+
+        # Convert the arrays in slices of about the buffer size, to avoid
+        # keeping all their values as Python objects at once.
+        width = sum(col.dtype.itemsize + 1 for col in arrays)
+        step = max(1, self.buffer_size // max(1, width))
+        for row0 in range(0, nrows, step):
+            lists = [to_list(col[row0 : row0 + step]) for col in arrays]
+            for row in zip(*lists):
+                format_row_text(row, self.transformer, self._write_buffer)
+                if len(self._write_buffer) > self.buffer_size:
+                    buffer, self._write_buffer = self._write_buffer, bytearray()
+                    yield buffer
+
     def end(self) -> Buffer:
         buffer, self._write_buffer = self._write_buffer, bytearray()
         return buffer
@@ -251,8 +383,8 @@ class TextFormatter(Formatter):
 class BinaryFormatter(Formatter):
     format = BINARY
 
-    def __init__(self, transformer: Transformer):
-        super().__init__(transformer)
+    def __init__(self, transformer: Transformer, *, buffer_size: int = BUFFER_SIZE):
+        super().__init__(transformer, buffer_size=buffer_size)
         self._signature_sent = False
 
     def parse_row(self, data: Buffer) -> tuple[Any, ...] | None:
@@ -286,12 +418,26 @@ class BinaryFormatter(Formatter):
             self._signature_sent = True
 
         format_row_binary(row, self.transformer, self._write_buffer)
-        if len(self._write_buffer) > BUFFER_SIZE:
+        if len(self._write_buffer) > self.buffer_size:
             buffer, self._write_buffer = self._write_buffer, bytearray()
             return buffer
         else:
             return b""
 
+    def write_columns(self, columns: Sequence[Any]) -> Iterator[Buffer]:
+        self._row_mode = True
+
+        if not self._signature_sent:
+            self._write_buffer += _binary_signature
+            self._signature_sent = True
+
+        types = self.transformer.types
+        for data in dump_arrays(columns, types, MAX_BUFFER_SIZE):
+            self._write_buffer += data
+            if len(self._write_buffer) > self.buffer_size:
+                buffer, self._write_buffer = self._write_buffer, bytearray()
+                yield buffer
+
     def end(self) -> Buffer:
         # If we have sent no data we need to send the signature
         # and the trailer
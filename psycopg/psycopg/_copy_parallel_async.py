@@ -0,0 +1,322 @@
+"""
+Objects to load data with COPY over several connections (async version).
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TypeAlias
+from collections.abc import Sequence
+
+from . import errors as e
+from . import pq
+from ._compat import Self
+from ._acompat import AQueue, AWorker, agather, aspawn
+
+if TYPE_CHECKING:
+    from .abc import Buffer, Params, Query
+    from ._copy_async import AsyncCopy
+    from .connection_async import AsyncConnection
+
+logger = logging.getLogger("psycopg")
+
+IDLE = pq.TransactionStatus.IDLE
+BINARY = pq.Format.BINARY
+
+# A block of data to write: a batch of records or a buffer of copy data.
+_Item: TypeAlias = "list[Sequence[Any]] | Buffer | str"
+
+
+class AsyncParallelCopy:
+    """
+    Load data with a :sql:`COPY FROM` operation run on several connections.
+
+    :param connections: the connections to use, one :sql:`COPY` for each of
+        them. They must be idle and not in autocommit mode.
+    :param statement: the :sql:`COPY FROM STDIN` statement to execute.
+    :param params: the parameters of the statement, if any.
+    :param types: the types of the columns copied, as in `Copy.set_types()`.
+        Required for binary copy.
+    :param batch_size: the number of records sent to a connection at once by
+        `write_row()`.
+    :param queue_size: the number of blocks of data waiting to be written
+        before `!write()` and `!write_row()` block.
+    :param tpc: if `!True`, use a two-phase commit to commit the data of all
+        the connections atomically. Otherwise the connections are committed
+        one at a time, so a failure while committing may leave only a part of
+        the data loaded.
+    """
+
+    __module__ = "psycopg.copy"
+
+    def __init__(
+        self,
+        connections: Sequence[AsyncConnection[Any]],
+        statement: Query,
+        params: Params | None = None,
+        *,
+        types: Sequence[int | str] | None = None,
+        batch_size: int = 1000,
+        queue_size: int = 16,
+        tpc: bool = False,
+    ):
+        if not connections:
+            raise ValueError("at least one connection is required")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self.connections = list(connections)
+        self.statement = statement
+        self.params = params
+        self.types = types
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.tpc = tpc
+
+        self.rowcount = -1
+        """The number of records copied by all the connections."""
+
+        self._batch: list[Sequence[Any]] = []
+        self._queue: AQueue[_Item | None]
+        self._ready: AQueue[int]
+        self._format: pq.Format | None = None
+        self._workers: list[AWorker] = []
+        self._rowcounts: list[int] = []
+        self._error: BaseException | None = None
+        self._started = False
+        self._finished = False
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__module__}.{self.__class__.__name__}"
+            f" ({len(self.connections)} connections) at 0x{id(self):x}>"
+        )
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.finish(exc_val)
+
+    async def start(self) -> None:
+        """Start the :sql:`COPY` operations on all the connections.
+
+        You shouldn't need to call this function yourself: it is usually called
+        by entering the `!with` block.
+        """
+        if self._started:
+            raise e.ProgrammingError("the parallel copy is already started")
+
+        for conn in self.connections:
+            if conn.autocommit:
+                raise e.ProgrammingError(
+                    "can't use a parallel copy with a connection in autocommit mode"
+                )
+            if conn.pgconn.transaction_status != IDLE:
+                raise e.ProgrammingError(
+                    "can't use a parallel copy with a connection in status"
+                    f" {pq.TransactionStatus(conn.pgconn.transaction_status).name}"
+                )
+
+        self._started = True
+        self._queue = AQueue(maxsize=self.queue_size)
+        self._ready = AQueue()
+        self._rowcounts = [-1] * len(self.connections)
+        if self.tpc:
+            import uuid  # slow to import: only do it if needed
+
+            # Every prepared transaction needs its own id.
+            gtrid = f"psycopg-copy-{uuid.uuid4().hex}"
+            try:
+                for i, conn in enumerate(self.connections):
+                    await conn.tpc_begin(f"{gtrid}-{i}")
+            except BaseException:
+                self._finished = True
+                await self._rollback()
+                raise
+
+        for i, conn in enumerate(self.connections):
+            self._workers.append(aspawn(self._worker, args=(i, conn)))
+
+        # Wait for the COPY to start on all the connections, in order to
+        # report a failure early, and to know the format of the data.
+        for _ in self._workers:
+            await self._ready.get()
+        if self._error:
+            await self.finish()  # raise the error
+
+    async def write(self, buffer: Buffer | str) -> None:
+        """
+        Write a block of data to the table.
+
+        The block must contain whole records in the format of the :sql:`COPY`
+        operation: it will be written by one of the connections. For this
+        reason, it is not possible to write blocks in binary format: use
+        `write_row()` instead.
+        """
+        if self._format == BINARY:
+            raise e.ProgrammingError(
+                "can't write blocks in binary format: use write_row() instead"
+            )
+        await self._flush_batch()
+        await self._put(buffer)
+
+    async def write_row(self, row: Sequence[Any]) -> None:
+        """Write a record to the table."""
+        self._batch.append(row)
+        if len(self._batch) >= self.batch_size:
+            await self._flush_batch()
+
+    async def finish(self, exc: BaseException | None = None) -> None:
+        """Terminate the copy operations and commit or roll back the data.
+
+        Commit the data written by all the connections if no error happened,
+        otherwise roll back all of them. Raise the error that happened in a
+        connection, if any.
+
+        Unless `!tpc` is used, the connections are committed one after the
+        other: if a commit fails, the data of the connections already
+        committed is not rolled back.
+
+        You shouldn't need to call this function yourself: it is usually called
+        by exit.
+        """
+        if self._finished or not self._started:
+            return
+
+        try:
+            if not exc and not self._error:
+                await self._flush_batch()
+        finally:
+            self._finished = True
+            # Stop the workers even if writing the last batch failed.
+            self._batch.clear()
+            for _ in self._workers:
+                await self._queue.put(None)
+            await agather(*self._workers)
+            self._workers.clear()
+
+        if exc or self._error:
+            await self._rollback()
+            if not exc and self._error:
+                raise self._error
+            return
+
+        await self._commit()
+        self.rowcount = sum(self._rowcounts)
+
+    async def _flush_batch(self) -> None:
+        if self._batch:
+            batch, self._batch = self._batch, []
+            await self._put(batch)
+
+    async def _put(self, item: _Item) -> None:
+        if not self._started or self._finished:
+            raise e.ProgrammingError("the parallel copy is not in progress")
+
+        # If a worker raised an exception, re-raise it to the caller.
+        if self._error:
+            raise self._error
+        await self._queue.put(item)
+
+    async def _worker(self, i: int, conn: AsyncConnection[Any]) -> None:
+        """Write the blocks of data received from the queue to a connection.
+
+        Notify the ready queue when the :sql:`COPY` is started, or has failed.
+        In case of error keep consuming the queue, until the terminator is
+        received, to not block the producer.
+        """
+        ready = done = False
+        try:
+            async with conn.cursor() as cur:
+                async with cur.copy(self.statement, self.params) as copy:
+                    if self.types:
+                        copy.set_types(self.types)
+                    self._format = copy.formatter.format
+                    ready = True
+                    self._ready.put_nowait(i)
+                    while (item := (await self._queue.get())) is not None:
+                        if not self._error:
+                            try:
+                                await self._write_item(copy, item)
+                            except BaseException as ex:
+                                self._set_error(ex)
+                    done = True
+                self._rowcounts[i] = cur.rowcount
+        except BaseException as ex:
+            self._set_error(ex)
+            if not ready:
+                self._ready.put_nowait(i)
+            if not done:
+                while (await self._queue.get()) is not None:
+                    pass
+
+    async def _write_item(self, copy: AsyncCopy, item: _Item) -> None:
+        if isinstance(item, list):
+            for row in item:
+                await copy.write_row(row)
+        else:
+            await copy.write(item)
+
+    def _set_error(self, ex: BaseException) -> None:
+        # Only the first error is interesting: the other connections may fail
+        # because of it.
+        if not self._error:
+            logger.warning("error in parallel copy %r: %s", self, ex)
+            self._error = ex
+
+    async def _commit(self) -> None:
+        if not self.tpc:
+            for conn in self.connections:
+                await conn.commit()
+            return
+
+        try:
+            for conn in self.connections:
+                await conn.tpc_prepare()
+        except BaseException:
+            await self._rollback()
+            raise
+
+        # Try to commit all the prepared transactions, even if one fails, and
+        # log the ones left, which can be committed later with their xid.
+        error: BaseException | None = None
+        pending: list[str] = []
+        for conn in self.connections:
+            xid = conn._tpc[0] if conn._tpc else None
+            try:
+                await conn.tpc_commit()
+            except Exception as ex:
+                pending.append(str(xid))
+                error = error or ex
+
+        if error:
+            logger.error(
+                "error committing parallel copy %r: %s; transactions left prepared: %s",
+                self,
+                error,
+                ", ".join(pending),
+            )
+            raise error
+
+    async def _rollback(self) -> None:
+        for conn in self.connections:
+            try:
+                if conn._tpc:
+                    await conn.tpc_rollback()
+                else:
+                    await conn.rollback()
+            except Exception as ex:
+                logger.warning("error rolling back parallel copy %r: %s", self, ex)
+                conn._tpc = None
@@ -6,9 +6,11 @@ Psycopg BaseCursor object
 
 from __future__ import annotations
 
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic, NoReturn
 from functools import partial
-from collections.abc import Iterable, Sequence
+from itertools import islice
+from collections.abc import Iterable, Iterator, Sequence
 
 from . import adapt
 from . import errors as e
@@ -18,7 +20,7 @@ from .rows import Row, RowMaker
 from ._column import Column
 from ._compat import Template
 from .pq.misc import connection_summary
-from ._queries import PostgresClientQuery, PostgresQuery
+from ._queries import MAX_QUERY_PARAMS, PostgresClientQuery, PostgresQuery
 from ._preparing import Prepare
 from .generators import execute, fetch, send
 from ._capabilities import capabilities
@@ -205,7 +207,12 @@ class BaseCursor(Generic[ConnectionType, Row]):
         yield from self._conn._prepared.maintain_gen(self._conn)
 
     def _executemany_gen_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        batch_size: int | None = None,
+        rows_per_insert: int | None = None,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines available.
@@ -220,17 +227,23 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
-        first = True
-        for params in params_seq:
-            if first:
-                pgq = self._convert_query(query, params)
+        last_query = None
+        items = self._executemany_items(query, params_seq, rows_per_insert)
+        for i, (query1, params, prepare) in enumerate(items, 1):
+            if query1 is not last_query:
+                pgq = self._convert_query(query1, params)
                 self._query = pgq
-                first = False
+                last_query = query1
             else:
                 pgq.dump(params)
 
-            yield from self._maybe_prepare_gen(pgq, prepare=True)
-            yield from pipeline._communicate_gen()
+            yield from self._maybe_prepare_gen(pgq, prepare=prepare)
+            if batch_size and not i % batch_size:
+                # Wait for the results of the batch before sending more
+                # queries, to limit the memory used by the commands in flight.
+                yield from pipeline._sync_gen()
+            else:
+                yield from pipeline._communicate_gen()
 
         self._last_query = query
 
@@ -240,7 +253,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
         yield from self._conn._prepared.maintain_gen(self._conn)
 
     def _executemany_gen_no_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        rows_per_insert: int | None = None,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines not available.
@@ -252,20 +269,66 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
-        first = True
-        for params in params_seq:
-            if first:
-                pgq = self._convert_query(query, params)
+        last_query = None
+        items = self._executemany_items(query, params_seq, rows_per_insert)
+        for query1, params, prepare in items:
+            if query1 is not last_query:
+                pgq = self._convert_query(query1, params)
                 self._query = pgq
-                first = False
+                last_query = query1
             else:
                 pgq.dump(params)
 
-            yield from self._maybe_prepare_gen(pgq, prepare=True)
+            yield from self._maybe_prepare_gen(pgq, prepare=prepare)
 
         self._last_query = query
         yield from self._conn._prepared.maintain_gen(self._conn)
 
+    def _executemany_items(
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        rows_per_insert: int | None = None,
+    ) -> Iterator[tuple[Query, Params, bool | None]]:
+        """
+        Return the statements to run to implement `executemany()`.
+
+        Return `(query, params, prepare)` tuples. If *rows_per_insert* is
+        specified and *query* is an ``INSERT ... VALUES`` statement, merge up
+        to *rows_per_insert* records in each statement.
+        """
+        values = None
+        if rows_per_insert:
+            values = self._query_cls(self._tx).split_insert_values(query)
+        if not values:
+            for params in params_seq:
+                yield (query, params, True)
+            return
+
+        # Don't exceed the number of parameters allowed by the protocol.
+        nrows = max(1, min(rows_per_insert or 1, MAX_QUERY_PARAMS // values.nparams))
+        batch_query = values.merge(nrows)
+        it = iter(params_seq)
+        while batch := list(islice(it, nrows)):
+            params1: list[Any] = []
+            for params in batch:
+                if not PostgresQuery.is_params_sequence(params):
+                    raise TypeError(
+                        "positional placeholders require a sequence of parameters"
+                    )
+                if len(params) != values.nparams:
+                    raise e.ProgrammingError(
+                        f"the query has {values.nparams} placeholders but"
+                        f" {len(params)} parameters were passed"
+                    )
+                params1.extend(params)
+
+            if len(batch) == nrows:
+                yield (batch_query, params1, True)
+            else:
+                # Don't prepare the statement inserting the last records.
+                yield (values.merge(len(batch)), params1, None)
+
     def _maybe_prepare_gen(
         self,
         pgq: PostgresQuery,
@@ -275,6 +338,9 @@ class BaseCursor(Generic[ConnectionType, Row]):
     ) -> PQGen[None]:
         # Check if the query is prepared or needs preparing
         prep, name = self._get_prepared(pgq, prepare)
+        # Time the query only if the prepare policy needs to know.
+        if timed := (prep is Prepare.NO and self._conn._prepared.policy.timed):
+            t0 = monotonic()
         if prep is Prepare.NO:
             # The query must be executed without preparing
             self._execute_send(pgq, binary=binary)
@@ -306,6 +372,9 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
         if key is not None:
             self._conn._prepared.validate(key, prep, name, results)
+        if timed:
+            # Let the prepare policy know how expensive the query is.
+            self._conn._prepared.record_time(pgq, monotonic() - t0)
 
         self._check_results(results)
         self._set_results(results)
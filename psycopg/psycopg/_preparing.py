@@ -8,12 +8,15 @@ from __future__ import annotations
 
 from enum import IntEnum, auto
 from typing import TYPE_CHECKING, Any, TypeAlias
+from itertools import islice
 from collections import OrderedDict, deque
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from . import pq
 from .abc import PQGen
 from ._queries import PostgresQuery
+from .generators import execute, fetch_many, send
+from ._capabilities import capabilities
 
 if TYPE_CHECKING:
     from .pq.abc import PGresult
@@ -22,6 +25,7 @@ if TYPE_CHECKING:
 Key: TypeAlias = tuple[bytes, tuple[int, ...]]
 
 COMMAND_OK = pq.ExecStatus.COMMAND_OK
+PIPELINE_SYNC = pq.ExecStatus.PIPELINE_SYNC
 TUPLES_OK = pq.ExecStatus.TUPLES_OK
 
 
@@ -31,6 +35,90 @@ class Prepare(IntEnum):
     SHOULD = auto()
 
 
+class PreparePolicy:
+    """
+    Decide which queries to prepare and which prepared statements to evict.
+
+    The default policy prepares a query after it has been executed
+    `~Connection.prepare_threshold` times and, if there are more than
+    `~Connection.prepared_max` prepared statements, deallocates the least
+    recently used.
+
+    The policy doesn't keep any state: the statistics about the queries are
+    kept by the connection, so the same policy object can be used by several
+    connections.
+    """
+
+    timed = False
+    """
+    If `!True`, the queries executed without preparing them are timed, to pass
+    the time spent to `should_prepare()`.
+    """
+
+    def should_prepare(
+        self, key: Key, count: int, elapsed: float, threshold: int
+    ) -> bool:
+        """
+        Return `!True` if a query should be prepared before being executed.
+
+        :param key: the query and the OIDs of its parameters types.
+        :param count: number of times the query was executed without
+            preparing it.
+        :param elapsed: total time, in seconds, spent in executing the query
+            without preparing it. Always 0 unless `timed` is `!True`.
+            Executions in pipeline mode are not timed.
+        :param threshold: value of the `~Connection.prepare_threshold` of the
+            connection.
+        """
+        return count >= threshold
+
+    def choose_evict(self, names: Mapping[Key, bytes], uses: Mapping[Key, int]) -> Key:
+        """
+        Return the key of the prepared statement to deallocate.
+
+        :param names: the statements currently prepared, from the least to the
+            most recently used.
+        :param uses: the number of times every prepared statement was used.
+        """
+        return next(iter(names))
+
+
+class LatencyPreparePolicy(PreparePolicy):
+    """
+    Prepare only the queries slow to execute, evict the least used statements.
+
+    A query is prepared after it has been executed
+    `~Connection.prepare_threshold` times only if its average execution time
+    is at least *min_time* seconds: cheap queries don't benefit much from
+    preparation and would keep the server memory busy.
+
+    The queries executed in pipeline mode are not timed, so they are never
+    prepared by this policy, unless requested with `!prepare=True`.
+
+    When there are too many prepared statements, evict the least frequently
+    used (the least recently used among the ones with the same number of uses)
+    among the least recently used half, so that a statement just prepared has
+    the time to be used before competing with the older ones.
+    """
+
+    timed = True
+
+    def __init__(self, min_time: float = 0.001):
+        self.min_time = min_time
+
+    def should_prepare(
+        self, key: Key, count: int, elapsed: float, threshold: int
+    ) -> bool:
+        return count >= threshold and elapsed >= self.min_time * count
+
+    def choose_evict(self, names: Mapping[Key, bytes], uses: Mapping[Key, int]) -> Key:
+        older = islice(names, (len(names) + 1) // 2)
+        return min(older, key=lambda key: uses.get(key, 0))
+
+
+_default_policy = PreparePolicy()
+
+
 class PrepareManager:
     # Number of times a query is executed before it is prepared.
     prepare_threshold: int | None = 5
@@ -39,12 +127,21 @@ class PrepareManager:
     prepared_max: int = 100
 
     def __init__(self) -> None:
+        # Object deciding what to prepare and what to evict.
+        self.policy: PreparePolicy = _default_policy
+
         # Map (query, types) to the number of times the query was seen.
         self._counts: OrderedDict[Key, int] = OrderedDict()
 
+        # Map (query, types) to the time spent executing it unprepared.
+        self._times: dict[Key, float] = {}
+
         # Map (query, types) to the name of the statement if  prepared.
         self._names: OrderedDict[Key, bytes] = OrderedDict()
 
+        # Map (query, types) to the number of times the statement was used.
+        self._uses: dict[Key, int] = {}
+
         # Counter to generate prepared statements names
         self._prepared_idx = 0
 
@@ -69,7 +166,9 @@ class PrepareManager:
             return Prepare.YES, name
 
         count = self._counts.get(key, 0)
-        if count >= self.prepare_threshold or prepare:
+        if prepare or self.policy.should_prepare(
+            key, count, self._times.get(key, 0.0), self.prepare_threshold
+        ):
             # The query has been executed enough times and needs to be prepared
             name = f"_pg3_{self._prepared_idx}".encode()
             self._prepared_idx += 1
@@ -112,10 +211,13 @@ class PrepareManager:
         resized, deallocate gradually.
         """
         if len(self._counts) > self.prepared_max:
-            self._counts.popitem(last=False)
+            key = self._counts.popitem(last=False)[0]
+            self._times.pop(key, None)
 
         if len(self._names) > self.prepared_max:
-            name = self._names.popitem(last=False)[1]
+            key = self.policy.choose_evict(self._names, self._uses)
+            name = self._names.pop(key)
+            self._uses.pop(key, None)
             self._to_flush.append(name)
 
     def maybe_add_to_cache(
@@ -133,7 +235,9 @@ class PrepareManager:
         if (key := self.key(query)) in self._counts:
             if prep is Prepare.SHOULD:
                 del self._counts[key]
+                self._times.pop(key, None)
                 self._names[key] = name
+                self._uses[key] = 1
             else:
                 self._counts[key] += 1
                 self._counts.move_to_end(key)
@@ -141,15 +245,22 @@ class PrepareManager:
 
         elif key in self._names:
             self._names.move_to_end(key)
+            self._uses[key] += 1
             return None
 
         else:
             if prep is Prepare.SHOULD:
                 self._names[key] = name
+                self._uses[key] = 1
             else:
                 self._counts[key] = 1
             return key
 
+    def record_time(self, query: PostgresQuery, elapsed: float) -> None:
+        """Record the time spent executing 'query' without preparing it."""
+        if (key := self.key(query)) in self._counts:
+            self._times[key] = self._times.get(key, 0.0) + elapsed
+
     def validate(
         self, key: Key, prep: Prepare, name: bytes, results: Sequence[PGresult]
     ) -> None:
@@ -162,7 +273,9 @@ class PrepareManager:
 
         if not self._check_results(results):
             self._names.pop(key, None)
+            self._uses.pop(key, None)
             self._counts.pop(key, None)
+            self._times.pop(key, None)
         else:
             self._rotate()
 
@@ -173,6 +286,8 @@ class PrepareManager:
         the server.
         """
         self._counts.clear()
+        self._times.clear()
+        self._uses.clear()
         if self._names:
             self._names.clear()
             self._to_flush.clear()
@@ -181,6 +296,80 @@ class PrepareManager:
         else:
             return False
 
+    @property
+    def prepared_num(self) -> int:
+        """The number of statements prepared in the session, also if deallocated.
+
+        It can be used to tell if new statements were prepared.
+        """
+        return self._prepared_idx
+
+    def prepared_keys(self) -> list[Key]:
+        """Return the keys of the statements currently prepared.
+
+        The keys are returned from the least to the most recently used.
+        """
+        return list(self._names)
+
+    def prewarm_gen(self, conn: BaseConnection[Any], keys: Sequence[Key]) -> PQGen[int]:
+        """
+        Generator to prepare the statements *keys* before they are executed.
+
+        The keys are expected from the least to the most recently used, as
+        returned by `prepared_keys()`. Use the pipeline mode, if available, to
+        prepare all the statements in a single round trip. Statements failing
+        to prepare (e.g. because referring to objects not existing in this
+        session) are just not added to the cache.
+
+        Return the number of statements prepared.
+        """
+        if self.prepare_threshold is None or not self.prepared_max:
+            return 0
+
+        todo: list[tuple[Key, bytes]] = []
+        for key in keys[-self.prepared_max :]:
+            if key in self._names:
+                continue
+            name = f"_pg3_{self._prepared_idx}".encode()
+            self._prepared_idx += 1
+            todo.append((key, name))
+
+        if not todo:
+            return 0
+
+        pgconn = conn.pgconn
+        results: list[PGresult] = []
+        if capabilities.has_pipeline():
+            # Sync after every statement, so that an error doesn't abort the
+            # preparation of the following ones.
+            pgconn.enter_pipeline_mode()
+            try:
+                for (query, types), name in todo:
+                    pgconn.send_prepare(name, query, param_types=types)
+                    pgconn.pipeline_sync()
+                yield from send(pgconn)
+                for _ in todo:
+                    results.extend((yield from fetch_many(pgconn)))
+                    (sync,) = yield from fetch_many(pgconn)
+                    assert sync.status == PIPELINE_SYNC
+            finally:
+                pgconn.exit_pipeline_mode()
+        else:
+            for (query, types), name in todo:
+                pgconn.send_prepare(name, query, param_types=types)
+                results.append((yield from execute(pgconn))[-1])
+
+        nprep = 0
+        for (key, name), result in zip(todo, results):
+            if result.status == COMMAND_OK:
+                self._counts.pop(key, None)
+                self._times.pop(key, None)
+                self._names[key] = name
+                self._uses[key] = 0
+                nprep += 1
+
+        return nprep
+
     def maintain_gen(self, conn: BaseConnection[Any]) -> PQGen[None]:
         """
         Generator to send the commands to perform periodic maintenance
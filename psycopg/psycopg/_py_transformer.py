@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, DefaultDict, TypeAlias
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
 from . import abc
 from . import errors as e
@@ -53,7 +53,7 @@ class Transformer(AdaptContext):
     __slots__ = """
         types formats
         _conn _adapters _pgresult _dumpers _loaders _encoding _none_oid
-        _oid_dumpers _oid_types _row_dumpers _row_loaders
+        _oid_dumpers _oid_types _row_dumpers _row_loaders _row_views
         """.split()
 
     types: tuple[int, ...] | None
@@ -93,6 +93,8 @@ class Transformer(AdaptContext):
         # sequence of load functions from value to python
         # the length of the result columns
         self._row_loaders: list[LoadFunc] = []
+        # for every column, true if the loader accepts a memoryview
+        self._row_views: list[bool] = []
 
         # mapping oid -> type sql representation
         self._oid_types: dict[int, bytes] = {}
@@ -142,6 +144,7 @@ class Transformer(AdaptContext):
             self._nfields = self._ntuples = 0
             if set_loaders:
                 self._row_loaders = []
+                self._row_views = []
             return
 
         self._ntuples = result.ntuples
@@ -152,13 +155,14 @@ class Transformer(AdaptContext):
 
         if not nf:
             self._row_loaders = []
+            self._row_views = []
             return
 
         fmt: pq.Format
         fmt = result.fformat(0) if format is None else format  # type: ignore
-        self._row_loaders = [
-            self.get_loader(result.ftype(i), fmt).load for i in range(nf)
-        ]
+        self._set_row_loaders(
+            [self.get_loader(result.ftype(i), fmt) for i in range(nf)]
+        )
 
     def set_dumper_types(self, types: Sequence[int], format: pq.Format) -> None:
         self._row_dumpers = [self.get_dumper_by_oid(oid, format) for oid in types]
@@ -166,7 +170,11 @@ class Transformer(AdaptContext):
         self.formats = [format] * len(types)
 
     def set_loader_types(self, types: Sequence[int], format: pq.Format) -> None:
-        self._row_loaders = [self.get_loader(oid, format).load for oid in types]
+        self._set_row_loaders([self.get_loader(oid, format) for oid in types])
+
+    def _set_row_loaders(self, loaders: list[abc.Loader]) -> None:
+        self._row_loaders = [loader.load for loader in loaders]
+        self._row_views = [getattr(loader, "zero_copy", False) for loader in loaders]
 
     def dump_sequence(
         self, params: Sequence[Any], formats: Sequence[PyFormat]
@@ -306,11 +314,12 @@ class Transformer(AdaptContext):
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
+        getters = self._get_value_funcs(res)
         records = []
         for row in range(row0, row1):
             record: list[Any] = [None] * self._nfields
             for col in range(self._nfields):
-                if (val := res.get_value(row, col)) is not None:
+                if (val := getters[col](row, col)) is not None:
                     record[col] = self._row_loaders[col](val)
             records.append(make_row(record))
 
@@ -325,13 +334,23 @@ class Transformer(AdaptContext):
                 f"row must be included between 0 and {self._ntuples}"
             )
 
+        getters = self._get_value_funcs(res)
         record: list[Any] = [None] * self._nfields
         for col in range(self._nfields):
-            if (val := res.get_value(row, col)) is not None:
+            if (val := getters[col](row, col)) is not None:
                 record[col] = self._row_loaders[col](val)
 
         return make_row(record)
 
+    def _get_value_funcs(
+        self, res: PGresult
+    ) -> list[Callable[[int, int], Buffer | None]]:
+        # Pass the loaders able to work on it a view on the result memory, if
+        # the libpq wrapper can provide one, the other ones a copy of the data.
+        return [
+            res.get_value_view if view else res.get_value for view in self._row_views
+        ]
+
     def load_sequence(self, record: Sequence[Buffer | None]) -> tuple[Any, ...]:
         if len(self._row_loaders) != len(record):
             raise e.ProgrammingError(
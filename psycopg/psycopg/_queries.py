@@ -7,8 +7,10 @@ Utility module to manipulate queries
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias, TypeGuard
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeGuard, TypeVar
 from functools import lru_cache
+from threading import Lock
+from collections import Counter
 from collections.abc import Callable, Mapping, Sequence
 
 from . import errors as e
@@ -19,10 +21,18 @@ from ._compat import Template
 from ._tstrings import TemplateProcessor
 
 if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
+
     from .abc import Transformer
 
 MAX_CACHED_STATEMENT_LENGTH = 4096
 MAX_CACHED_STATEMENT_PARAMS = 50
+MAX_CACHED_STATEMENTS = 128
+
+# Maximum number of parameters the Postgres protocol allows in a query
+MAX_QUERY_PARAMS = 65535
+
+T = TypeVar("T")
 
 
 class QueryPart(NamedTuple):
@@ -31,6 +41,21 @@ class QueryPart(NamedTuple):
     format: PyFormat
 
 
+class InsertValues(NamedTuple):
+    """
+    An ``INSERT ... VALUES (...)`` statement split around its values tuple.
+    """
+
+    prefix: bytes
+    row: bytes
+    suffix: bytes
+    nparams: int
+
+    def merge(self, nrows: int) -> bytes:
+        """Return the statement inserting *nrows* records at once."""
+        return self.prefix + b", ".join([self.row] * nrows) + self.suffix
+
+
 class PostgresQuery:
     """
     Helper to convert a Python query and parameters into Postgres format.
@@ -66,27 +91,14 @@ class PostgresQuery:
         if isinstance(query, Template):
             return self._convert_template(query, vars)
 
-        query = self._ensure_bytes(query)
-
         if vars is not None:
-            # Avoid caching queries extremely long or with a huge number of
-            # parameters. They are usually generated by ORMs and have poor
-            # cacheablility (e.g. INSERT ... VALUES (...), (...) with varying
-            # numbers of tuples.
-            # see https://github.com/psycopg/psycopg/discussions/628
-            if (
-                len(query) <= MAX_CACHED_STATEMENT_LENGTH
-                and len(vars) <= MAX_CACHED_STATEMENT_PARAMS
-            ):
-                f: _Query2Pg = _query2pg
-            else:
-                f = _query2pg_nocache
-
-            (self.query, self._want_formats, self._order, self._parts) = f(
-                query, self._tx.encoding
+            (self.query, self._want_formats, self._order, self._parts) = (
+                query_cache.convert(
+                    _query2pg_nocache, self._ensure_key(query), vars, self._tx
+                )
             )
         else:
-            self.query = query
+            self.query = self._ensure_bytes(query)
             self._want_formats = self._order = None
 
         self.dump(vars)
@@ -162,6 +174,29 @@ class PostgresQuery:
                     f" {', '.join(sorted(i for i in order or () if i not in vars))}"
                 )
 
+    def split_insert_values(self, query: Query) -> InsertValues | None:
+        """
+        Split an ``INSERT ... VALUES (...)`` statement around its values tuple.
+
+        Return `!None` if the query is not an insert of a single row with
+        positional placeholders, which can be extended to insert many rows.
+        """
+        if isinstance(query, Template):
+            return None
+        return _split_insert_values(self._ensure_bytes(query), self._tx.encoding)
+
+    def _ensure_key(self, query: QueryNoTemplate) -> str | bytes:
+        # Strings are used as they are as cache key: their hash is cached on
+        # the object and we avoid to encode them if the query is in cache.
+        # Non-ASCII strings are encoded, so that the length of the query
+        # checked by the cache is in bytes.
+        if isinstance(query, str):
+            return query if query.isascii() else query.encode(self._tx.encoding)
+        elif isinstance(query, sql.Composable):
+            return query.as_bytes(self._tx)
+        else:
+            return query
+
     def _ensure_bytes(self, query: QueryNoTemplate) -> bytes:
         if isinstance(query, str):
             return query.encode(self._tx.encoding)
@@ -189,12 +224,6 @@ class PostgresQuery:
             self.formats = None
 
 
-# The type of the _query2pg() and _query2pg_nocache() methods
-_Query2Pg: TypeAlias = Callable[
-    [bytes, str], "tuple[bytes, list[PyFormat], list[str] | None, list[QueryPart]]"
-]
-
-
 def _query2pg_nocache(
     query: bytes, encoding: str
 ) -> tuple[bytes, list[PyFormat], list[str] | None, list[QueryPart]]:
@@ -245,14 +274,6 @@ def _query2pg_nocache(
     return b"".join(chunks), formats, order, parts
 
 
-# Note: the cache size is 128 items, but someone has reported throwing ~12k
-# queries (of type `INSERT ... VALUES (...), (...)` with a varying amount of
-# records), and the resulting cache size is >100Mb. So, we will avoid to cache
-# large queries or queries with a large number of params. See
-# https://github.com/sqlalchemy/sqlalchemy/discussions/10270
-_query2pg = lru_cache(_query2pg_nocache)
-
-
 class PostgresClientQuery(PostgresQuery):
     """
     PostgresQuery subclass merging query and arguments client-side.
@@ -270,20 +291,12 @@ class PostgresClientQuery(PostgresQuery):
         if isinstance(query, Template):
             return self._convert_template(query, vars)
 
-        query = self._ensure_bytes(query)
-
         if vars is not None:
-            if (
-                len(query) <= MAX_CACHED_STATEMENT_LENGTH
-                and len(vars) <= MAX_CACHED_STATEMENT_PARAMS
-            ):
-                f: _Query2PgClient = _query2pg_client
-            else:
-                f = _query2pg_client_nocache
-
-            (self.template, self._order, self._parts) = f(query, self._tx.encoding)
+            (self.template, self._order, self._parts) = query_cache.convert(
+                _query2pg_client_nocache, self._ensure_key(query), vars, self._tx
+            )
         else:
-            self.query = query
+            self.query = self._ensure_bytes(query)
             self._order = None
 
         self.dump(vars)
@@ -315,11 +328,6 @@ class PostgresClientQuery(PostgresQuery):
         self.params = tp.params
 
 
-_Query2PgClient: TypeAlias = Callable[
-    [bytes, str], "tuple[bytes, list[str] | None, list[QueryPart]]"
-]
-
-
 def _query2pg_client_nocache(
     query: bytes, encoding: str
 ) -> tuple[bytes, list[str] | None, list[QueryPart]]:
@@ -357,7 +365,166 @@ def _query2pg_client_nocache(
     return b"".join(chunks), order, parts
 
 
-_query2pg_client = lru_cache(_query2pg_client_nocache)
+class QueryCache:
+    """
+    Cache of the queries converted from Python to PostgreSQL format.
+
+    Queries executed with parameters need parsing to convert the placeholders
+    to the PostgreSQL format. The result of the conversion is kept in a cache
+    shared by all the connections of the process, discarding the least
+    recently used queries if the cache is full.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MAX_CACHED_STATEMENTS,
+        max_query_length: int = MAX_CACHED_STATEMENT_LENGTH,
+        max_params: int = MAX_CACHED_STATEMENT_PARAMS,
+    ):
+        self._lock = Lock()
+        self._maxsize = maxsize
+
+        # The lru_cache wrapper of the conversion functions, keyed by function,
+        # query and encoding. It is replaced, with its counters, to resize or
+        # clear the cache.
+        self._cached: _lru_cache_wrapper[Any] | None = None
+
+        # Counters of the wrappers replaced, of the queries not cached and
+        # discarded by clear(); counters values at the last pop_stats().
+        self._stats = Counter[str]()
+        self._popped = Counter[str]()
+
+        # Someone has reported throwing ~12k queries (of type `INSERT ...
+        # VALUES (...), (...)` with a varying amount of records), and the
+        # resulting cache size is >100Mb. So, we will avoid to cache large
+        # queries or queries with a large number of params. See
+        # https://github.com/sqlalchemy/sqlalchemy/discussions/10270
+        self.max_query_length = max_query_length
+        self.max_params = max_params
+
+    @property
+    def maxsize(self) -> int:
+        """
+        The maximum number of queries to cache. 0 disables the cache.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("maxsize cannot be negative")
+        with self._lock:
+            self._maxsize = value
+            self._reset()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return current stats about the cache usage.
+        """
+        with self._lock:
+            stats = self._get_counters() - self._popped
+        rv = dict(stats)
+        rv.update(self._get_measures())
+        return rv
+
+    def pop_stats(self) -> dict[str, int]:
+        """
+        Return current stats about the cache usage.
+
+        After the call, all the counters are reset to zero.
+        """
+        with self._lock:
+            counters = self._get_counters()
+            stats, self._popped = counters - self._popped, counters
+        rv = dict(stats)
+        rv.update(self._get_measures())
+        return rv
+
+    def _get_measures(self) -> dict[str, int]:
+        size = f.cache_info().currsize if (f := self._cached) else 0
+        return {"size": size, "maxsize": self._maxsize}
+
+    def _get_counters(self) -> Counter[str]:
+        """
+        Return the counters since the cache creation.
+
+        Must be called with the lock held.
+        """
+        rv = self._stats.copy()
+        size = 0
+        if f := self._cached:
+            info = f.cache_info()
+            rv["hits"] += info.hits
+            rv["misses"] += info.misses
+            size = info.currsize
+
+        # All the queries added and no more in the cache were evicted, unless
+        # discarded by clear() or by resizing.
+        rv["evictions"] = rv["misses"] - size - rv.pop("discarded", 0)
+        return rv
+
+    def clear(self) -> None:
+        """
+        Discard all the queries in the cache.
+        """
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        """
+        Replace the cache wrapper, keeping its counters.
+
+        Must be called with the lock held.
+        """
+        if f := self._cached:
+            info = f.cache_info()
+            self._stats["hits"] += info.hits
+            self._stats["misses"] += info.misses
+            self._stats["discarded"] += info.currsize
+        self._cached = None
+
+    def convert(
+        self,
+        func: Callable[[bytes, str], T],
+        query: str | bytes,
+        vars: Params,
+        tx: Transformer,
+    ) -> T:
+        """
+        Return `!func(query, encoding)`, from the cache if possible.
+
+        *query* can be a `!str` only if ASCII, so that its length is the same
+        in bytes.
+        """
+        if not (
+            len(query) <= self.max_query_length
+            and len(vars) <= self.max_params
+            and self._maxsize
+        ):
+            with self._lock:
+                self._stats["uncached"] += 1
+            return func(_as_bytes(query, tx.encoding), tx.encoding)
+
+        if not (f := self._cached):
+            f = self._wrap()
+        return f(func, query, tx.encoding)  # type: ignore[no-any-return]
+
+    def _wrap(self) -> _lru_cache_wrapper[Any]:
+        with self._lock:
+            if not (rv := self._cached):
+                rv = self._cached = lru_cache(self._maxsize)(_convert)
+        return rv
+
+
+def _convert(func: Callable[[bytes, str], T], query: str | bytes, encoding: str) -> T:
+    return func(_as_bytes(query, encoding), encoding)
+
+
+def _as_bytes(query: str | bytes, encoding: str) -> bytes:
+    return query.encode(encoding) if isinstance(query, str) else query
+
+
+query_cache = QueryCache()
 
 
 _re_placeholder = re.compile(
@@ -454,6 +621,71 @@ _ph_to_fmt = {
     b"b": PyFormat.BINARY,
 }
 
+_fmt_to_ph = {fmt: b"%" + ph for ph, fmt in _ph_to_fmt.items()}
+
+_re_insert_values = re.compile(rb"(?is)^\s*insert\s.*\svalues\s*\($")
+_re_do_update = re.compile(rb"(?is)\bon\s+conflict\b.*\bdo\s+update\b")
+
+
+def _split_insert_values(query: bytes, encoding: str) -> InsertValues | None:
+    """
+    Find the values tuple of an ``INSERT`` statement.
+
+    The tuple must be the last part of the query containing placeholders and
+    must only contain placeholders and simple expressions: if quotes or
+    comments are found we give up rather than parsing SQL.
+
+    Give up on ``ON CONFLICT DO UPDATE`` statements too: a statement inserting
+    several records with the same key would fail, where executing a statement
+    per record succeeds.
+    """
+    try:
+        parts = _split_query(query, encoding, collapse_double_percent=False)
+    except e.ProgrammingError:
+        return None
+
+    if len(parts) < 2 or not isinstance(parts[0].item, int):
+        return None
+    if not _re_insert_values.match(parts[0].pre):
+        return None
+
+    chunks = [b"("]
+    depth = 1
+    for i in range(1, len(parts)):
+        chunks.append(_fmt_to_ph[parts[i - 1].format])
+        pre = parts[i].pre
+        if b"--" in pre or b"/*" in pre:
+            # comments: they might contain anything
+            return None
+        for pos, c in enumerate(pre):
+            if c == 0x28:  # (
+                depth += 1
+            elif c == 0x29:  # )
+                depth -= 1
+                if not depth:
+                    break
+            elif c in b"'\"$":
+                # strings or quoted identifiers: too complex
+                return None
+        else:
+            chunks.append(pre)
+            continue
+
+        if i != len(parts) - 1:
+            # The tuple is closed but there are more placeholders after it.
+            return None
+        if _re_do_update.search(suffix := pre[pos + 1 :]):
+            return None
+        chunks.append(pre[: pos + 1])
+        return InsertValues(
+            prefix=parts[0].pre[:-1],
+            row=b"".join(chunks),
+            suffix=suffix,
+            nparams=len(parts) - 1,
+        )
+
+    return None
+
 
 class PostgresRawQuery(PostgresQuery):
     def convert(self, query: Query, vars: Params | None) -> None:
@@ -464,6 +696,10 @@ class PostgresRawQuery(PostgresQuery):
         self._want_formats = self._order = None
         self.dump(vars)
 
+    def split_insert_values(self, query: Query) -> InsertValues | None:
+        # Raw queries placeholders are not parsed.
+        return None
+
     def dump(self, vars: Params | None) -> None:
         if vars is not None:
             if not PostgresQuery.is_params_sequence(vars):
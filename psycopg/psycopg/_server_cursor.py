@@ -10,6 +10,7 @@ psycopg server-side cursor (sync).
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, overload
+from weakref import ReferenceType, ref
 from collections.abc import Iterable
 
 from . import errors as e
@@ -17,6 +18,8 @@ from .abc import Params, Query
 from .rows import Row, RowFactory
 from .cursor import Cursor
 from ._compat import Self
+from ._acompat import Queue, Worker, gather, spawn
+from .types.numpy import load_arrays
 from ._server_cursor_base import ServerCursorMixin
 
 if TYPE_CHECKING:
@@ -25,7 +28,8 @@ if TYPE_CHECKING:
 
 class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
     __module__ = "psycopg"
-    __slots__ = ()
+    __slots__ = """_prefetcher _prefetch_requests _prefetched _prefetch_size
+        _prefetch_skip""".split()
 
     @overload
     def __init__(
@@ -62,10 +66,26 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         )
         ServerCursorMixin.__init__(self, name, scrollable, withhold)
 
+        # The worker fetching the next pages during iteration, the queues to
+        # request them and to receive them (None if the fetch was skipped),
+        # the number of records requested, and whether to skip the request.
+        self._prefetcher: Worker | None = None
+        self._prefetch_requests: Queue[int] = Queue()
+        self._prefetched: Queue[list[Row] | BaseException | None] = Queue()
+        self._prefetch_size = 0
+        self._prefetch_skip = False
+
+    def __del__(self) -> None:
+        # Stop the prefetch worker if an iteration was abandoned.
+        if getattr(self, "_prefetcher", None):
+            self._prefetch_requests.put_nowait(0)
+        super().__del__()
+
     def close(self) -> None:
         """
         Close the current cursor and free associated resources.
         """
+        self._stop_prefetch()
         with self._conn.lock:
             if self.closed:
                 return
@@ -91,6 +111,7 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
                 "server-side cursors not supported in pipeline mode"
             )
 
+        self._stop_prefetch()
         try:
             with self._conn.lock:
                 self._conn.wait(self._declare_gen(query, params, binary))
@@ -100,16 +121,24 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         return self
 
     def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = True
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = True,
+        batch_size: int | None = None,
+        rows_per_insert: int | None = None,
     ) -> None:
         """Method not implemented for server-side cursors."""
         raise e.NotSupportedError("executemany not supported on server-side cursors")
 
     def fetchone(self) -> Row | None:
-        with self._conn.lock:
-            recs = self._conn.wait(self._fetch_gen(1))
+        self._keep_prefetch()
+        if not (recs := self._pop_rows(1)):
+            with self._conn.lock:
+                recs = self._conn.wait(self._fetch_gen(1))
+            self._pos += len(recs)
         if recs:
-            self._pos += 1
             return recs[0]
         else:
             return None
@@ -117,30 +146,51 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
     def fetchmany(self, size: int = 0) -> list[Row]:
         if not size:
             size = self.arraysize
-        with self._conn.lock:
-            recs = self._conn.wait(self._fetch_gen(size))
-        self._pos += len(recs)
+        self._keep_prefetch()
+        if len(recs := self._pop_rows(size)) < size:
+            with self._conn.lock:
+                more = self._conn.wait(self._fetch_gen(size - len(recs)))
+            self._pos += len(more)
+            recs += more
         return recs
 
     def fetchall(self) -> list[Row]:
+        self._keep_prefetch()
+        recs = self._pop_rows(None)
         with self._conn.lock:
-            recs = self._conn.wait(self._fetch_gen(None))
-        self._pos += len(recs)
+            more = self._conn.wait(self._fetch_gen(None))
+        self._pos += len(more)
+        recs += more
         return recs
 
+    def fetch_arrays(self) -> list[Any]:
+        self._keep_prefetch()
+        if (rest := self._rows_left()) and not self._scrollable:
+            raise e.ProgrammingError(
+                "fetch_arrays() cannot return the records already fetched by"
+                " the iteration: the cursor is not scrollable"
+            )
+        with self._conn.lock:
+            if rest:
+                # Go back to return the records fetched and not consumed yet.
+                self._conn.wait(self._scroll_gen(-rest, "relative"))
+                self._iter_rows = None
+            res = self._conn.wait(self._fetch_result_gen(None))
+        self._pos += res.ntuples
+        return load_arrays(self._tx, 0, res.ntuples)
+
     def __iter__(self) -> Self:
         return self
 
     def __next__(self) -> Row:
         # Fetch a new page if we never fetched any, or we are at the end of
-        # a page of size itersize, meaning there is likely a following one.
+        # a full page, meaning there is likely a following one.
         if (
             self._iter_rows is None
-            or self._page_pos >= len(self._iter_rows) >= self.itersize
+            or self._page_pos >= len(self._iter_rows) >= self._page_size
         ):
-            with self._conn.lock:
-                self._iter_rows = self._conn.wait(self._fetch_gen(self.itersize))
-                self._page_pos += 0
+            self._iter_rows = self._fetch_page()
+            self._page_pos = 0
 
         if self._page_pos >= len(self._iter_rows):
             raise StopIteration("no more records to return")
@@ -150,9 +200,124 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         self._pos += 1
         return rec
 
+    def _fetch_page(self) -> list[Row]:
+        rows: list[Row] | None = None
+        if self._prefetch_size:
+            self._page_size, self._prefetch_size = (self._prefetch_size, 0)
+            if isinstance((res := self._prefetched.get()), BaseException):
+                raise res
+            rows = res
+        else:
+            self._page_size = self._next_page_size()
+
+        if rows is None:
+            with self._conn.lock:
+                rows = self._conn.wait(self._fetch_page_gen(self._page_size))
+
+        if len(rows) < self._page_size:
+            # This is the last page: there is nothing more to prefetch.
+            self._stop_prefetch()
+        elif self.prefetch:
+            # The page is full, there are likely more records: fetch them
+            # while the current page is consumed.
+            self._prefetch_size = self._next_page_size()
+            if not self._prefetcher:
+                args = (ref(self), self._prefetch_requests, self._prefetched)
+                self._prefetcher = spawn(self._prefetch_worker, args)
+            self._prefetch_requests.put_nowait(self._prefetch_size)
+
+        return rows
+
+    @staticmethod
+    def _prefetch_worker(
+        wself: ReferenceType[ServerCursor[Any]],
+        requests: Queue[int],
+        results: Queue[list[Any] | BaseException | None],
+    ) -> None:
+        """Fetch the pages of records requested during the iteration.
+
+        The function is designed to run as a task for the lifetime of the
+        iteration. Stop running if a request of 0 records is received. Only
+        hold a weak reference to the cursor, so that an iteration abandoned
+        doesn't keep it alive.
+        """
+        while num := requests.get():
+            if not (cur := wself()):
+                break
+            results.put_nowait(cur._prefetch(num))
+            del cur
+
+    def _prefetch(self, num: int) -> list[Row] | BaseException | None:
+        """Fetch a page of records for the prefetch worker.
+
+        Return `!None` if the fetch was skipped, the exception if it failed.
+        """
+        # Don't make other operations wait for the prefetch: if the page
+        # is no longer wanted, or the connection is busy, skip it and
+        # leave it to the iteration to fetch.
+        locked = self._conn.lock.acquire(blocking=False)
+        if not locked or self._prefetch_skip:
+            if locked:
+                self._conn.lock.release()
+            return None
+
+        try:
+            return self._conn.wait(self._fetch_page_gen(num))
+        except BaseException as ex:
+            # Propagate the error to the iteration.
+            return ex
+        finally:
+            self._conn.lock.release()
+
+    def _discard_prefetch(self) -> None:
+        """Discard the page requested to the prefetch worker, if any.
+
+        If the page is not being fetched yet, the worker skips fetching it.
+        """
+        if not self._prefetch_size:
+            return
+        self._prefetch_size = 0
+        self._prefetch_skip = True
+        try:
+            self._prefetched.get()
+        finally:
+            self._prefetch_skip = False
+
+    def _keep_prefetch(self) -> None:
+        """Stop waiting for the page requested to the prefetch worker, if any.
+
+        If the page was already fetched, keep its records to return them
+        first: the server cursor has moved past them.
+        """
+        if not (size := self._prefetch_size):
+            return
+        self._prefetch_size = 0
+        self._prefetch_skip = True
+        try:
+            res = self._prefetched.get()
+        finally:
+            self._prefetch_skip = False
+
+        if isinstance(res, BaseException):
+            raise res
+        if res is not None:
+            self._keep_page(res, size)
+
+    def _stop_prefetch(self) -> None:
+        """Discard the page being prefetched and stop the worker, if any."""
+        self._discard_prefetch()
+        if self._prefetcher:
+            self._prefetch_requests.put_nowait(0)
+            gather(self._prefetcher)
+            self._prefetcher = None
+
     def scroll(self, value: int, mode: str = "relative") -> None:
+        self._keep_prefetch()
+        # The server cursor is past the records fetched and not consumed yet.
+        move = value - self._rows_left() if mode == "relative" else value
         with self._conn.lock:
-            self._conn.wait(self._scroll_gen(value, mode))
+            self._conn.wait(self._scroll_gen(move, mode))
+        self._iter_rows = None
         # Postgres doesn't have a reliable way to report a cursor out of bound
         if mode == "relative":
             self._pos += value
@@ -7,12 +7,15 @@ psycopg server-side cursor (async).
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, overload
+from weakref import ReferenceType, ref
 from collections.abc import Iterable
 
 from . import errors as e
 from .abc import Params, Query
 from .rows import AsyncRowFactory, Row
 from ._compat import Self
+from ._acompat import AQueue, AWorker, agather, aspawn
+from .types.numpy import load_arrays
 from .cursor_async import AsyncCursor
 from ._server_cursor_base import ServerCursorMixin
 
@@ -24,7 +27,8 @@ class AsyncServerCursor(
     ServerCursorMixin["AsyncConnection[Any]", Row], AsyncCursor[Row]
 ):
     __module__ = "psycopg"
-    __slots__ = ()
+    __slots__ = """_prefetcher _prefetch_requests _prefetched _prefetch_size
+        _prefetch_skip""".split()
 
     @overload
     def __init__(
@@ -61,10 +65,26 @@ class AsyncServerCursor(
         )
         ServerCursorMixin.__init__(self, name, scrollable, withhold)
 
+        # The worker fetching the next pages during iteration, the queues to
+        # request them and to receive them (None if the fetch was skipped),
+        # the number of records requested, and whether to skip the request.
+        self._prefetcher: AWorker | None = None
+        self._prefetch_requests: AQueue[int] = AQueue()
+        self._prefetched: AQueue[list[Row] | BaseException | None] = AQueue()
+        self._prefetch_size = 0
+        self._prefetch_skip = False
+
+    def __del__(self) -> None:
+        # Stop the prefetch worker if an iteration was abandoned.
+        if getattr(self, "_prefetcher", None):
+            self._prefetch_requests.put_nowait(0)
+        super().__del__()
+
     async def close(self) -> None:
         """
         Close the current cursor and free associated resources.
         """
+        await self._stop_prefetch()
         async with self._conn.lock:
             if self.closed:
                 return
@@ -90,6 +110,7 @@ class AsyncServerCursor(
                 "server-side cursors not supported in pipeline mode"
             )
 
+        await self._stop_prefetch()
         try:
             async with self._conn.lock:
                 await self._conn.wait(self._declare_gen(query, params, binary))
@@ -99,16 +120,24 @@ class AsyncServerCursor(
         return self
 
     async def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = True
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = True,
+        batch_size: int | None = None,
+        rows_per_insert: int | None = None,
     ) -> None:
         """Method not implemented for server-side cursors."""
         raise e.NotSupportedError("executemany not supported on server-side cursors")
 
     async def fetchone(self) -> Row | None:
-        async with self._conn.lock:
-            recs = await self._conn.wait(self._fetch_gen(1))
+        await self._keep_prefetch()
+        if not (recs := self._pop_rows(1)):
+            async with self._conn.lock:
+                recs = await self._conn.wait(self._fetch_gen(1))
+            self._pos += len(recs)
         if recs:
-            self._pos += 1
             return recs[0]
         else:
             return None
@@ -116,29 +145,50 @@ class AsyncServerCursor(
     async def fetchmany(self, size: int = 0) -> list[Row]:
         if not size:
             size = self.arraysize
-        async with self._conn.lock:
-            recs = await self._conn.wait(self._fetch_gen(size))
-        self._pos += len(recs)
+        await self._keep_prefetch()
+        if len(recs := self._pop_rows(size)) < size:
+            async with self._conn.lock:
+                more = await self._conn.wait(self._fetch_gen(size - len(recs)))
+            self._pos += len(more)
+            recs += more
         return recs
 
     async def fetchall(self) -> list[Row]:
+        await self._keep_prefetch()
+        recs = self._pop_rows(None)
         async with self._conn.lock:
-            recs = await self._conn.wait(self._fetch_gen(None))
-        self._pos += len(recs)
+            more = await self._conn.wait(self._fetch_gen(None))
+        self._pos += len(more)
+        recs += more
         return recs
 
+    async def fetch_arrays(self) -> list[Any]:
+        await self._keep_prefetch()
+        if (rest := self._rows_left()) and not self._scrollable:
+            raise e.ProgrammingError(
+                "fetch_arrays() cannot return the records already fetched by"
+                " the iteration: the cursor is not scrollable"
+            )
+        async with self._conn.lock:
+            if rest:
+                # Go back to return the records fetched and not consumed yet.
+                await self._conn.wait(self._scroll_gen(-rest, "relative"))
+                self._iter_rows = None
+            res = await self._conn.wait(self._fetch_result_gen(None))
+        self._pos += res.ntuples
+        return load_arrays(self._tx, 0, res.ntuples)
+
     def __aiter__(self) -> Self:
         return self
 
     async def __anext__(self) -> Row:
         # Fetch a new page if we never fetched any, or we are at the end of
-        # a page of size itersize, meaning there is likely a following one.
+        # a full page, meaning there is likely a following one.
         if self._iter_rows is None or (
-            self._page_pos >= len(self._iter_rows) >= self.itersize
+            self._page_pos >= len(self._iter_rows) >= self._page_size
         ):
-            async with self._conn.lock:
-                self._iter_rows = await self._conn.wait(self._fetch_gen(self.itersize))
-                self._page_pos += 0
+            self._iter_rows = await self._fetch_page()
+            self._page_pos = 0
 
         if self._page_pos >= len(self._iter_rows):
             raise StopAsyncIteration("no more records to return")
@@ -148,9 +198,130 @@ class AsyncServerCursor(
         self._pos += 1
         return rec
 
+    async def _fetch_page(self) -> list[Row]:
+        rows: list[Row] | None = None
+        if self._prefetch_size:
+            self._page_size, self._prefetch_size = self._prefetch_size, 0
+            if isinstance(res := await self._prefetched.get(), BaseException):
+                raise res
+            rows = res
+        else:
+            self._page_size = self._next_page_size()
+
+        if rows is None:
+            async with self._conn.lock:
+                rows = await self._conn.wait(self._fetch_page_gen(self._page_size))
+
+        if len(rows) < self._page_size:
+            # This is the last page: there is nothing more to prefetch.
+            await self._stop_prefetch()
+        elif self.prefetch:
+            # The page is full, there are likely more records: fetch them
+            # while the current page is consumed.
+            self._prefetch_size = self._next_page_size()
+            if not self._prefetcher:
+                args = (ref(self), self._prefetch_requests, self._prefetched)
+                self._prefetcher = aspawn(self._prefetch_worker, args)
+            self._prefetch_requests.put_nowait(self._prefetch_size)
+
+        return rows
+
+    @staticmethod
+    async def _prefetch_worker(
+        wself: ReferenceType[AsyncServerCursor[Any]],
+        requests: AQueue[int],
+        results: AQueue[list[Any] | BaseException | None],
+    ) -> None:
+        """Fetch the pages of records requested during the iteration.
+
+        The function is designed to run as a task for the lifetime of the
+        iteration. Stop running if a request of 0 records is received. Only
+        hold a weak reference to the cursor, so that an iteration abandoned
+        doesn't keep it alive.
+        """
+        while num := await requests.get():
+            if not (cur := wself()):
+                break
+            results.put_nowait(await cur._prefetch(num))
+            del cur
+
+    async def _prefetch(self, num: int) -> list[Row] | BaseException | None:
+        """Fetch a page of records for the prefetch worker.
+
+        Return `!None` if the fetch was skipped, the exception if it failed.
+        """
+        # Don't make other operations wait for the prefetch: if the page
+        # is no longer wanted, or the connection is busy, skip it and
+        # leave it to the iteration to fetch.
+        if True:  # ASYNC
+            # Acquiring a lock not locked doesn't yield to other tasks.
+            locked = not self._conn.lock.locked()
+            if locked:
+                await self._conn.lock.acquire()
+        else:
+            locked = self._conn.lock.acquire(blocking=False)
+        if not locked or self._prefetch_skip:
+            if locked:
+                self._conn.lock.release()
+            return None
+
+        try:
+            return await self._conn.wait(self._fetch_page_gen(num))
+        except BaseException as ex:
+            # Propagate the error to the iteration.
+            return ex
+        finally:
+            self._conn.lock.release()
+
+    async def _discard_prefetch(self) -> None:
+        """Discard the page requested to the prefetch worker, if any.
+
+        If the page is not being fetched yet, the worker skips fetching it.
+        """
+        if not self._prefetch_size:
+            return
+        self._prefetch_size = 0
+        self._prefetch_skip = True
+        try:
+            await self._prefetched.get()
+        finally:
+            self._prefetch_skip = False
+
+    async def _keep_prefetch(self) -> None:
+        """Stop waiting for the page requested to the prefetch worker, if any.
+
+        If the page was already fetched, keep its records to return them
+        first: the server cursor has moved past them.
+        """
+        if not (size := self._prefetch_size):
+            return
+        self._prefetch_size = 0
+        self._prefetch_skip = True
+        try:
+            res = await self._prefetched.get()
+        finally:
+            self._prefetch_skip = False
+
+        if isinstance(res, BaseException):
+            raise res
+        if res is not None:
+            self._keep_page(res, size)
+
+    async def _stop_prefetch(self) -> None:
+        """Discard the page being prefetched and stop the worker, if any."""
+        await self._discard_prefetch()
+        if self._prefetcher:
+            self._prefetch_requests.put_nowait(0)
+            await agather(self._prefetcher)
+            self._prefetcher = None
+
     async def scroll(self, value: int, mode: str = "relative") -> None:
+        await self._keep_prefetch()
+        # The server cursor is past the records fetched and not consumed yet.
+        move = value - self._rows_left() if mode == "relative" else value
         async with self._conn.lock:
-            await self._conn.wait(self._scroll_gen(value, mode))
+            await self._conn.wait(self._scroll_gen(move, mode))
+        self._iter_rows = None
         # Postgres doesn't have a reliable way to report a cursor out of bound
         if mode == "relative":
             self._pos += value
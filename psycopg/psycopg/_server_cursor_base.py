@@ -6,7 +6,7 @@ psycopg server-side cursor base objects.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from warnings import warn
 
 from . import errors as e
@@ -17,8 +17,14 @@ from ._compat import Interpolation, Template
 from .generators import execute
 from ._cursor_base import BaseCursor
 
+if TYPE_CHECKING:
+    from .pq.abc import PGresult
+
 DEFAULT_ITERSIZE = 100
 
+# Max number of records to fetch at once when adapting itersize.
+MAX_ITERSIZE = 100_000
+
 TEXT = pq.Format.TEXT
 BINARY = pq.Format.BINARY
 
@@ -33,7 +39,7 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
     """Mixin to add ServerCursor behaviour and implementation a BaseCursor."""
 
     __slots__ = """_name _scrollable _withhold _described itersize _format
-        _iter_rows _page_pos
+        _iter_rows _page_pos _page_size _iter_size prefetch itersize_bytes
     """.split()
 
     def __init__(self, name: str, scrollable: bool | None, withhold: bool):
@@ -42,11 +48,17 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         self._withhold = withhold
         self._described = False
         self.itersize: int = DEFAULT_ITERSIZE
+        self.prefetch = False
+        self.itersize_bytes: int | None = None
         self._format = TEXT
 
-        # Hold the state during iteration: a fetched page and position within it
+        # Hold the state during iteration: a fetched page and position within
+        # it, the number of records requested for the page, and the number to
+        # request for the next one, if adapted (otherwise 0).
         self._iter_rows: list[Row] | None = None
         self._page_pos = 0
+        self._page_size = 0
+        self._iter_size = 0
 
     def __del__(self, __warn: Any = warn) -> None:
         if self.closed:
@@ -112,6 +124,7 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
             self._described = False
 
         self._iter_rows = None
+        self._iter_size = 0
         yield from self._start_query(query)
         pgq = self._convert_query(query, params)
         self._execute_send(pgq, force_extended=True)
@@ -163,6 +176,66 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         yield from self._conn._exec_command(query)
 
     def _fetch_gen(self, num: int | None) -> PQGen[list[Row]]:
+        res = yield from self._fetch_result_gen(num)
+        return self._tx.load_rows(0, res.ntuples, self._make_row)
+
+    def _fetch_page_gen(self, num: int) -> PQGen[list[Row]]:
+        """Fetch a page of records to iterate on; adapt the size of the next."""
+        res = yield from self._fetch_result_gen(num)
+        if self.itersize_bytes:
+            self._adapt_itersize(res, num)
+        return self._tx.load_rows(0, res.ntuples, self._make_row)
+
+    def _next_page_size(self) -> int:
+        return self._iter_size or self.itersize
+
+    def _keep_page(self, rows: list[Row], size: int) -> None:
+        """Add a page of `!size` records requested after the iteration page."""
+        rest = self._iter_rows[self._page_pos :] if self._iter_rows else []
+        self._iter_rows = rest + rows
+        self._page_pos = 0
+        # Consider the page full, as the iteration does, if all the records
+        # requested were returned.
+        self._page_size = len(rest) + size
+
+    def _pop_rows(self, num: int | None) -> list[Row]:
+        """Return `!num` records fetched and not consumed yet (all if `!None`)."""
+        if not self._iter_rows:
+            return []
+        end = None if num is None else self._page_pos + num
+        rows = self._iter_rows[self._page_pos : end]
+        self._page_pos += len(rows)
+        self._pos += len(rows)
+        return rows
+
+    def _rows_left(self) -> int:
+        """Return the number of records fetched and not consumed yet."""
+        return len(self._iter_rows) - self._page_pos if self._iter_rows else 0
+
+    def _adapt_itersize(self, res: PGresult, num: int) -> None:
+        """
+        Choose the size of the next page to make it about `!itersize_bytes`.
+
+        Estimate the size of the records from the first and the last of the
+        page. Grow the page at most twice as large at every fetch.
+        """
+        if not (ntuples := res.ntuples) or not self.itersize_bytes:
+            return
+
+        nfields = res.nfields
+        data = 0
+        for i in (0, ntuples - 1):
+            for j in range(nfields):
+                if (value := res.get_value(i, j)) is not None:
+                    data += len(value)
+
+        # Every value is preceded by its length on the wire.
+        rowsize = data // 2 + 4 * nfields + 1
+
+        size = max(1, self.itersize_bytes // rowsize)
+        self._iter_size = min(size, 2 * num, MAX_ITERSIZE)
+
+    def _fetch_result_gen(self, num: int | None) -> PQGen[PGresult]:
         if self.closed:
             raise e.InterfaceError("the cursor is closed")
         # If we are stealing the cursor, make sure we know its shape
@@ -180,7 +253,7 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
 
         self.pgresult = res
         self._tx.set_pgresult(res, set_loaders=False)
-        return self._tx.load_rows(0, res.ntuples, self._make_row)
+        return res
 
     def _scroll_gen(self, value: int, mode: str) -> PQGen[None]:
         if mode not in ("relative", "absolute"):
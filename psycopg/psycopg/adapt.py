@@ -125,6 +125,9 @@ class Loader(abc.Loader, ABC):
     format: pq.Format = pq.Format.TEXT
     """The format of the data loaded."""
 
+    zero_copy: bool = False
+    """If `!True`, `load()` may receive a `!memoryview` on the result memory."""
+
     def __init__(self, oid: int, context: abc.AdaptContext | None = None):
         self.oid = oid
         self.connection: BaseConnection[Any] | None
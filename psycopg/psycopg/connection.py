@@ -40,6 +40,7 @@ from ._connection_base import BaseConnection, CursorRow, Notify
 
 if TYPE_CHECKING:
     from .pq.abc import PGconn
+    from ._preparing import PreparePolicy
 
 _WAIT_INTERVAL = 0.1
 
@@ -85,6 +86,7 @@ class Connection(BaseConnection[Row]):
         *,
         autocommit: bool = False,
         prepare_threshold: int | None = 5,
+        prepare_policy: PreparePolicy | None = None,
         context: AdaptContext | None = None,
         row_factory: RowFactory[Row] | None = None,
         cursor_factory: type[Cursor[Row]] | None = None,
@@ -146,6 +148,8 @@ class Connection(BaseConnection[Row]):
         if context:
             rv._adapters = AdaptersMap(context.adapters)
         rv.prepare_threshold = prepare_threshold
+        if prepare_policy is not None:
+            rv.prepare_policy = prepare_policy
         return rv
 
     def __enter__(self) -> Self:
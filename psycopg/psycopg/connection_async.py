@@ -41,6 +41,7 @@ if True:  # ASYNC
 
 if TYPE_CHECKING:
     from .pq.abc import PGconn
+    from ._preparing import PreparePolicy
 
 _WAIT_INTERVAL = 0.1
 
@@ -89,6 +90,7 @@ class AsyncConnection(BaseConnection[Row]):
         *,
         autocommit: bool = False,
         prepare_threshold: int | None = 5,
+        prepare_policy: PreparePolicy | None = None,
         context: AdaptContext | None = None,
         row_factory: AsyncRowFactory[Row] | None = None,
         cursor_factory: type[AsyncCursor[Row]] | None = None,
@@ -167,6 +169,8 @@ class AsyncConnection(BaseConnection[Row]):
         if context:
             rv._adapters = AdaptersMap(context.adapters)
         rv.prepare_threshold = prepare_threshold
+        if prepare_policy is not None:
+            rv.prepare_policy = prepare_policy
         return rv
 
     async def __aenter__(self) -> Self:
@@ -4,7 +4,7 @@ Module gathering the various parts of the copy subsystem.
 
 from typing import IO
 
-from . import _copy, _copy_async
+from . import _copy, _copy_async, _copy_parallel, _copy_parallel_async
 from .abc import Buffer
 
 # re-exports
@@ -13,11 +13,13 @@ AsyncCopy = _copy_async.AsyncCopy
 AsyncWriter = _copy_async.AsyncWriter
 AsyncLibpqWriter = _copy_async.AsyncLibpqWriter
 AsyncQueuedLibpqWriter = _copy_async.AsyncQueuedLibpqWriter
+AsyncParallelCopy = _copy_parallel_async.AsyncParallelCopy
 
 Copy = _copy.Copy
 Writer = _copy.Writer
 LibpqWriter = _copy.LibpqWriter
 QueuedLibpqWriter = _copy.QueuedLibpqWriter
+ParallelCopy = _copy_parallel.ParallelCopy
 
 
 class FileWriter(Writer):
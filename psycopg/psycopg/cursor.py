@@ -21,6 +21,8 @@ from .copy import Copy, Writer
 from .rows import Row, RowFactory, RowMaker
 from ._compat import Self, Template
 from ._pipeline import Pipeline
+from ._copy_base import BUFFER_SIZE, FlushPolicy, check_copy_params
+from .types.numpy import load_arrays
 from ._cursor_base import BaseCursor
 
 if TYPE_CHECKING:
@@ -118,11 +120,28 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         return self
 
     def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = False
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = False,
+        batch_size: int | None = None,
+        rows_per_insert: int | None = None,
     ) -> None:
         """
         Execute the same command with a sequence of input data.
+
+        :param batch_size: if specified, and pipeline mode is available, sync
+            the pipeline every `!batch_size` queries, waiting for their results
+            before sending further ones.
+        :param rows_per_insert: if specified, and the query is an ``INSERT ...
+            VALUES`` statement, insert up to `!rows_per_insert` records with
+            each statement.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if rows_per_insert is not None and rows_per_insert < 1:
+            raise ValueError("rows_per_insert must be at least 1")
         try:
             with self._conn.lock:
                 if Pipeline.is_supported():
@@ -130,19 +149,31 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
                     # sending unnecessary Sync.
                     if self._conn._pipeline:
                         self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query,
+                                params_seq,
+                                returning,
+                                batch_size,
+                                rows_per_insert,
+                            )
                         )
                     else:
                         # Otherwise, make a new one
                         with self._conn._pipeline_nolock():
                             self._conn.wait(
                                 self._executemany_gen_pipeline(
-                                    query, params_seq, returning
+                                    query,
+                                    params_seq,
+                                    returning,
+                                    batch_size,
+                                    rows_per_insert,
                                 )
                             )
                 else:
                     self._conn.wait(
-                        self._executemany_gen_no_pipeline(query, params_seq, returning)
+                        self._executemany_gen_no_pipeline(
+                            query, params_seq, returning, rows_per_insert
+                        )
                     )
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
@@ -178,22 +209,56 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
             except e._NO_TRACEBACK as ex:
                 raise ex.with_traceback(None)
             finally:
-                if self._pgconn.transaction_status == ACTIVE:
-                    # Try to cancel the query, then consume the results
-                    # already received.
-                    self._conn._try_cancel()
-                    try:
-                        while self._conn.wait(self._stream_fetchone_gen(first=False)):
-                            pass
-                    except Exception:
-                        pass
-
-                    # Try to get out of ACTIVE state. Just do a single attempt, which
-                    # should work to recover from an error or query cancelled.
-                    try:
-                        self._conn.wait(self._stream_fetchone_gen(first=False))
-                    except Exception:
-                        pass
+                self._stream_close()
+
+    def stream_batches(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        binary: bool | None = None,
+        size: int = 1,
+    ) -> Iterator[list[Row]]:
+        """
+        Iterate on a result from the database, yielding lists of rows.
+
+        :param size: the maximum number of rows in each list; values greater
+            than 1 are only available from version 17 of the libpq.
+        """
+        if self._pgconn.pipeline_status:
+            raise e.ProgrammingError("stream_batches() cannot be used in pipeline mode")
+
+        with self._conn.lock:
+            try:
+                self._conn.wait(
+                    self._stream_send_gen(query, params, binary=binary, size=size)
+                )
+                first = True
+                while res := self._conn.wait(self._stream_fetchone_gen(first)):
+                    yield self._tx.load_rows(0, res.ntuples, self._make_row)
+                    first = False
+            except e._NO_TRACEBACK as ex:
+                raise ex.with_traceback(None)
+            finally:
+                self._stream_close()
+
+    def _stream_close(self) -> None:
+        if self._pgconn.transaction_status == ACTIVE:
+            # Try to cancel the query, then consume the results
+            # already received.
+            self._conn._try_cancel()
+            try:
+                while self._conn.wait(self._stream_fetchone_gen(first=False)):
+                    pass
+            except Exception:
+                pass
+
+            # Try to get out of ACTIVE state. Just do a single attempt, which
+            # should work to recover from an error or query cancelled.
+            try:
+                self._conn.wait(self._stream_fetchone_gen(first=False))
+            except Exception:
+                pass
 
     def results(self) -> Iterator[Self]:
         """
@@ -257,6 +322,21 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         self._pos = res.ntuples
         return records
 
+    def fetch_arrays(self) -> list[Any]:
+        """
+        Return all the remaining records from the current result set as arrays.
+
+        Return a list of `numpy.ma.MaskedArray`, one per column, with the
+        NULL values masked. Binary results of numeric, boolean, date and
+        timestamp types are converted in bulk, without creating a Python
+        object per value; other columns are returned as arrays of objects.
+        """
+        self._fetch_pipeline()
+        res = self._check_result_for_fetch()
+        arrays = load_arrays(self._tx, self._pos, res.ntuples)
+        self._pos = res.ntuples
+        return arrays
+
     def __iter__(self) -> Self:
         return self
 
@@ -290,15 +370,27 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         params: Params | None = None,
         *,
         writer: Writer | None = None,
+        buffer_size: int = BUFFER_SIZE,
+        queue_size: int | None = None,
+        flush_policy: FlushPolicy | None = None,
     ) -> Iterator[Copy]:
         """
         Initiate a :sql:`COPY` operation and return an object to manage it.
+
+        The keyword arguments are passed to the `Copy` object.
         """
+        check_copy_params(writer, buffer_size, queue_size, flush_policy)
         try:
             with self._conn.lock:
                 self._conn.wait(self._start_copy_gen(statement, params))
 
-                with Copy(self, writer=writer) as copy:
+                with Copy(
+                    self,
+                    writer=writer,
+                    buffer_size=buffer_size,
+                    queue_size=queue_size,
+                    flush_policy=flush_policy,
+                ) as copy:
                     yield copy
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
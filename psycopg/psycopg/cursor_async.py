@@ -17,6 +17,8 @@ from .abc import Params, Query, QueryNoTemplate
 from .copy import AsyncCopy, AsyncWriter
 from .rows import AsyncRowFactory, Row, RowMaker
 from ._compat import Self, Template
+from ._copy_base import BUFFER_SIZE, FlushPolicy, check_copy_params
+from .types.numpy import load_arrays
 from ._cursor_base import BaseCursor
 from ._pipeline_async import AsyncPipeline
 
@@ -118,11 +120,28 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         return self
 
     async def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = False
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = False,
+        batch_size: int | None = None,
+        rows_per_insert: int | None = None,
     ) -> None:
         """
         Execute the same command with a sequence of input data.
+
+        :param batch_size: if specified, and pipeline mode is available, sync
+            the pipeline every `!batch_size` queries, waiting for their results
+            before sending further ones.
+        :param rows_per_insert: if specified, and the query is an ``INSERT ...
+            VALUES`` statement, insert up to `!rows_per_insert` records with
+            each statement.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if rows_per_insert is not None and rows_per_insert < 1:
+            raise ValueError("rows_per_insert must be at least 1")
         try:
             async with self._conn.lock:
                 if AsyncPipeline.is_supported():
@@ -130,19 +149,31 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
                     # sending unnecessary Sync.
                     if self._conn._pipeline:
                         await self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query,
+                                params_seq,
+                                returning,
+                                batch_size,
+                                rows_per_insert,
+                            )
                         )
                     # Otherwise, make a new one
                     else:
                         async with self._conn._pipeline_nolock():
                             await self._conn.wait(
                                 self._executemany_gen_pipeline(
-                                    query, params_seq, returning
+                                    query,
+                                    params_seq,
+                                    returning,
+                                    batch_size,
+                                    rows_per_insert,
                                 )
                             )
                 else:
                     await self._conn.wait(
-                        self._executemany_gen_no_pipeline(query, params_seq, returning)
+                        self._executemany_gen_no_pipeline(
+                            query, params_seq, returning, rows_per_insert
+                        )
                     )
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
@@ -178,24 +209,56 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
             except e._NO_TRACEBACK as ex:
                 raise ex.with_traceback(None)
             finally:
-                if self._pgconn.transaction_status == ACTIVE:
-                    # Try to cancel the query, then consume the results
-                    # already received.
-                    await self._conn._try_cancel()
-                    try:
-                        while await self._conn.wait(
-                            self._stream_fetchone_gen(first=False)
-                        ):
-                            pass
-                    except Exception:
-                        pass
-
-                    # Try to get out of ACTIVE state. Just do a single attempt, which
-                    # should work to recover from an error or query cancelled.
-                    try:
-                        await self._conn.wait(self._stream_fetchone_gen(first=False))
-                    except Exception:
-                        pass
+                await self._stream_close()
+
+    async def stream_batches(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        binary: bool | None = None,
+        size: int = 1,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Iterate on a result from the database, yielding lists of rows.
+
+        :param size: the maximum number of rows in each list; values greater
+            than 1 are only available from version 17 of the libpq.
+        """
+        if self._pgconn.pipeline_status:
+            raise e.ProgrammingError("stream_batches() cannot be used in pipeline mode")
+
+        async with self._conn.lock:
+            try:
+                await self._conn.wait(
+                    self._stream_send_gen(query, params, binary=binary, size=size)
+                )
+                first = True
+                while res := await self._conn.wait(self._stream_fetchone_gen(first)):
+                    yield self._tx.load_rows(0, res.ntuples, self._make_row)
+                    first = False
+            except e._NO_TRACEBACK as ex:
+                raise ex.with_traceback(None)
+            finally:
+                await self._stream_close()
+
+    async def _stream_close(self) -> None:
+        if self._pgconn.transaction_status == ACTIVE:
+            # Try to cancel the query, then consume the results
+            # already received.
+            await self._conn._try_cancel()
+            try:
+                while await self._conn.wait(self._stream_fetchone_gen(first=False)):
+                    pass
+            except Exception:
+                pass
+
+            # Try to get out of ACTIVE state. Just do a single attempt, which
+            # should work to recover from an error or query cancelled.
+            try:
+                await self._conn.wait(self._stream_fetchone_gen(first=False))
+            except Exception:
+                pass
 
     async def results(self) -> AsyncIterator[Self]:
         """
@@ -259,6 +322,21 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         self._pos = res.ntuples
         return records
 
+    async def fetch_arrays(self) -> list[Any]:
+        """
+        Return all the remaining records from the current result set as arrays.
+
+        Return a list of `numpy.ma.MaskedArray`, one per column, with the
+        NULL values masked. Binary results of numeric, boolean, date and
+        timestamp types are converted in bulk, without creating a Python
+        object per value; other columns are returned as arrays of objects.
+        """
+        await self._fetch_pipeline()
+        res = self._check_result_for_fetch()
+        arrays = load_arrays(self._tx, self._pos, res.ntuples)
+        self._pos = res.ntuples
+        return arrays
+
     def __aiter__(self) -> Self:
         return self
 
@@ -292,15 +370,27 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         params: Params | None = None,
         *,
         writer: AsyncWriter | None = None,
+        buffer_size: int = BUFFER_SIZE,
+        queue_size: int | None = None,
+        flush_policy: FlushPolicy | None = None,
     ) -> AsyncIterator[AsyncCopy]:
         """
         Initiate a :sql:`COPY` operation and return an object to manage it.
+
+        The keyword arguments are passed to the `AsyncCopy` object.
         """
+        check_copy_params(writer, buffer_size, queue_size, flush_policy)
         try:
             async with self._conn.lock:
                 await self._conn.wait(self._start_copy_gen(statement, params))
 
-                async with AsyncCopy(self, writer=writer) as copy:
+                async with AsyncCopy(
+                    self,
+                    writer=writer,
+                    buffer_size=buffer_size,
+                    queue_size=queue_size,
+                    flush_policy=flush_policy,
+                ) as copy:
                     yield copy
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
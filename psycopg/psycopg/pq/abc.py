@@ -274,6 +274,12 @@ class PGresult(Protocol):
 
     def get_value(self, row_number: int, column_number: int) -> bytes | None: ...
 
+    def get_value_view(self, row_number: int, column_number: int) -> Buffer | None: ...
+
+    def get_fixed_column(
+        self, column_number: int, row0: int, row1: int, size: int
+    ) -> tuple[bytes, bytes]: ...
+
     @property
     def nparams(self) -> int: ...
 
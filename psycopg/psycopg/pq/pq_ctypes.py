@@ -16,7 +16,7 @@ import sys
 import logging
 from os import getpid
 from ctypes import POINTER, Array, addressof, byref, c_char_p, c_int, c_size_t, c_ulong
-from ctypes import c_void_p, cast, create_string_buffer, py_object, string_at
+from ctypes import c_void_p, cast, create_string_buffer, memmove, py_object, string_at
 from typing import TYPE_CHECKING, Any
 from typing import cast as t_cast
 from weakref import ref
@@ -924,6 +924,35 @@ class PGresult:
         else:
             return b""
 
+    def get_value_view(self, row_number: int, column_number: int) -> abc.Buffer | None:
+        # Creating a ctypes array type to point to each value is slower than
+        # copying it: there is no view to gain here.
+        return self.get_value(row_number, column_number)
+
+    def get_fixed_column(
+        self, column_number: int, row0: int, row1: int, size: int
+    ) -> tuple[bytes, bytes]:
+        if not 0 <= column_number < self.nfields:
+            raise ValueError(f"column {column_number} out of range")
+        if not 0 <= row0 <= row1 <= self.ntuples:
+            raise ValueError(f"rows {row0}-{row1} out of range")
+        if size <= 0:
+            raise ValueError("size must be positive")
+        data = create_string_buffer((row1 - row0) * size)
+        nulls = bytearray(row1 - row0)
+        for i, row in enumerate(range(row0, row1)):
+            length = impl.PQgetlength(self._pgresult_ptr, row, column_number)
+            if length == size:
+                v = impl.PQgetvalue(self._pgresult_ptr, row, column_number)
+                memmove(addressof(data) + i * size, v, size)
+            elif impl.PQgetisnull(self._pgresult_ptr, row, column_number):
+                nulls[i] = 1
+            else:
+                raise ValueError(
+                    f"value at row {row} has length {length}, expected {size}"
+                )
+        return data.raw, bytes(nulls)
+
     @property
     def nparams(self) -> int:
         return impl.PQnparams(self._pgresult_ptr)
@@ -66,7 +66,10 @@ def set_json_dumps(
 
 
 def set_json_loads(
-    loads: JsonLoadsFunction, context: abc.AdaptContext | None = None
+    loads: JsonLoadsFunction,
+    context: abc.AdaptContext | None = None,
+    *,
+    accepts_buffers: bool = False,
 ) -> None:
     """
     Set the JSON parsing function to fetch JSON objects from the database.
@@ -76,6 +79,9 @@ def set_json_loads(
     :param context: Where to use the `!loads` function. If not specified, use
         it globally.
     :type context: `~psycopg.Connection` or `~psycopg.Cursor`
+    :param accepts_buffers: If `!True`, `!loads` can parse a `!memoryview`
+        and the data is passed to it without copying it into a `!bytes`.
+    :type accepts_buffers: `!bool`
 
     By default loading JSON uses the builtin `json.loads`. You can override
     it to use a different JSON library or to use customised arguments.
@@ -84,6 +90,7 @@ def set_json_loads(
         # If changing load function globally, just change the default on the
         # global class
         _JsonLoader._loads = loads
+        _JsonLoader._loads_buffers = accepts_buffers
     else:
         # If the scope is smaller than global, create subclassess and register
         # them in the appropriate scope.
@@ -94,7 +101,7 @@ def set_json_loads(
             ("jsonb", JsonbBinaryLoader),
         ]
         for tname, base in grid:
-            loader = _make_loader(base, loads)
+            loader = _make_loader(base, loads, accepts_buffers)
             context.adapters.register_loader(tname, loader)
 
 
@@ -102,7 +109,7 @@ def set_json_loads(
 # cannot be GC'd.
 
 _dumpers_cache: dict[_AdapterKey, type[abc.Dumper]] = {}
-_loaders_cache: dict[_AdapterKey, type[abc.Loader]] = {}
+_loaders_cache: dict[tuple[_AdapterKey, bool], type[abc.Loader]] = {}
 
 
 def _make_dumper(
@@ -126,21 +133,24 @@ def _make_dumper(
 
 
 def _make_loader(
-    base: type[Loader], loads: JsonLoadsFunction, __lock: Lock = Lock()
+    base: type[Loader],
+    loads: JsonLoadsFunction,
+    accepts_buffers: bool = False,
+    __lock: Lock = Lock(),
 ) -> type[abc.Loader]:
     with __lock:
         if key := _get_adapter_key(base, loads):
             try:
-                return _loaders_cache[key]
+                return _loaders_cache[key, accepts_buffers]
             except KeyError:
                 pass
 
         if not (name := base.__name__).startswith("Custom"):
             name = f"Custom{name}"
-        rv = type(name, (base,), {"_loads": loads})
+        rv = type(name, (base,), {"_loads": loads, "_loads_buffers": accepts_buffers})
 
         if key:
-            _loaders_cache[key] = rv
+            _loaders_cache[key, accepts_buffers] = rv
 
         return rv
 
@@ -248,16 +258,20 @@ class _JsonLoader(Loader):
     # The globally used JSON loads() function. It can be changed globally (by
     # set_json_loads) or by a subclass.
     _loads: JsonLoadsFunction = json.loads
+    # True if _loads() can parse a memoryview, not only str and bytes.
+    _loads_buffers: bool = False
 
     def __init__(self, oid: int, context: abc.AdaptContext | None = None):
         super().__init__(oid, context)
         self.loads = self.__class__._loads
+        if self._loads_buffers:
+            self.zero_copy = True
 
     def load(self, data: Buffer) -> Any:
         # json.loads() cannot work on memoryview.
-        if not isinstance(data, bytes):
+        if not isinstance(data, bytes) and not self._loads_buffers:
             data = bytes(data)
-        return self.loads(data)
+        return self.loads(data)  # type: ignore[arg-type]
 
 
 class JsonLoader(_JsonLoader):
@@ -277,10 +291,12 @@ class JsonbBinaryLoader(_JsonLoader):
 
     def load(self, data: Buffer) -> Any:
         if data and data[0] != 1:
-            raise DataError("unknown jsonb binary format: {data[0]}")
-        if not isinstance((data := data[1:]), bytes):
+            raise DataError(f"unknown jsonb binary format: {data[0]}")
+        if self._loads_buffers:
+            data = memoryview(data)[1:]
+        elif not isinstance((data := data[1:]), bytes):
             data = bytes(data)
-        return self.loads(data)
+        return self.loads(data)  # type: ignore[arg-type]
 
 
 def _get_current_dumper(
@@ -4,16 +4,23 @@ Adapters for numpy types.
 
 # Copyright (C) 2022 The Psycopg Team
 
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator, Sequence
 
 from .. import _oids
 from ..pq import Format
 from ..abc import AdaptContext, Buffer
 from .bool import BoolBinaryDumper, BoolDumper
+from ..errors import DataError, InterfaceError, ProgrammingError
 from .numeric import Float4BinaryDumper, Float4Dumper, FloatBinaryDumper, FloatDumper
 from .numeric import _IntDumper, dump_int_to_numeric_binary
 from .._struct import pack_int2, pack_int4, pack_int8
 
+if TYPE_CHECKING:
+    from ..abc import Transformer
+
 
 class NPInt16Dumper(_IntDumper):
     oid = _oids.INT2_OID
@@ -62,6 +69,257 @@ class NPNumericBinaryDumper(NPNumericDumper):
         return dump_int_to_numeric_binary(int(obj))
 
 
+# Columnar loading
+
+# Binary types that can be converted to an array in a single operation.
+# Map oid -> (dtype of the data on the wire, dtype of the array returned)
+_ARRAY_TYPES: dict[int, tuple[str, str]] = {
+    _oids.BOOL_OID: ("?", "?"),
+    _oids.INT2_OID: (">i2", "int16"),
+    _oids.INT4_OID: (">i4", "int32"),
+    _oids.INT8_OID: (">i8", "int64"),
+    _oids.OID_OID: (">u4", "uint32"),
+    _oids.FLOAT4_OID: (">f4", "float32"),
+    _oids.FLOAT8_OID: (">f8", "float64"),
+    _oids.DATE_OID: (">i4", "datetime64[D]"),
+    _oids.TIMESTAMP_OID: (">i8", "datetime64[us]"),
+    _oids.TIMESTAMPTZ_OID: (">i8", "datetime64[us]"),
+}
+
+# Postgres epoch (2000-01-01) relative to the Unix epoch (1970-01-01)
+_pg_epoch_days = 10_957
+_pg_epoch_micros = _pg_epoch_days * 86_400 * 1_000_000
+
+
+def load_arrays(tx: Transformer, row0: int, row1: int) -> list[Any]:
+    """
+    Load the records between `!row0` and `!row1` of a result as NumPy arrays.
+
+    Return one `numpy.ma.MaskedArray` per column of the result set in `!tx`,
+    with the NULL values masked.
+
+    Columns of fixed-size types returned in binary format are converted in
+    bulk to arrays of the matching NumPy dtype (``timestamptz`` values are
+    returned as UTC ``datetime64``). Other columns are converted value by value
+    using the loaders configured and returned as arrays of objects.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "loading arrays requires the package 'numpy' to be installed"
+        ) from None
+
+    if not (res := tx.pgresult):
+        raise InterfaceError("result not set")
+
+    rv = []
+    nrows = row1 - row0
+    for col in range(res.nfields):
+        oid = res.ftype(col)
+        fmt = Format(res.fformat(col))
+
+        if fmt == Format.BINARY and oid in _ARRAY_TYPES:
+            wiretype, dtype = _ARRAY_TYPES[oid]
+            # Read the whole column at once, with no object per value.
+            size = np.dtype(wiretype).itemsize
+            buf, nulls = res.get_fixed_column(col, row0, row1, size)
+            data = np.frombuffer(buf, dtype=wiretype)
+            # Copy the mask: assigning to the array needs to change it.
+            mask = np.frombuffer(nulls, dtype=bool).copy()
+            if oid == _oids.DATE_OID:
+                data = _load_dates(data)
+            elif oid == _oids.TIMESTAMP_OID or oid == _oids.TIMESTAMPTZ_OID:
+                data = _load_timestamps(data)
+            else:
+                data = data.astype(dtype)
+        else:
+            values = [res.get_value(row, col) for row in range(row0, row1)]
+            mask = np.fromiter((v is None for v in values), dtype=bool, count=nrows)
+            load = tx.get_loader(oid, fmt).load
+            data = np.empty(nrows, dtype=object)
+            for i, v in enumerate(values):
+                if v is not None:
+                    data[i] = load(v)
+
+        rv.append(np.ma.MaskedArray(data, mask=mask))
+
+    return rv
+
+
+def _load_dates(data: Any) -> Any:
+    if ((data == 0x7FFFFFFF) | (data == -0x80000000)).any():
+        raise DataError("date infinity not supported in arrays")
+    return (data.astype("int64") + _pg_epoch_days).view("datetime64[D]")
+
+
+def _load_timestamps(data: Any) -> Any:
+    data = data.astype("int64")
+    if ((data == 2**63 - 1) | (data == -(2**63))).any():
+        raise DataError("timestamp infinity not supported in arrays")
+    return (data + _pg_epoch_micros).view("datetime64[us]")
+
+
+def dump_arrays(
+    columns: Sequence[Any], types: Sequence[int] | None, size: int
+) -> Iterator[bytes]:
+    """
+    Convert a sequence of same-length arrays to binary COPY records.
+
+    Every item of `!columns` is an array (or an object supporting the buffer
+    protocol) containing the values of a column. Masked values of
+    `numpy.ma.MaskedArray` and ``NaT`` values are converted to NULL.
+
+    `!types` are the oids of the types to produce, if known; otherwise they
+    are inferred by the arrays dtypes.
+
+    Return an iterable of buffers of about `!size` bytes each.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "dumping arrays requires the package 'numpy' to be installed"
+        ) from None
+
+    if types and len(types) != len(columns):
+        raise DataError(f"expected {len(types)} columns, got {len(columns)}")
+
+    values = []
+    masks = []
+    for i, col in enumerate(columns):
+        mask = np.ma.getmaskarray(col)
+        data = np.ma.getdata(col)
+        if data.ndim != 1:
+            raise DataError(f"column {i} is not a one-dimensional array")
+        if data.dtype.kind == "M":
+            mask = mask | np.isnat(data)
+
+        oid = types[i] if types else _get_array_oid(data)
+        values.append(_dump_array(np, data, mask, oid, i))
+        masks.append(mask)
+
+    nrows = len(values[0]) if values else 0
+    if any(len(v) != nrows for v in values):
+        raise DataError("all the columns must have the same length")
+
+    # Fast path: no null, all the records have the same layout
+    if not any(m.any() for m in masks):
+        fields = [("n", ">i2")]
+        for i, v in enumerate(values):
+            fields.append((f"l{i}", ">i4"))
+            fields.append((f"v{i}", v.dtype))
+        records = np.empty(nrows, dtype=fields)
+        records["n"] = len(values)
+        for i, v in enumerate(values):
+            records[f"l{i}"] = v.dtype.itemsize
+            records[f"v{i}"] = v
+
+        step = max(1, size // records.dtype.itemsize)
+        for row in range(0, nrows, step):
+            yield records[row : row + step].tobytes()
+        return
+
+    # Slow path: records have different sizes according to the nulls.
+    width = 2 + sum(4 + v.dtype.itemsize for v in values)
+    step = max(1, size // width)
+    for row0 in range(0, nrows, step):
+        row1 = min(row0 + step, nrows)
+        yield _dump_records(
+            np, [v[row0:row1] for v in values], [m[row0:row1] for m in masks]
+        )
+
+
+def _dump_records(np: Any, values: list[Any], masks: list[Any]) -> bytes:
+    nrows = len(values[0])
+    sizes = [np.where(m, 4, 4 + v.dtype.itemsize) for v, m in zip(values, masks)]
+    lengths = 2 + sum(sizes)
+    pos = np.cumsum(lengths) - lengths
+    out = np.empty(int(lengths.sum()), dtype="uint8")
+
+    # Scatter the fields of every record at their own position
+    header = np.full(nrows, len(values), dtype=">i2")
+    out[pos[:, None] + np.arange(2)] = header.view("uint8").reshape(nrows, 2)
+    pos += 2
+
+    for v, m in zip(values, masks):
+        size = v.dtype.itemsize
+        flens = np.where(m, -1, size).astype(">i4")
+        out[pos[:, None] + np.arange(4)] = flens.view("uint8").reshape(nrows, 4)
+        pos += 4
+
+        notnull = ~m
+        data = v[notnull].view("uint8").reshape(-1, size)
+        out[pos[notnull][:, None] + np.arange(size)] = data
+        pos += np.where(m, 0, size)
+
+    rv: bytes = out.tobytes()
+    return rv
+
+
+def _get_array_oid(data: Any) -> int:
+    kind = data.dtype.kind
+    size = data.dtype.itemsize
+    if kind == "b":
+        return _oids.BOOL_OID
+    elif kind == "i" or (kind == "u" and size < 8):
+        # Unsigned types need a larger signed type to fit
+        if kind == "u":
+            size *= 2
+        if size <= 2:
+            return _oids.INT2_OID
+        elif size <= 4:
+            return _oids.INT4_OID
+        else:
+            return _oids.INT8_OID
+    elif kind == "f":
+        return _oids.FLOAT4_OID if size <= 4 else _oids.FLOAT8_OID
+    elif kind == "M":
+        if data.dtype == "datetime64[D]":
+            return _oids.DATE_OID
+        else:
+            return _oids.TIMESTAMP_OID
+
+    raise ProgrammingError(f"cannot dump arrays of dtype {data.dtype}")
+
+
+def _dump_array(np: Any, data: Any, mask: Any, oid: int, col: int) -> Any:
+    """Convert an array of values to an array in the Postgres binary format."""
+    try:
+        wiretype = _ARRAY_TYPES[oid][0]
+    except KeyError:
+        raise ProgrammingError(
+            f"cannot dump column {col} to oid {oid} from an array"
+        ) from None
+
+    wdtype = np.dtype(wiretype)
+    kind = data.dtype.kind
+    if oid == _oids.DATE_OID:
+        if kind != "M":
+            raise DataError(f"column {col} is not an array of dates")
+        data = data.astype("datetime64[D]").view("int64") - _pg_epoch_days
+    elif oid == _oids.TIMESTAMP_OID or oid == _oids.TIMESTAMPTZ_OID:
+        if kind != "M":
+            raise DataError(f"column {col} is not an array of timestamps")
+        data = data.astype("datetime64[us]").view("int64") - _pg_epoch_micros
+    elif (
+        kind not in "biuf"
+        or (kind == "f" and wdtype.kind != "f")
+        # Don't cast numbers to booleans or vice versa.
+        or (kind == "b") != (wdtype.kind == "b")
+    ):
+        raise DataError(f"cannot dump column {col} of dtype {data.dtype} to oid {oid}")
+
+    if wdtype.kind in "iu" and data.dtype.kind in "iu":
+        check = data[~mask] if mask.any() else data
+        if len(check):
+            info = np.iinfo(wdtype)
+            if check.min() < info.min or check.max() > info.max:
+                raise DataError(f"column {col} values out of range for oid {oid}")
+
+    return data.astype(wdtype)
+
+
 def register_default_adapters(context: AdaptContext) -> None:
     adapters = context.adapters
 
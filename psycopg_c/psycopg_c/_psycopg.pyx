@@ -49,6 +49,7 @@ include "_psycopg/waiting.pyx"
 
 include "types/array.pyx"
 include "types/datetime.pyx"
+include "types/json.pyx"
 include "types/numeric.pyx"
 include "types/bool.pyx"
 include "types/numpy.pyx"
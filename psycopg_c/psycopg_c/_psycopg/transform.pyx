@@ -601,7 +601,8 @@ cdef class Transformer:
         cdef RowLoader row_loader = RowLoader()
         row_loader.pyloader = loader
         row_loader.loadfunc = loader.load
-        if isinstance(loader, CLoader):
+        # C loaders needing a view owning the data are used via load()
+        if isinstance(loader, CLoader) and not getattr(loader, "zero_copy", False):
             row_loader.cloader = <CLoader>loader
 
         PyDict_SetItem(<object>cache, <object>oid, row_loader)
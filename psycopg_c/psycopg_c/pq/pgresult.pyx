@@ -6,6 +6,8 @@ psycopg_c.pq.PGresult object implementation.
 
 cimport cython
 from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from libc.string cimport memcpy, memset
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
 
 from psycopg.pq.misc import PGresAttDesc
 from psycopg.pq._enums import ExecStatus
@@ -112,6 +114,59 @@ cdef class PGresult:
             else:
                 return b""
 
+    def get_value_view(
+        self, int row_number, int column_number
+    ) -> memoryview | None:
+        cdef int crow = row_number
+        cdef int ccol = column_number
+        cdef int length = libpq.PQgetlength(self._pgresult_ptr, crow, ccol)
+        cdef char *v
+        if length:
+            v = libpq.PQgetvalue(self._pgresult_ptr, crow, ccol)
+            return memoryview(
+                ViewBuffer._from_buffer(self, <unsigned char *>v, length))
+        else:
+            if libpq.PQgetisnull(self._pgresult_ptr, crow, ccol):
+                return None
+            else:
+                return memoryview(b"")
+
+    def get_fixed_column(
+        self, int column_number, int row0, int row1, int size
+    ) -> tuple[bytes, bytes]:
+        if not 0 <= column_number < libpq.PQnfields(self._pgresult_ptr):
+            raise ValueError(f"column {column_number} out of range")
+        if not 0 <= row0 <= row1 <= libpq.PQntuples(self._pgresult_ptr):
+            raise ValueError(f"rows {row0}-{row1} out of range")
+        if size <= 0:
+            raise ValueError("size must be positive")
+
+        cdef Py_ssize_t nrows = row1 - row0
+        cdef bytes data = PyBytes_FromStringAndSize(NULL, nrows * size)
+        cdef bytes nulls = PyBytes_FromStringAndSize(NULL, nrows)
+        cdef char *dbuf = PyBytes_AS_STRING(data)
+        cdef char *nbuf = PyBytes_AS_STRING(nulls)
+        cdef int row, length
+        for row in range(row0, row1):
+            length = libpq.PQgetlength(self._pgresult_ptr, row, column_number)
+            if length == size:
+                memcpy(
+                    dbuf,
+                    libpq.PQgetvalue(self._pgresult_ptr, row, column_number),
+                    size)
+                nbuf[0] = 0
+            elif libpq.PQgetisnull(self._pgresult_ptr, row, column_number):
+                memset(dbuf, 0, size)
+                nbuf[0] = 1
+            else:
+                raise ValueError(
+                    f"value at row {row} has length {length}, expected {size}"
+                )
+            dbuf += size
+            nbuf += 1
+
+        return data, nulls
+
     @property
     def nparams(self) -> int:
         return libpq.PQnparams(self._pgresult_ptr)
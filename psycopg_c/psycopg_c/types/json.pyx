@@ -0,0 +1,84 @@
+"""
+Cython adapters for JSON types.
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+cimport cython
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.object cimport PyObject, PyObject_CallFunctionObjArgs
+
+from psycopg import errors as e
+
+
+cdef class _JsonLoader(CLoader):
+
+    cdef readonly object loads
+    # If set, loads() can parse a buffer: the Transformer calls load() with a
+    # view on the data, which keeps the memory it points to alive, instead of
+    # calling cload().
+    cdef readonly bint zero_copy
+
+    def __cinit__(self, oid: int, context: AdaptContext | None = None):
+        # The loads() function can be changed globally by set_json_loads()
+        from psycopg.types.json import _JsonLoader as PyJsonLoader
+
+        self.loads = PyJsonLoader._loads
+        self.zero_copy = PyJsonLoader._loads_buffers
+
+    cdef object _load(self, const char *data, size_t length):
+        cdef object b = PyBytes_FromStringAndSize(data, length)
+        return PyObject_CallFunctionObjArgs(self.loads, <PyObject *>b, NULL)
+
+    def load(self, object data) -> Any:
+        if self.zero_copy:
+            return PyObject_CallFunctionObjArgs(self.loads, <PyObject *>data, NULL)
+        return CLoader.load(self, data)
+
+
+@cython.final
+cdef class JsonLoader(_JsonLoader):
+
+    format = PQ_TEXT
+
+    cdef object cload(self, const char *data, size_t length):
+        return self._load(data, length)
+
+
+@cython.final
+cdef class JsonbLoader(_JsonLoader):
+
+    format = PQ_TEXT
+
+    cdef object cload(self, const char *data, size_t length):
+        return self._load(data, length)
+
+
+@cython.final
+cdef class JsonBinaryLoader(_JsonLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        return self._load(data, length)
+
+
+@cython.final
+cdef class JsonbBinaryLoader(_JsonLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        if length and data[0] != 1:
+            raise e.DataError(f"unknown jsonb binary format: {data[0]}")
+        return self._load(data + 1, length - 1 if length else 0)
+
+    def load(self, object data) -> Any:
+        if not self.zero_copy:
+            return CLoader.load(self, data)
+
+        if data and data[0] != 1:
+            raise e.DataError(f"unknown jsonb binary format: {data[0]}")
+        # Skip the version byte without copying the data.
+        data = memoryview(data)[1:]
+        return PyObject_CallFunctionObjArgs(self.loads, <PyObject *>data, NULL)
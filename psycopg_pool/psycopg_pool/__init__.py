@@ -6,17 +6,27 @@ psycopg connection pool package
 
 from .pool import ConnectionPool
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
+from .manager import PoolManager
+from .routing import RoutingPool
 from .version import __version__ as __version__  # noqa: F401
 from .null_pool import NullConnectionPool
+from ._histogram import Histogram
 from .pool_async import AsyncConnectionPool
+from .manager_async import AsyncPoolManager
+from .routing_async import AsyncRoutingPool
 from .null_pool_async import AsyncNullConnectionPool
 
 __all__ = [
     "AsyncConnectionPool",
     "AsyncNullConnectionPool",
+    "AsyncPoolManager",
+    "AsyncRoutingPool",
     "ConnectionPool",
+    "Histogram",
     "NullConnectionPool",
     "PoolClosed",
+    "PoolManager",
     "PoolTimeout",
+    "RoutingPool",
     "TooManyRequests",
 ]
@@ -0,0 +1,76 @@
+"""
+Latency distribution measured by the pool.
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+from math import ceil, inf
+from bisect import bisect_left
+
+
+class Histogram:
+    """
+    Distribution of a duration, in milliseconds, in fixed buckets.
+    """
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    BOUNDS: tuple[float, ...] = tuple(m * 10**e for e in range(5) for m in (1, 2, 5))
+    """The upper bounds of the buckets, in milliseconds."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} count={self.count}"
+            f" p50={self.percentile(50)} p99={self.percentile(99)}"
+            f" max={self.max_ms:.1f}>"
+        )
+
+    def record(self, ms: float) -> None:
+        """Add a measure to the distribution."""
+        self.counts[bisect_left(self.BOUNDS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, pc: float) -> float:
+        """
+        Return the duration under which the *pc* percent of the measures fall.
+
+        The value returned is the upper bound of the bucket containing the
+        percentile, or the maximum value measured, if smaller.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, ceil(self.count * pc / 100.0))
+        seen = 0
+        for bound, n in self.buckets():
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        Return the buckets of the distribution as ``(upper_bound, count)``.
+
+        The last bucket has an infinite upper bound.
+        """
+        return list(zip((*self.BOUNDS, inf), self.counts))
+
+    def copy(self) -> Histogram:
+        """Return a copy of the distribution."""
+        rv = Histogram()
+        rv.counts = self.counts[:]
+        rv.count = self.count
+        rv.total_ms = self.total_ms
+        rv.max_ms = self.max_ms
+        return rv
@@ -6,18 +6,28 @@ psycopg connection pool base class and functionalities.
 
 from __future__ import annotations
 
+import socket
+from math import ceil, inf
 from time import monotonic
+from heapq import heappop, heappush
 from random import random
-from typing import TYPE_CHECKING, Any
-from collections import Counter, deque
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from weakref import ref
+from itertools import count
+from collections import Counter, OrderedDict, deque
+from collections.abc import Iterator, Mapping
 
 from psycopg import errors as e
 
 from .errors import PoolClosed
+from ._histogram import Histogram
 
 if TYPE_CHECKING:
+    from psycopg._preparing import Key
     from psycopg._connection_base import BaseConnection
 
+T = TypeVar("T")
+
 
 class BasePool:
     # Used to generate pool names
@@ -28,6 +38,7 @@ class BasePool:
     _POOL_MAX = "pool_max"
     _POOL_SIZE = "pool_size"
     _POOL_AVAILABLE = "pool_available"
+    _POOL_TARGET = "pool_target"
     _REQUESTS_WAITING = "requests_waiting"
     _REQUESTS_NUM = "requests_num"
     _REQUESTS_QUEUED = "requests_queued"
@@ -39,6 +50,23 @@ class BasePool:
     _CONNECTIONS_MS = "connections_ms"
     _CONNECTIONS_ERRORS = "connections_errors"
     _CONNECTIONS_LOST = "connections_lost"
+    _PREPARED_WARMED = "prepared_warmed"
+    _REFILLS_NUM = "refills_num"
+    _REFILLS_MS = "refills_ms"
+    _VALIDATIONS_NUM = "validations_num"
+    _VALIDATIONS_ERRORS = "validations_errors"
+    _ROTATIONS_NUM = "rotations_num"
+
+    # Fraction of max_lifetime before the expiry at which a connection can be
+    # rotated in background.
+    _ROTATION_LEAD = 0.1
+
+    # Autoscaling parameters: weight of the last measure in the moving average
+    # of the connections used, extra capacity to provide over the average,
+    # max number of connections to add in an interval.
+    _AUTOSCALE_ALPHA = 0.5
+    _AUTOSCALE_HEADROOM = 1.25
+    _AUTOSCALE_STEP = 4
 
     _pool: deque[Any]
 
@@ -55,6 +83,16 @@ class BasePool:
         max_idle: float,
         reconnect_timeout: float,
         num_workers: int,
+        prepare_warmup: int,
+        grow_concurrency: int,
+        histograms: bool,
+        strategy: str,
+        check_idle_after: float,
+        validate_interval: float,
+        validate_batch: int,
+        rotate_interval: float,
+        reserved: Mapping[int, int] | None,
+        autoscale_interval: float,
     ):
         min_size, max_size = self._check_size(min_size, max_size)
 
@@ -64,6 +102,27 @@ class BasePool:
 
         if num_workers < 1:
             raise ValueError("num_workers must be at least 1")
+        if prepare_warmup < 0:
+            raise ValueError("prepare_warmup cannot be negative")
+        if grow_concurrency < 1:
+            raise ValueError("grow_concurrency must be at least 1")
+        if check_idle_after < 0:
+            raise ValueError("check_idle_after cannot be negative")
+        if validate_interval < 0:
+            raise ValueError("validate_interval cannot be negative")
+        if validate_batch < 1:
+            raise ValueError("validate_batch must be at least 1")
+        if rotate_interval < 0:
+            raise ValueError("rotate_interval cannot be negative")
+        if reserved:
+            if any(n < 0 for n in reserved.values()):
+                raise ValueError("reserved connections cannot be negative")
+            if sum(reserved.values()) >= max_size:
+                raise ValueError("reserved connections must be less than max_size")
+        if autoscale_interval < 0:
+            raise ValueError("autoscale_interval cannot be negative")
+        if strategy not in ("fifo", "lifo"):
+            raise ValueError(f"strategy must be 'fifo' or 'lifo', got {strategy!r}")
 
         self.name = name
         self.close_returns = close_returns
@@ -75,10 +134,27 @@ class BasePool:
         self.max_lifetime = max_lifetime
         self.max_idle = max_idle
         self.num_workers = num_workers
+        self.prepare_warmup = prepare_warmup
+        self.grow_concurrency = grow_concurrency
+        self.strategy = strategy
+        # Connections are returned to the right of the pool deque. Take them
+        # from the left to use them in turn, or from the right to reuse the
+        # most recently used ones and let the other ones idle.
+        self._lifo = strategy == "lifo"
+        self.check_idle_after = check_idle_after
+        self.validate_interval = validate_interval
+        self.validate_batch = validate_batch
+        self.rotate_interval = rotate_interval
+        self.reserved = dict(reserved) if reserved else {}
+        self.autoscale_interval = autoscale_interval
 
         self._nconns = min_size  # currently in the pool, out, being prepared
         self._pool = deque()
         self._stats = Counter[str]()
+        # Distributions of the durations measured, if requested.
+        self._histograms: dict[str, Histogram] | None = None
+        if histograms:
+            self._histograms = self._new_histograms()
 
         # Min number of connections in the pool in a max_idle unit of time.
         # It is reset periodically by the ShrinkPool scheduled task.
@@ -87,11 +163,32 @@ class BasePool:
         # max_idle interval they weren't all used.
         self._nconns_min = min_size
 
-        # Flag to allow the pool to grow only one connection at time. In case
-        # of spike, if threads are allowed to grow in parallel and connection
-        # time is slow, there won't be any thread available to return the
-        # connections to the pool.
-        self._growing = False
+        # Size of the pool chosen by the autoscaling, and the measures it is
+        # based on.
+        self._target_size = min_size
+        self._busy_avg = 0.0
+        self._last_usage_ms = 0
+
+        # Number of tasks growing the pool, at most grow_concurrency. In case
+        # of spike, if all the workers are busy growing the pool and
+        # connection time is slow, there won't be any worker available to
+        # return the connections to the pool.
+        self._growing = 0
+        # When the pool started growing, to measure the time to refill it.
+        self._growing_since = 0.0
+
+        # Statements prepared on the pool connections, from the least to the
+        # most recently seen, to prepare on the new connections. Only changed
+        # with the lock held; the tuple can be read without holding it.
+        self._prepared_keys: OrderedDict[Key, None] = OrderedDict()
+        self._prepared_keys_list: tuple[Key, ...] = ()
+
+        # Expiry dates of the connections, as a heap, to tell quickly if any
+        # can be rotated. The connections just created are queued until the
+        # next check, which runs with the lock held.
+        self._expiries: list[tuple[float, int, ref[BaseConnection[Any]]]] = []
+        self._new_expiries: deque[tuple[float, int, ref[BaseConnection[Any]]]]
+        self._new_expiries = deque()
 
         self._opened = False
         self._closed = True
@@ -159,6 +256,8 @@ class BasePool:
         Return current stats about the pool usage.
         """
         rv = dict(self._stats)
+        if self._histograms:
+            rv.update(self._get_percentiles(self._histograms))
         rv.update(self._get_measures())
         return rv
 
@@ -170,19 +269,167 @@ class BasePool:
         """
         stats, self._stats = self._stats, Counter()
         rv = dict(stats)
+        if hists := self._histograms:
+            self._histograms = self._new_histograms()
+            rv.update(self._get_percentiles(hists))
         rv.update(self._get_measures())
         return rv
 
+    def get_histograms(self) -> dict[str, Histogram]:
+        """
+        Return the distributions of the durations measured by the pool.
+
+        Return an empty dictionary if the pool was not created with
+        `!histograms=True`.
+        """
+        if not self._histograms:
+            return {}
+        return {key: hist.copy() for key, hist in self._histograms.items()}
+
+    def _record_usage(self, t0: float) -> None:
+        """Record in the stats the usage of a connection obtained at *t0*."""
+        usage_ms = 1000.0 * (monotonic() - t0)
+        self._stats[self._USAGE_MS] += int(usage_ms)
+        if self._histograms:
+            self._histograms[self._USAGE_MS].record(usage_ms)
+
+    def _record_wait(self, t0: float) -> None:
+        """Record in the histogram the wait of a client started at *t0*."""
+        if self._histograms:
+            wait = monotonic() - t0
+            self._histograms[self._REQUESTS_WAIT_MS].record(1000.0 * wait)
+
+    def _new_histograms(self) -> dict[str, Histogram]:
+        keys = (self._REQUESTS_WAIT_MS, self._USAGE_MS, self._CONNECTIONS_MS)
+        return {key: Histogram() for key in keys}
+
+    def _get_percentiles(self, hists: dict[str, Histogram]) -> dict[str, int]:
+        """
+        Return the percentiles of the measured distributions.
+        """
+        rv = {}
+        for key, hist in hists.items():
+            if hist.count:
+                for pc in (50, 90, 99):
+                    rv[f"{key}_p{pc}"] = round(hist.percentile(pc))
+                rv[f"{key}_max"] = round(hist.max_ms)
+        return rv
+
     def _get_measures(self) -> dict[str, int]:
         """
         Return immediate measures of the pool (not counters).
         """
-        return {
+        rv = {
             self._POOL_MIN: self._min_size,
             self._POOL_MAX: self._max_size,
             self._POOL_SIZE: self._nconns,
             self._POOL_AVAILABLE: len(self._pool),
         }
+        if self.autoscale_interval:
+            rv[self._POOL_TARGET] = self._target_size
+        return rv
+
+    def _update_target_size(self, nwaiting: int) -> int:
+        """
+        Choose the size of the pool adequate to the load measured.
+
+        Estimate the number of connections in use in the last interval from
+        the usage time measured, or from the connections out of the pool, if
+        more, and smooth it with an exponential moving average. Add some
+        headroom and the clients currently waiting.
+        """
+        usage_ms = self._stats[self._USAGE_MS]
+        if (delta_ms := usage_ms - self._last_usage_ms) < 0:
+            delta_ms = usage_ms  # stats reset by pop_stats()
+        self._last_usage_ms = usage_ms
+
+        busy = max(
+            delta_ms / (1000.0 * self.autoscale_interval),
+            self._nconns - len(self._pool),
+        )
+        alpha = self._AUTOSCALE_ALPHA
+        self._busy_avg = alpha * busy + (1.0 - alpha) * self._busy_avg
+
+        demand = ceil(self._busy_avg * self._AUTOSCALE_HEADROOM) + nwaiting
+        self._target_size = max(self._min_size, min(self._max_size, demand))
+        return self._target_size
+
+    def _start_growing(self) -> None:
+        """Record that a new task is growing the pool."""
+        if not self._growing:
+            self._growing_since = monotonic()
+        self._growing += 1
+
+    def _stop_growing(self) -> None:
+        """Record that a task has finished growing the pool."""
+        self._growing -= 1
+        if not self._growing:
+            self._stats[self._REFILLS_NUM] += 1
+            self._stats[self._REFILLS_MS] += int(
+                1000.0 * (monotonic() - self._growing_since)
+            )
+
+    def _add_prepared_keys(self, keys: list[Key]) -> None:
+        """Record the statements prepared by a connection in the pool registry.
+
+        Keep at most `!prepare_warmup` keys, evicting the least recently seen.
+
+        Must be called with the lock held.
+        """
+        registry = self._prepared_keys
+        for key in keys:
+            registry.pop(key, None)
+            registry[key] = None
+        while len(registry) > self.prepare_warmup:
+            registry.popitem(last=False)
+        self._prepared_keys_list = tuple(registry)
+
+    def _reserve_for(self, priority: int) -> int:
+        """
+        Return the number of connections to keep in the pool for the clients
+        with a priority higher than *priority*.
+        """
+        if not self.reserved:
+            return 0
+        return sum(n for level, n in self.reserved.items() if level > priority)
+
+    def _needs_check(self, conn: BaseConnection[Any]) -> bool:
+        """Return `!True` if the connection was idle long enough to check it."""
+        if not self.check_idle_after:
+            return True
+        return monotonic() - conn._idle_since >= self.check_idle_after
+
+    @staticmethod
+    def _probe_socket(conn: BaseConnection[Any]) -> bool:
+        """
+        Check the connection socket without a round trip to the server.
+
+        Return `!True` if the socket is open and there is nothing to read,
+        `!False` if the server sent something, or if the state cannot be
+        established. Raise `~psycopg.OperationalError` if the connection is
+        closed.
+        """
+        if conn.closed:
+            raise e.OperationalError("the connection is closed")
+        if not (flags := getattr(socket, "MSG_DONTWAIT", 0)):
+            return False
+        try:
+            # Wrap the socket without taking its ownership: detach() below.
+            sock = socket.socket(fileno=conn.pgconn.socket)
+        except OSError:
+            return False
+        try:
+            data = sock.recv(1, socket.MSG_PEEK | flags)
+        except BlockingIOError:
+            return True
+        except OSError as ex:
+            raise e.OperationalError(f"connection socket error: {ex}") from None
+        finally:
+            sock.detach()
+
+        if not data:
+            raise e.OperationalError("the connection was closed by the server")
+        return False
 
     @classmethod
     def _jitter(cls, value: float, min_pc: float, max_pc: float) -> float:
@@ -191,12 +438,74 @@ class BasePool:
         """
         return value * (1.0 + ((max_pc - min_pc) * random()) + min_pc)
 
+    def _get_rotation_candidate(self) -> BaseConnection[Any] | None:
+        """
+        Return the idle connection closest to expiry, if it should be rotated.
+        """
+        if not self._pool or self.max_lifetime == inf:
+            return None
+
+        while self._new_expiries:
+            heappush(self._expiries, self._new_expiries.popleft())
+
+        # Discard the connections already closed.
+        while self._expiries:
+            if (conn := self._expiries[0][2]()) and not conn.closed:
+                break
+            heappop(self._expiries)
+
+        threshold = monotonic() + self.max_lifetime * self._ROTATION_LEAD
+        if not self._expiries or self._expiries[0][0] > threshold:
+            return None
+
+        # A connection is about to expire, but it might be in use: look for
+        # the idle one closest to expiry.
+        conn = min(self._pool, key=lambda c: c._expire_at)
+        return conn if conn._expire_at <= threshold else None
+
     def _set_connection_expiry_date(self, conn: BaseConnection[Any]) -> None:
         """Set an expiry date on a connection.
 
         Add some randomness to avoid mass reconnection.
         """
         conn._expire_at = monotonic() + self._jitter(self.max_lifetime, -0.05, 0.0)
+        if self.rotate_interval and self.max_lifetime != inf:
+            self._new_expiries.append((conn._expire_at, id(conn), ref(conn)))
+
+
+class WaitingQueue(Generic[T]):
+    """
+    A queue of clients waiting for a connection.
+
+    The clients with the highest priority are served first; the clients with
+    the same priority are served in order of arrival.
+    """
+
+    __slots__ = ("_heap", "_seq")
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, T]] = []
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[T]:
+        return (item for _, _, item in self._heap)
+
+    @property
+    def first_priority(self) -> int:
+        """The priority of the next client to serve."""
+        return -self._heap[0][0]
+
+    def append(self, item: T, priority: int = 0) -> None:
+        heappush(self._heap, (-priority, next(self._seq), item))
+
+    def popleft(self) -> T:
+        return heappop(self._heap)[2]
+
+    def clear(self) -> None:
+        self._heap.clear()
 
 
 class AttemptWithBackoff:
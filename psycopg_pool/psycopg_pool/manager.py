@@ -0,0 +1,359 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'manager_async.py'
+# DO NOT CHANGE! Change the original file instead.
+"""
+Psycopg pool manager module (sync version).
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+import threading
+from time import monotonic
+from types import TracebackType
+from typing import Any, cast
+from contextlib import contextmanager
+from collections.abc import Callable, Hashable, Iterator
+
+from .pool import ConnectionPool, MaintenanceTask, StopWorker
+from .sched import Scheduler
+from .errors import PoolClosed, TooManyRequests
+from ._compat import Self
+from ._acompat import Lock, Queue, Worker, gather, spawn
+
+logger = logging.getLogger("psycopg.pool")
+
+
+class PoolManager:
+    """
+    A collection of connection pools, created on demand for different keys.
+
+    The pools share the same maintenance workers and scheduler.
+    """
+
+    # Used to generate manager names
+    _num_manager = 0
+
+    def __init__(
+        self,
+        conninfo: Callable[[Any], str],
+        *,
+        pool_class: type[ConnectionPool[Any]] = ConnectionPool,
+        pool_kwargs: dict[str, Any] | None = None,
+        max_connections: int = 0,
+        max_idle: float = 10 * 60.0,
+        num_workers: int = 3,
+        name: str | None = None,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        if max_connections < 0:
+            raise ValueError("max_connections cannot be negative")
+
+        if not name:
+            num = PoolManager._num_manager = PoolManager._num_manager + 1
+            name = f"manager-{num}"
+
+        self.conninfo = conninfo
+        self.pool_class = pool_class
+        self.pool_kwargs = pool_kwargs or {}
+        self.max_connections = max_connections
+        self.max_idle = max_idle
+        self.num_workers = num_workers
+        self.name = name
+
+        self._entries: dict[Hashable, _PoolEntry] = {}
+        self._nevicted = 0
+
+        # Number of connections managed by all the pools, kept up-to-date by
+        # the pools as they grow and shrink.
+        self._nconns = 0
+        self._counted: set[ConnectionPool[Any]] = set()
+        self._nconns_lock = threading.Lock()
+
+        # If these are asyncio objects, make sure to create them on open
+        # to attach them to the right loop.
+        self._lock: Lock
+        self._sched: Scheduler
+        self._tasks: Queue[MaintenanceTask]
+
+        self._sched_runner: Worker | None = None
+        self._workers: list[Worker] = []
+
+        self._opened = False
+        self._closed = True
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self.name!r} at 0x{id(self):x}>"
+
+    @property
+    def closed(self) -> bool:
+        """`!True` if the manager is closed."""
+        return self._closed
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Open the manager, starting the workers shared by the pools.
+
+        It is safe to call `!open()` on a manager already open, but you cannot
+        currently re-open a closed manager.
+        """
+
+        try:
+            self._lock
+        except AttributeError:
+            self._lock = Lock()
+
+        with self._lock:
+            if not self._closed:
+                return
+            if self._opened:
+                raise PoolClosed(
+                    f"the manager {self.name!r} has already been opened/closed and cannot be reused"
+                )
+
+            self._tasks = Queue()
+            self._sched = Scheduler()
+            self._closed = False
+            self._opened = True
+
+            self._sched_runner = spawn(self._sched.run, name=f"{self.name}-scheduler")
+            for i in range(self.num_workers):
+                t = spawn(
+                    ConnectionPool.worker,
+                    args=(self._tasks,),
+                    name=f"{self.name}-worker-{i}",
+                )
+                self._workers.append(t)
+
+        self._sched.enter(self.max_idle, self._evict_idle_pools)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close all the pools and stop the workers.
+
+        Wait *timeout* seconds for threads to terminate their job, if positive.
+        """
+        if self._closed:
+            return
+
+        with self._lock:
+            self._closed = True
+            pools = [self._pop_pool(key) for key in list(self._entries)]
+
+        for pool in pools:
+            pool.close(timeout=timeout)
+
+        # Stop the scheduler and the workers
+        self._sched.enter(0, None)
+        workers, self._workers = (self._workers[:], [])
+        for _ in workers:
+            # StopWorker is never run: a pool reference is not needed.
+            self._tasks.put_nowait(StopWorker(cast(Any, self)))
+        if self._sched_runner:
+            workers.append(self._sched_runner)
+            self._sched_runner = None
+
+        gather(*workers, timeout=timeout)
+
+    def get_pool(self, key: Hashable) -> ConnectionPool[Any]:
+        """Return the pool for *key*, creating and opening it if necessary.
+
+        A pool returned by this function can be closed by the manager if it
+        remains unused for longer than `!max_idle`: use `connection()` if you
+        don't want to keep track of it.
+        """
+        return self._get_pool(key, use=False)
+
+    @contextmanager
+    def connection(
+        self, key: Hashable, timeout: float | None = None, priority: int = 0
+    ) -> Iterator[Any]:
+        """Context manager to obtain a connection from the pool for *key*.
+
+        Create the pool if necessary, then behave like
+        `ConnectionPool.connection()`.
+        """
+        pool = self._get_pool(key, use=True)
+        try:
+            with pool.connection(timeout=timeout, priority=priority) as conn:
+                yield conn
+        finally:
+            with self._lock:
+                if entry := self._entries.get(key):
+                    entry.users -= 1
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return current stats about the manager usage.
+        """
+        return {
+            "pools_open": len(self._entries),
+            "pools_evicted": self._nevicted,
+            "pool_size": self._nconns,
+            "pool_max": self.max_connections,
+        }
+
+    def _get_pool(self, key: Hashable, use: bool) -> ConnectionPool[Any]:
+        if self._closed:
+            raise PoolClosed(f"the manager {self.name!r} is closed")
+
+        # The pools removed to make room are closed even if opening the new
+        # pool fails, not to leak their connections.
+        to_evict: list[tuple[Hashable, ConnectionPool[Any]]] = []
+        try:
+            with self._lock:
+                if self._closed:
+                    raise PoolClosed(f"the manager {self.name!r} is closed")
+
+                if not (entry := self._entries.get(key)):
+                    pool = self.pool_class(
+                        self.conninfo(key),
+                        open=False,
+                        name=f"{self.name}-{key}",
+                        **self.pool_kwargs,
+                    )
+                    to_evict = [
+                        (k, self._pop_pool(k)) for k in self._make_room(pool.min_size)
+                    ]
+
+                    pool._manager = self
+                    self._count_pool(pool, True)
+                    try:
+                        pool.open()
+                    except BaseException:
+                        self._count_pool(pool, False)
+                        raise
+                    entry = self._entries[key] = _PoolEntry(pool)
+                    logger.info("pool %r created for key %r", pool.name, key)
+
+                entry.last_used = monotonic()
+                if use:
+                    entry.users += 1
+        finally:
+            for k, evicted in to_evict:
+                self._evict(k, evicted)
+
+        return entry.pool
+
+    def _make_room(self, nconns: int) -> list[Hashable]:
+        """
+        Return the keys of the pools to close to make room for *nconns*.
+
+        Choose the pools with no connection in use, the least recently used
+        first. Raise `TooManyRequests` if not enough room can be found.
+        """
+        if not self.max_connections:
+            return []
+        if (excess := (self._nconns + nconns - self.max_connections)) <= 0:
+            return []
+
+        rv = []
+        entries = sorted(self._entries.items(), key=lambda item: item[1].last_used)
+        for key, entry in entries:
+            if entry.is_idle():
+                rv.append(key)
+                excess -= entry.pool._nconns
+                if excess <= 0:
+                    return rv
+
+        raise TooManyRequests(
+            f"the manager {self.name!r} has already {self.max_connections} connections open"
+        )
+
+    def _evict_idle_pools(self) -> None:
+        """Close the pools which haven't been used for longer than max_idle."""
+        if self._closed:
+            return
+
+        # Reschedule the task now so that in case of any error we don't lose
+        # the periodic run.
+        self._sched.enter(self.max_idle, self._evict_idle_pools)
+
+        with self._lock:
+            now = monotonic()
+            to_evict = {
+                key: entry.pool
+                for key, entry in self._entries.items()
+                if entry.is_idle() and now - entry.last_used >= self.max_idle
+            }
+            for key in to_evict:
+                self._pop_pool(key)
+
+        for key, pool in to_evict.items():
+            self._evict(key, pool)
+
+    def _evict(self, key: Hashable, pool: ConnectionPool[Any]) -> None:
+        logger.info("closing pool %r for key %r", pool.name, key)
+        self._nevicted += 1
+        pool.close()
+
+    def _pop_pool(self, key: Hashable) -> ConnectionPool[Any]:
+        """Remove the pool for *key* from the manager and return it."""
+        pool = self._entries.pop(key).pool
+        self._count_pool(pool, False)
+        return pool
+
+    def _count_pool(self, pool: ConnectionPool[Any], counted: bool) -> None:
+        """Add or remove the connections of *pool* to the manager total."""
+        with self._nconns_lock:
+            self._count_pool_unlocked(pool, counted)
+
+    def _count_pool_unlocked(self, pool: ConnectionPool[Any], counted: bool) -> None:
+        if counted:
+            self._counted.add(pool)
+            self._nconns += pool._nconns
+        else:
+            self._counted.discard(pool)
+            self._nconns -= pool._nconns
+
+    def _set_pool_nconns(self, pool: ConnectionPool[Any], value: int) -> None:
+        """Set the number of connections of *pool*, updating the total."""
+        with self._nconns_lock:
+            self._set_pool_nconns_unlocked(pool, value)
+
+    def _set_pool_nconns_unlocked(self, pool: ConnectionPool[Any], value: int) -> None:
+        if pool in self._counted:
+            self._nconns += value - pool._nconns
+        pool._nconns_value = value
+
+    def _room(self) -> int | None:
+        """Return the number of connections the pools can still open.
+
+        Return `!None` if the number of connections is not limited.
+        """
+        if not self.max_connections:
+            return None
+        return max(0, self.max_connections - self._nconns)
+
+    def _is_full(self) -> bool:
+        """Return `!True` if the pools cannot open more connections."""
+        return bool(self.max_connections) and self._nconns >= self.max_connections
+
+
+class _PoolEntry:
+    """The state of a pool in a manager."""
+
+    __slots__ = ("pool", "last_used", "users")
+
+    def __init__(self, pool: ConnectionPool[Any]):
+        self.pool = pool
+        self.last_used = monotonic()
+        # Number of clients which requested a connection through the manager
+        self.users = 0
+
+    def is_idle(self) -> bool:
+        """Return `!True` if no connection of the pool is in use."""
+        return not self.users and len(self.pool._pool) >= self.pool._nconns
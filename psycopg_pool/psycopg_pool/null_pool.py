@@ -48,6 +48,7 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: ConnectFailedCB | None = None,
         num_workers: int = 3,
+        histograms: bool = False,
     ):  # Note: min_size default value changed to 0.
 
         # close_returns=True makes no sense
@@ -69,6 +70,7 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            histograms=histograms,
         )
 
     def wait(self, timeout: float = 30.0) -> None:
@@ -100,7 +102,9 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool[CT]):
 
         logger.info("pool %r is ready to use", self.name)
 
-    def _get_ready_connection(self, timeout: float | None) -> CT | None:
+    def _get_ready_connection(
+        self, timeout: float | None, priority: int = 0
+    ) -> CT | None:
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
 
@@ -46,6 +46,7 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: AsyncConnectFailedCB | None = None,
         num_workers: int = 3,
+        histograms: bool = False,
     ):
         super().__init__(
             conninfo,
@@ -65,6 +66,7 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            histograms=histograms,
         )
 
     async def wait(self, timeout: float = 30.0) -> None:
@@ -96,7 +98,9 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool[ACT])
 
         logger.info("pool %r is ready to use", self.name)
 
-    async def _get_ready_connection(self, timeout: float | None) -> ACT | None:
+    async def _get_ready_connection(
+        self, timeout: float | None, priority: int = 0
+    ) -> ACT | None:
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
 
@@ -14,24 +14,27 @@ import warnings
 from abc import ABC, abstractmethod
 from time import monotonic
 from types import TracebackType
-from typing import Any, Generic, cast
+from typing import TYPE_CHECKING, Any, Generic, cast
 from weakref import ref
 from contextlib import contextmanager
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 
 from psycopg import Connection
 from psycopg import errors as e
 from psycopg.pq import TransactionStatus
 
 from .abc import CT, ConnectFailedCB, ConnectionCB, ConninfoParam, KwargsParam
-from .base import AttemptWithBackoff, BasePool
+from .base import AttemptWithBackoff, BasePool, WaitingQueue
 from .sched import Scheduler
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
 from ._compat import PSYCOPG_VERSION, PoolConnection, Self
 from ._acompat import Condition, Event, Lock, Queue, Worker, current_thread_name
 from ._acompat import gather, sleep, spawn
 
+if TYPE_CHECKING:
+    from .manager import PoolManager
+
 logger = logging.getLogger("psycopg.pool")
 
 
@@ -59,6 +62,16 @@ class ConnectionPool(Generic[CT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: ConnectFailedCB | None = None,
         num_workers: int = 3,
+        prepare_warmup: int = 0,
+        grow_concurrency: int = 1,
+        histograms: bool = False,
+        strategy: str = "fifo",
+        check_idle_after: float = 0.0,
+        validate_interval: float = 0.0,
+        validate_batch: int = 1,
+        rotate_interval: float = 0.0,
+        reserved: Mapping[int, int] | None = None,
+        autoscale_interval: float = 0.0,
     ):
         if close_returns and PSYCOPG_VERSION < (3, 3):
             if connection_class is Connection:
@@ -82,7 +95,7 @@ class ConnectionPool(Generic[CT], BasePool):
         self._sched: Scheduler
         self._tasks: Queue[MaintenanceTask]
 
-        self._waiting = deque[WaitingClient[CT]]()
+        self._waiting = WaitingQueue[WaitingClient[CT]]()
 
         # to notify that the pool is full
         self._pool_full_event: Event | None = None
@@ -90,6 +103,10 @@ class ConnectionPool(Generic[CT], BasePool):
         self._sched_runner: Worker | None = None
         self._workers: list[Worker] = []
 
+        # The manager providing the workers, if the pool is part of one.
+        self._manager: PoolManager | None = None
+        self._nconns_value: int
+
         super().__init__(
             min_size=min_size,
             max_size=max_size,
@@ -101,6 +118,16 @@ class ConnectionPool(Generic[CT], BasePool):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            prepare_warmup=prepare_warmup,
+            grow_concurrency=grow_concurrency,
+            histograms=histograms,
+            strategy=strategy,
+            check_idle_after=check_idle_after,
+            validate_interval=validate_interval,
+            validate_batch=validate_batch,
+            rotate_interval=rotate_interval,
+            reserved=reserved,
+            autoscale_interval=autoscale_interval,
         )
 
         if open is None:
@@ -119,6 +146,19 @@ class ConnectionPool(Generic[CT], BasePool):
         hint = "you can try to call 'close()' explicitly or to use the pool as context manager"
         gather(*workers, timeout=5.0, timeout_hint=hint)
 
+    @property
+    def _nconns(self) -> int:
+        # Number of connections currently in the pool, out, being prepared.
+        return self._nconns_value
+
+    @_nconns.setter
+    def _nconns(self, value: int) -> None:
+        if self._manager:
+            # Keep the total of the manager up-to-date.
+            self._manager._set_pool_nconns(self, value)
+        else:
+            self._nconns_value = value
+
     def _check_open_getconn(self) -> None:
         super()._check_open_getconn()
 
@@ -163,7 +203,9 @@ class ConnectionPool(Generic[CT], BasePool):
         logger.info("pool %r is ready to use", self.name)
 
     @contextmanager
-    def connection(self, timeout: float | None = None) -> Iterator[CT]:
+    def connection(
+        self, timeout: float | None = None, priority: int = 0
+    ) -> Iterator[CT]:
         """Context manager to obtain a connection from the pool.
 
         Return the connection immediately if available, otherwise wait up to
@@ -174,18 +216,20 @@ class ConnectionPool(Generic[CT], BasePool):
         :ref:`connection context behaviour <with-connection>` (commit/rollback
         the transaction in case of success/error). If the connection is no more
         in working state, replace it with a new one.
+
+        If the pool is exhausted, the clients with higher *priority* are
+        served first.
         """
-        conn = self.getconn(timeout=timeout)
+        conn = self.getconn(timeout=timeout, priority=priority)
         try:
             t0 = monotonic()
             with conn:
                 yield conn
         finally:
             self.putconn(conn)
-            t1 = monotonic()
-            self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
+            self._record_usage(t0)
 
-    def getconn(self, timeout: float | None = None) -> CT:
+    def getconn(self, timeout: float | None = None, priority: int = 0) -> CT:
         """Obtain a connection from the pool.
 
         You should preferably use `connection()`. Use this function only if
@@ -194,6 +238,9 @@ class ConnectionPool(Generic[CT], BasePool):
         After using this function you *must* call a corresponding `putconn()`:
         failing to do so will deplete the pool. A depleted pool is a sad pool:
         you don't want a depleted pool.
+
+        If the pool is exhausted, the clients with higher *priority* are
+        served first.
         """
         if timeout is None:
             timeout = self.timeout
@@ -205,19 +252,25 @@ class ConnectionPool(Generic[CT], BasePool):
         self._check_open_getconn()
 
         try:
-            return self._getconn_with_check_loop(deadline)
+            conn = self._getconn_with_check_loop(deadline, priority)
         # Re-raise the timeout exception presenting the user the global
         # timeout, not the per-attempt one.
         except PoolTimeout:
+            # Record the wait also here: it is the longest, when the pool is
+            # saturated.
+            self._record_wait(deadline - timeout)
             raise PoolTimeout(
                 f"couldn't get a connection after {timeout:.2f} sec"
             ) from None
 
-    def _getconn_with_check_loop(self, deadline: float) -> CT:
+        self._record_wait(deadline - timeout)
+        return conn
+
+    def _getconn_with_check_loop(self, deadline: float, priority: int) -> CT:
         attempt: AttemptWithBackoff | None = None
 
         while True:
-            conn = self._getconn_unchecked(deadline - monotonic())
+            conn = self._getconn_unchecked(deadline - monotonic(), priority)
             try:
                 self._check_connection(conn)
             except Exception:
@@ -239,15 +292,15 @@ class ConnectionPool(Generic[CT], BasePool):
             else:
                 sleep(attempt.delay)
 
-    def _getconn_unchecked(self, timeout: float) -> CT:
+    def _getconn_unchecked(self, timeout: float, priority: int = 0) -> CT:
         # Critical section: decide here if there's a connection ready
         # or if the client needs to wait.
         with self._lock:
-            if not (conn := self._get_ready_connection(timeout)):
+            if not (conn := self._get_ready_connection(timeout, priority)):
                 # No connection available: put the client in the waiting queue
                 t0 = monotonic()
                 pos: WaitingClient[CT] = WaitingClient()
-                self._waiting.append(pos)
+                self._waiting.append(pos, priority)
                 self._stats[self._REQUESTS_QUEUED] += 1
 
                 # If there is space for the pool to grow, let's do it
@@ -271,15 +324,17 @@ class ConnectionPool(Generic[CT], BasePool):
         conn._pool = self
         return conn
 
-    def _get_ready_connection(self, timeout: float | None) -> CT | None:
+    def _get_ready_connection(
+        self, timeout: float | None, priority: int = 0
+    ) -> CT | None:
         """Return a connection, if the client deserves one."""
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
 
         conn: CT | None = None
-        if self._pool:
+        if len(self._pool) > self._reserve_for(priority):
             # Take a connection ready out of the pool
-            conn = self._pool.popleft()
+            conn = self._pool.pop() if self._lifo else self._pool.popleft()
             if len(self._pool) < self._nconns_min:
                 self._nconns_min = len(self._pool)
         elif self.max_waiting and len(self._waiting) >= self.max_waiting:
@@ -292,6 +347,8 @@ class ConnectionPool(Generic[CT], BasePool):
     def _check_connection(self, conn: CT) -> None:
         if not self._check:
             return
+        if not self._needs_check(conn):
+            return
         try:
             self._check(conn)
         except Exception as e:
@@ -299,13 +356,18 @@ class ConnectionPool(Generic[CT], BasePool):
             raise
 
     def _maybe_grow_pool(self) -> None:
-        # Allow only one task at time to grow the pool (or returning
-        # connections might be starved).
-        if self._nconns >= self._max_size or self._growing:
+        # Allow only grow_concurrency tasks at time to grow the pool (or
+        # returning connections might be starved). Add a new one only if there
+        # are more clients waiting than connections being added.
+        if self._nconns >= self._max_size or self._growing >= self.grow_concurrency:
+            return
+        if self._growing and len(self._waiting) <= self._growing:
+            return
+        if self._manager and self._manager._is_full():
             return
         self._nconns += 1
         logger.info("growing pool %r to %s", self.name, self._nconns)
-        self._growing = True
+        self._start_growing()
         self.run_task(AddConnection(self, growing=True))
 
     def putconn(self, conn: CT) -> None:
@@ -318,6 +380,7 @@ class ConnectionPool(Generic[CT], BasePool):
         self._check_pool_putconn(conn)
 
         logger.info("returning connection to %r", self.name)
+        self._learn_prepared(conn)
         if self._maybe_close_connection(conn):
             return
 
@@ -375,15 +438,21 @@ class ConnectionPool(Generic[CT], BasePool):
         # A lock has been most likely, but not necessarily, created in `open()`.
         self._ensure_lock()
 
-        # Create these objects now to attach them to the right loop.
-        # See #219
-        self._tasks = Queue()
-        self._sched = Scheduler()
+        if self._manager:
+            # Use the workers shared by all the pools of the manager.
+            self._tasks = self._manager._tasks
+            self._sched = self._manager._sched
+        else:
+            # Create these objects now to attach them to the right loop.
+            # See #219
+            self._tasks = Queue()
+            self._sched = Scheduler()
 
         self._closed = False
         self._opened = True
 
-        self._start_workers()
+        if not self._manager:
+            self._start_workers()
         self._start_initial_tasks()
 
     def _ensure_lock(self) -> None:
@@ -413,6 +482,18 @@ class ConnectionPool(Generic[CT], BasePool):
         # remained unused.
         self.run_task(Schedule(self, ShrinkPool(self), self.max_idle))
 
+        # Schedule a task to find the broken connections while idle.
+        if self.validate_interval:
+            self.run_task(Schedule(self, ValidatePool(self), self.validate_interval))
+
+        # Schedule a task to replace the connections about to expire.
+        if self.rotate_interval:
+            self.run_task(Schedule(self, RotatePool(self), self.rotate_interval))
+
+        # Schedule a task to adapt the size of the pool to the load.
+        if self.autoscale_interval:
+            self.run_task(Schedule(self, AutoscalePool(self), self.autoscale_interval))
+
     def close(self, timeout: float = 5.0) -> None:
         """Close the pool and make it unavailable to new clients.
 
@@ -456,6 +537,10 @@ class ConnectionPool(Generic[CT], BasePool):
             pos.fail(PoolClosed(f"the pool {self.name!r} is closed"))
 
     def _signal_stop_worker(self) -> list[Worker]:
+        # The workers of a manager are stopped by the manager.
+        if self._manager:
+            return []
+
         # Stop the scheduler
         self._sched.enter(0, None)
 
@@ -556,6 +641,19 @@ class ConnectionPool(Generic[CT], BasePool):
             finally:
                 conn.autocommit = False
 
+    @staticmethod
+    def check_socket(conn: CT) -> None:
+        """
+        A cheap check to verify that a connection was not closed by the server.
+
+        Verify, without a round trip to the server, that the connection socket
+        is still open. If the server sent something on an idle connection
+        (for instance an error before terminating the session) fall back on
+        `check_connection()`.
+        """
+        if not ConnectionPool._probe_socket(conn):
+            ConnectionPool.check_connection(conn)
+
     def reconnect_failed(self) -> None:
         """
         Called when reconnection failed for longer than `reconnect_timeout`.
@@ -612,6 +710,8 @@ class ConnectionPool(Generic[CT], BasePool):
         else:
             t1 = monotonic()
             self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
+            if self._histograms:
+                self._histograms[self._CONNECTIONS_MS].record(1000.0 * (t1 - t0))
 
         conn._pool = self
 
@@ -623,10 +723,47 @@ class ConnectionPool(Generic[CT], BasePool):
                     f"connection left in status {sname} by configure function {self._configure}: discarded"
                 )
 
+        conn._pool_prepared_num = 0
+        if self._prepared_keys_list:
+            self._prewarm_connection(conn)
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
 
+    def _prewarm_connection(self, conn: CT) -> None:
+        """Prepare on a new connection the statements known to the pool."""
+        # Don't take the pool lock: a NullPool connects holding it.
+        keys = self._prepared_keys_list
+        with conn.lock:
+            nprep = conn.wait(conn._prepared.prewarm_gen(conn, keys))
+        conn._pool_prepared_num = conn._prepared.prepared_num
+        logger.debug("prepared %s statements on new connection %s", nprep, conn)
+        self._stats[self._PREPARED_WARMED] += nprep
+
+    def _learn_prepared(self, conn: CT) -> None:
+        """Record the statements prepared by *conn* in the pool registry.
+
+        Only do it if the connection prepared new statements since it was
+        last returned to the pool.
+        """
+        if not self.prepare_warmup:
+            return
+
+        try:
+            num = conn._prepared.prepared_num
+        except AttributeError:
+            # Prepared statements registry not available in psycopg < 3.3
+            return
+
+        if num == conn._pool_prepared_num:
+            return
+        conn._pool_prepared_num = num
+
+        keys = conn._prepared.prepared_keys()
+        with self._lock:
+            self._add_prepared_keys(keys)
+
     def _resolve_conninfo(self) -> str:
         """Resolve conninfo (static string, sync callable, or async callable)."""
         if callable(self.conninfo):
@@ -672,7 +809,7 @@ class ConnectionPool(Generic[CT], BasePool):
                     self._nconns -= 1
                     # If we have given up with a growing attempt, allow a new one.
                     if growing and self._growing:
-                        self._growing = False
+                        self._stop_growing()
                 self.reconnect_failed()
             else:
                 attempt.update_delay(now)
@@ -686,15 +823,20 @@ class ConnectionPool(Generic[CT], BasePool):
         if growing:
             with self._lock:
                 # Keep on growing if the pool is not full yet, or if there are
-                # clients waiting and the pool can extend.
-                if self._nconns < self._min_size or (
-                    self._nconns < self._max_size and self._waiting
-                ):
+                # clients waiting, not served by the other growing tasks, and
+                # the pool can extend.
+                if (
+                    self._nconns < self._min_size
+                    or (
+                        self._nconns < self._max_size
+                        and len(self._waiting) >= self._growing
+                    )
+                ) and (not (self._manager and self._manager._is_full())):
                     self._nconns += 1
                     logger.info("growing pool %r to %s", self.name, self._nconns)
                     self.run_task(AddConnection(self, growing=True))
                 else:
-                    self._growing = False
+                    self._stop_growing()
 
     def _return_connection(self, conn: CT, from_getconn: bool) -> None:
         """
@@ -738,6 +880,7 @@ class ConnectionPool(Generic[CT], BasePool):
         # to the state, to avoid to create a reference loop.
         # Also disable the warning for open connection in conn.__del__
         conn._pool = None
+        conn._idle_since = monotonic()
 
         # Early bailout in case the pool is closed. Don't add anything to the
         # state. There is still a remote chance that the pool will be closed
@@ -758,10 +901,12 @@ class ConnectionPool(Generic[CT], BasePool):
                 conn.close()
                 return
 
-            while self._waiting:
+            while self._waiting and len(self._pool) >= self._reserve_for(
+                self._waiting.first_priority
+            ):
                 # If there is a client waiting (which is still waiting and
-                # hasn't timed out), give it the connection and notify it.
-
+                # hasn't timed out), give it the connection and notify it,
+                # unless the connection is reserved to higher priority clients.
                 if self._waiting.popleft().set(conn):
                     break
             else:
@@ -823,7 +968,9 @@ class ConnectionPool(Generic[CT], BasePool):
             self._nconns_min = len(self._pool)
 
             # If the pool can shrink and connections were unused, drop one
-            if self._nconns > self._min_size and nconns_min > 0 and self._pool:
+            # (the one unused for the longest time, if using lifo).
+            floor = self._target_size if self.autoscale_interval else self._min_size
+            if self._nconns > floor and nconns_min > 0 and self._pool:
                 to_close = self._pool.popleft()
                 self._nconns -= 1
                 self._nconns_min -= 1
@@ -839,6 +986,108 @@ class ConnectionPool(Generic[CT], BasePool):
             to_close._pool = None
             to_close.close()
 
+    def _validate_pool(self) -> None:
+        # Take the connections unused for the longest time out of the pool.
+        with self._lock:
+            nconns = min(self.validate_batch, len(self._pool))
+            conns = [self._pool.popleft() for _ in range(nconns)]
+            if len(self._pool) < self._nconns_min:
+                self._nconns_min = len(self._pool)
+
+        good = []
+        for conn in conns:
+            self._stats[self._VALIDATIONS_NUM] += 1
+            if conn._expire_at <= monotonic():
+                logger.info("discarding expired connection %s", conn)
+                conn._pool = None
+                conn.close()
+                self.run_task(AddConnection(self))
+                continue
+
+            try:
+                (self._check or self.check_connection)(conn)
+            except Exception as ex:
+                self._stats[self._VALIDATIONS_ERRORS] += 1
+                self._stats[self._CONNECTIONS_LOST] += 1
+                logger.warning("discarding broken connection %s: %s", conn, ex)
+                conn._pool = None
+                conn.close()
+                self.run_task(AddConnection(self))
+            else:
+                good.append(conn)
+
+        # Put the connections back where they were, so that they keep their
+        # turn, unless there is some client to serve.
+        with self._lock:
+            # The pool may have been closed meanwhile, without seeing the
+            # connections out of the pool.
+            if self._closed:
+                for conn in good:
+                    conn.close()
+                return
+
+            while good and (not self._waiting):
+                self._pool.appendleft(good.pop())
+
+        for conn in good:
+            self._add_to_pool(conn)
+
+    def _autoscale(self) -> None:
+        to_close: CT | None = None
+        with self._lock:
+            target = self._update_target_size(len(self._waiting))
+
+            # Grow in steps, shrink by one connection at time.
+            ngrow = min(target - self._nconns, self._AUTOSCALE_STEP)
+            if self._manager and (room := self._manager._room()) is not None:
+                # Don't open more connections than the manager allows.
+                ngrow = min(ngrow, room)
+            if ngrow > 0:
+                self._nconns += ngrow
+                logger.info("autoscaling pool %r to %s", self.name, self._nconns)
+            elif target < self._nconns and self._pool:
+                to_close = self._pool.popleft()
+                self._nconns -= 1
+                logger.info("autoscaling pool %r to %s", self.name, self._nconns)
+
+        for i in range(ngrow):
+            self.run_task(AddConnection(self))
+
+        if to_close:
+            to_close._pool = None
+            to_close.close()
+
+    def _rotate_pool(self) -> None:
+        with self._lock:
+            if self._growing or not self._get_rotation_candidate():
+                return
+
+        # Open the new connection before closing the old one, so that the
+        # number of connections available doesn't decrease.
+        try:
+            conn = self._connect()
+        except Exception as ex:
+            logger.warning(f"error connecting in {self.name!r}: {ex}")
+            return
+
+        # The connection might have been taken by a client in the meantime:
+        # look for a candidate again.
+        with self._lock:
+            if to_close := cast("CT | None", self._get_rotation_candidate()):
+                self._pool.remove(to_close)
+
+        if not to_close:
+            logger.debug("no connection to rotate, discarding %s", conn)
+            conn._pool = None
+            conn.close()
+            return
+
+        logger.info("rotating connection %s about to expire", to_close)
+        self._stats[self._ROTATIONS_NUM] += 1
+        self._add_to_pool(conn)
+        to_close._pool = None
+        to_close.close()
+
     def _get_measures(self) -> dict[str, int]:
         rv = super()._get_measures()
         rv[self._REQUESTS_WAITING] = len(self._waiting)
@@ -1004,6 +1253,39 @@ class ShrinkPool(MaintenanceTask):
         pool._shrink_pool()
 
 
+class ValidatePool(MaintenanceTask):
+    """Check a few connections idle in the pool and replace the broken ones.
+
+    Re-schedule periodically.
+    """
+
+    def _run(self, pool: ConnectionPool[Any]) -> None:
+        pool.schedule_task(self, pool.validate_interval)
+        pool._validate_pool()
+
+
+class AutoscalePool(MaintenanceTask):
+    """Adapt the size of the pool to the load measured.
+
+    Re-schedule periodically.
+    """
+
+    def _run(self, pool: ConnectionPool[Any]) -> None:
+        pool.schedule_task(self, pool.autoscale_interval)
+        pool._autoscale()
+
+
+class RotatePool(MaintenanceTask):
+    """Replace a connection close to its expiry date with a new one.
+
+    Re-schedule periodically.
+    """
+
+    def _run(self, pool: ConnectionPool[Any]) -> None:
+        pool.schedule_task(self, pool.rotate_interval)
+        pool._rotate_pool()
+
+
 class Schedule(MaintenanceTask):
     """Schedule a task in the pool scheduler.
 
@@ -11,11 +11,11 @@ import warnings
 from abc import ABC, abstractmethod
 from time import monotonic
 from types import TracebackType
-from typing import Any, Generic, cast
+from typing import TYPE_CHECKING, Any, Generic, cast
 from weakref import ref
 from contextlib import asynccontextmanager
 from collections import deque
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 
 from psycopg import AsyncConnection
 from psycopg import errors as e
@@ -23,7 +23,7 @@ from psycopg.pq import TransactionStatus
 
 from .abc import ACT, AsyncConnectFailedCB, AsyncConnectionCB, AsyncConninfoParam
 from .abc import AsyncKwargsParam
-from .base import AttemptWithBackoff, BasePool
+from .base import AttemptWithBackoff, BasePool, WaitingQueue
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
 from ._compat import PSYCOPG_VERSION, AsyncPoolConnection, Self
 from ._acompat import ACondition, AEvent, ALock, AQueue, AWorker, agather, asleep
@@ -33,6 +33,9 @@ from .sched_async import AsyncScheduler
 if True:  # ASYNC
     import asyncio
 
+if TYPE_CHECKING:
+    from .manager_async import AsyncPoolManager
+
 logger = logging.getLogger("psycopg.pool")
 
 
@@ -60,6 +63,16 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: AsyncConnectFailedCB | None = None,
         num_workers: int = 3,
+        prepare_warmup: int = 0,
+        grow_concurrency: int = 1,
+        histograms: bool = False,
+        strategy: str = "fifo",
+        check_idle_after: float = 0.0,
+        validate_interval: float = 0.0,
+        validate_batch: int = 1,
+        rotate_interval: float = 0.0,
+        reserved: Mapping[int, int] | None = None,
+        autoscale_interval: float = 0.0,
     ):
         if close_returns and PSYCOPG_VERSION < (3, 3):
             if connection_class is AsyncConnection:
@@ -86,7 +99,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         self._sched: AsyncScheduler
         self._tasks: AQueue[MaintenanceTask]
 
-        self._waiting = deque[WaitingClient[ACT]]()
+        self._waiting = WaitingQueue[WaitingClient[ACT]]()
 
         # to notify that the pool is full
         self._pool_full_event: AEvent | None = None
@@ -94,6 +107,10 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         self._sched_runner: AWorker | None = None
         self._workers: list[AWorker] = []
 
+        # The manager providing the workers, if the pool is part of one.
+        self._manager: AsyncPoolManager | None = None
+        self._nconns_value: int
+
         super().__init__(
             min_size=min_size,
             max_size=max_size,
@@ -105,6 +122,16 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            prepare_warmup=prepare_warmup,
+            grow_concurrency=grow_concurrency,
+            histograms=histograms,
+            strategy=strategy,
+            check_idle_after=check_idle_after,
+            validate_interval=validate_interval,
+            validate_batch=validate_batch,
+            rotate_interval=rotate_interval,
+            reserved=reserved,
+            autoscale_interval=autoscale_interval,
         )
 
         if True:  # ASYNC
@@ -132,6 +159,19 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             )
             agather(*workers, timeout=5.0, timeout_hint=hint)
 
+    @property
+    def _nconns(self) -> int:
+        # Number of connections currently in the pool, out, being prepared.
+        return self._nconns_value
+
+    @_nconns.setter
+    def _nconns(self, value: int) -> None:
+        if self._manager:
+            # Keep the total of the manager up-to-date.
+            self._manager._set_pool_nconns(self, value)
+        else:
+            self._nconns_value = value
+
     def _check_open_getconn(self) -> None:
         super()._check_open_getconn()
 
@@ -194,7 +234,9 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         logger.info("pool %r is ready to use", self.name)
 
     @asynccontextmanager
-    async def connection(self, timeout: float | None = None) -> AsyncIterator[ACT]:
+    async def connection(
+        self, timeout: float | None = None, priority: int = 0
+    ) -> AsyncIterator[ACT]:
         """Context manager to obtain a connection from the pool.
 
         Return the connection immediately if available, otherwise wait up to
@@ -205,18 +247,20 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         :ref:`connection context behaviour <with-connection>` (commit/rollback
         the transaction in case of success/error). If the connection is no more
         in working state, replace it with a new one.
+
+        If the pool is exhausted, the clients with higher *priority* are
+        served first.
         """
-        conn = await self.getconn(timeout=timeout)
+        conn = await self.getconn(timeout=timeout, priority=priority)
         try:
             t0 = monotonic()
             async with conn:
                 yield conn
         finally:
             await self.putconn(conn)
-            t1 = monotonic()
-            self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
+            self._record_usage(t0)
 
-    async def getconn(self, timeout: float | None = None) -> ACT:
+    async def getconn(self, timeout: float | None = None, priority: int = 0) -> ACT:
         """Obtain a connection from the pool.
 
         You should preferably use `connection()`. Use this function only if
@@ -225,6 +269,9 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         After using this function you *must* call a corresponding `putconn()`:
         failing to do so will deplete the pool. A depleted pool is a sad pool:
         you don't want a depleted pool.
+
+        If the pool is exhausted, the clients with higher *priority* are
+        served first.
         """
         if timeout is None:
             timeout = self.timeout
@@ -236,20 +283,26 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         self._check_open_getconn()
 
         try:
-            return await self._getconn_with_check_loop(deadline)
+            conn = await self._getconn_with_check_loop(deadline, priority)
 
         # Re-raise the timeout exception presenting the user the global
         # timeout, not the per-attempt one.
         except PoolTimeout:
+            # Record the wait also here: it is the longest, when the pool is
+            # saturated.
+            self._record_wait(deadline - timeout)
             raise PoolTimeout(
                 f"couldn't get a connection after {timeout:.2f} sec"
             ) from None
 
-    async def _getconn_with_check_loop(self, deadline: float) -> ACT:
+        self._record_wait(deadline - timeout)
+        return conn
+
+    async def _getconn_with_check_loop(self, deadline: float, priority: int) -> ACT:
         attempt: AttemptWithBackoff | None = None
 
         while True:
-            conn = await self._getconn_unchecked(deadline - monotonic())
+            conn = await self._getconn_unchecked(deadline - monotonic(), priority)
             try:
                 await self._check_connection(conn)
             except Exception:
@@ -271,15 +324,15 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             else:
                 await asleep(attempt.delay)
 
-    async def _getconn_unchecked(self, timeout: float) -> ACT:
+    async def _getconn_unchecked(self, timeout: float, priority: int = 0) -> ACT:
         # Critical section: decide here if there's a connection ready
         # or if the client needs to wait.
         async with self._lock:
-            if not (conn := (await self._get_ready_connection(timeout))):
+            if not (conn := (await self._get_ready_connection(timeout, priority))):
                 # No connection available: put the client in the waiting queue
                 t0 = monotonic()
                 pos: WaitingClient[ACT] = WaitingClient()
-                self._waiting.append(pos)
+                self._waiting.append(pos, priority)
                 self._stats[self._REQUESTS_QUEUED] += 1
 
                 # If there is space for the pool to grow, let's do it
@@ -303,15 +356,17 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         conn._pool = self
         return conn
 
-    async def _get_ready_connection(self, timeout: float | None) -> ACT | None:
+    async def _get_ready_connection(
+        self, timeout: float | None, priority: int = 0
+    ) -> ACT | None:
         """Return a connection, if the client deserves one."""
         if timeout is not None and timeout <= 0.0:
             raise PoolTimeout()
 
         conn: ACT | None = None
-        if self._pool:
+        if len(self._pool) > self._reserve_for(priority):
             # Take a connection ready out of the pool
-            conn = self._pool.popleft()
+            conn = self._pool.pop() if self._lifo else self._pool.popleft()
             if len(self._pool) < self._nconns_min:
                 self._nconns_min = len(self._pool)
         elif self.max_waiting and len(self._waiting) >= self.max_waiting:
@@ -325,6 +380,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
     async def _check_connection(self, conn: ACT) -> None:
         if not self._check:
             return
+        if not self._needs_check(conn):
+            return
         try:
             await self._check(conn)
         except Exception as e:
@@ -332,13 +389,18 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             raise
 
     def _maybe_grow_pool(self) -> None:
-        # Allow only one task at time to grow the pool (or returning
-        # connections might be starved).
-        if self._nconns >= self._max_size or self._growing:
+        # Allow only grow_concurrency tasks at time to grow the pool (or
+        # returning connections might be starved). Add a new one only if there
+        # are more clients waiting than connections being added.
+        if self._nconns >= self._max_size or self._growing >= self.grow_concurrency:
+            return
+        if self._growing and len(self._waiting) <= self._growing:
+            return
+        if self._manager and self._manager._is_full():
             return
         self._nconns += 1
         logger.info("growing pool %r to %s", self.name, self._nconns)
-        self._growing = True
+        self._start_growing()
         self.run_task(AddConnection(self, growing=True))
 
     async def putconn(self, conn: ACT) -> None:
@@ -351,6 +413,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         self._check_pool_putconn(conn)
 
         logger.info("returning connection to %r", self.name)
+        await self._learn_prepared(conn)
         if await self._maybe_close_connection(conn):
             return
 
@@ -408,15 +471,21 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         # A lock has been most likely, but not necessarily, created in `open()`.
         self._ensure_lock()
 
-        # Create these objects now to attach them to the right loop.
-        # See #219
-        self._tasks = AQueue()
-        self._sched = AsyncScheduler()
+        if self._manager:
+            # Use the workers shared by all the pools of the manager.
+            self._tasks = self._manager._tasks
+            self._sched = self._manager._sched
+        else:
+            # Create these objects now to attach them to the right loop.
+            # See #219
+            self._tasks = AQueue()
+            self._sched = AsyncScheduler()
 
         self._closed = False
         self._opened = True
 
-        self._start_workers()
+        if not self._manager:
+            self._start_workers()
         self._start_initial_tasks()
 
     def _ensure_lock(self) -> None:
@@ -453,6 +522,18 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         # remained unused.
         self.run_task(Schedule(self, ShrinkPool(self), self.max_idle))
 
+        # Schedule a task to find the broken connections while idle.
+        if self.validate_interval:
+            self.run_task(Schedule(self, ValidatePool(self), self.validate_interval))
+
+        # Schedule a task to replace the connections about to expire.
+        if self.rotate_interval:
+            self.run_task(Schedule(self, RotatePool(self), self.rotate_interval))
+
+        # Schedule a task to adapt the size of the pool to the load.
+        if self.autoscale_interval:
+            self.run_task(Schedule(self, AutoscalePool(self), self.autoscale_interval))
+
     async def close(self, timeout: float = 5.0) -> None:
         """Close the pool and make it unavailable to new clients.
 
@@ -496,6 +577,10 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             await pos.fail(PoolClosed(f"the pool {self.name!r} is closed"))
 
     async def _signal_stop_worker(self) -> list[AWorker]:
+        # The workers of a manager are stopped by the manager.
+        if self._manager:
+            return []
+
         # Stop the scheduler
         await self._sched.enter(0, None)
 
@@ -606,6 +691,19 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 finally:
                     conn.autocommit = False
 
+    @staticmethod
+    async def check_socket(conn: ACT) -> None:
+        """
+        A cheap check to verify that a connection was not closed by the server.
+
+        Verify, without a round trip to the server, that the connection socket
+        is still open. If the server sent something on an idle connection
+        (for instance an error before terminating the session) fall back on
+        `check_connection()`.
+        """
+        if not AsyncConnectionPool._probe_socket(conn):
+            await AsyncConnectionPool.check_connection(conn)
+
     async def reconnect_failed(self) -> None:
         """
         Called when reconnection failed for longer than `reconnect_timeout`.
@@ -662,6 +760,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         else:
             t1 = monotonic()
             self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
+            if self._histograms:
+                self._histograms[self._CONNECTIONS_MS].record(1000.0 * (t1 - t0))
 
         conn._pool = self
 
@@ -674,10 +774,47 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                     f" {self._configure}: discarded"
                 )
 
+        conn._pool_prepared_num = 0
+        if self._prepared_keys_list:
+            await self._prewarm_connection(conn)
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
 
+    async def _prewarm_connection(self, conn: ACT) -> None:
+        """Prepare on a new connection the statements known to the pool."""
+        # Don't take the pool lock: a NullPool connects holding it.
+        keys = self._prepared_keys_list
+        async with conn.lock:
+            nprep = await conn.wait(conn._prepared.prewarm_gen(conn, keys))
+        conn._pool_prepared_num = conn._prepared.prepared_num
+        logger.debug("prepared %s statements on new connection %s", nprep, conn)
+        self._stats[self._PREPARED_WARMED] += nprep
+
+    async def _learn_prepared(self, conn: ACT) -> None:
+        """Record the statements prepared by *conn* in the pool registry.
+
+        Only do it if the connection prepared new statements since it was
+        last returned to the pool.
+        """
+        if not self.prepare_warmup:
+            return
+
+        try:
+            num = conn._prepared.prepared_num
+        except AttributeError:
+            # Prepared statements registry not available in psycopg < 3.3
+            return
+
+        if num == conn._pool_prepared_num:
+            return
+        conn._pool_prepared_num = num
+
+        keys = conn._prepared.prepared_keys()
+        async with self._lock:
+            self._add_prepared_keys(keys)
+
     async def _resolve_conninfo(self) -> str:
         """Resolve conninfo (static string, sync callable, or async callable)."""
         if callable(self.conninfo):
@@ -723,7 +860,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                     self._nconns -= 1
                     # If we have given up with a growing attempt, allow a new one.
                     if growing and self._growing:
-                        self._growing = False
+                        self._stop_growing()
                 await self.reconnect_failed()
             else:
                 attempt.update_delay(now)
@@ -737,15 +874,20 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         if growing:
             async with self._lock:
                 # Keep on growing if the pool is not full yet, or if there are
-                # clients waiting and the pool can extend.
-                if self._nconns < self._min_size or (
-                    self._nconns < self._max_size and self._waiting
-                ):
+                # clients waiting, not served by the other growing tasks, and
+                # the pool can extend.
+                if (
+                    self._nconns < self._min_size
+                    or (
+                        self._nconns < self._max_size
+                        and len(self._waiting) >= self._growing
+                    )
+                ) and not (self._manager and self._manager._is_full()):
                     self._nconns += 1
                     logger.info("growing pool %r to %s", self.name, self._nconns)
                     self.run_task(AddConnection(self, growing=True))
                 else:
-                    self._growing = False
+                    self._stop_growing()
 
     async def _return_connection(self, conn: ACT, from_getconn: bool) -> None:
         """
@@ -791,6 +933,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         # to the state, to avoid to create a reference loop.
         # Also disable the warning for open connection in conn.__del__
         conn._pool = None
+        conn._idle_since = monotonic()
 
         # Early bailout in case the pool is closed. Don't add anything to the
         # state. There is still a remote chance that the pool will be closed
@@ -812,10 +955,12 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 await conn.close()
                 return
 
-            while self._waiting:
+            while self._waiting and len(self._pool) >= self._reserve_for(
+                self._waiting.first_priority
+            ):
                 # If there is a client waiting (which is still waiting and
-                # hasn't timed out), give it the connection and notify it.
-
+                # hasn't timed out), give it the connection and notify it,
+                # unless the connection is reserved to higher priority clients.
                 if await self._waiting.popleft().set(conn):
                     break
             else:
@@ -880,7 +1025,9 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             self._nconns_min = len(self._pool)
 
             # If the pool can shrink and connections were unused, drop one
-            if self._nconns > self._min_size and nconns_min > 0 and self._pool:
+            # (the one unused for the longest time, if using lifo).
+            floor = self._target_size if self.autoscale_interval else self._min_size
+            if self._nconns > floor and nconns_min > 0 and self._pool:
                 to_close = self._pool.popleft()
                 self._nconns -= 1
                 self._nconns_min -= 1
@@ -897,6 +1044,108 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             to_close._pool = None
             await to_close.close()
 
+    async def _validate_pool(self) -> None:
+        # Take the connections unused for the longest time out of the pool.
+        async with self._lock:
+            nconns = min(self.validate_batch, len(self._pool))
+            conns = [self._pool.popleft() for _ in range(nconns)]
+            if len(self._pool) < self._nconns_min:
+                self._nconns_min = len(self._pool)
+
+        good = []
+        for conn in conns:
+            self._stats[self._VALIDATIONS_NUM] += 1
+            if conn._expire_at <= monotonic():
+                logger.info("discarding expired connection %s", conn)
+                conn._pool = None
+                await conn.close()
+                self.run_task(AddConnection(self))
+                continue
+
+            try:
+                await (self._check or self.check_connection)(conn)
+            except Exception as ex:
+                self._stats[self._VALIDATIONS_ERRORS] += 1
+                self._stats[self._CONNECTIONS_LOST] += 1
+                logger.warning("discarding broken connection %s: %s", conn, ex)
+                conn._pool = None
+                await conn.close()
+                self.run_task(AddConnection(self))
+            else:
+                good.append(conn)
+
+        # Put the connections back where they were, so that they keep their
+        # turn, unless there is some client to serve.
+        async with self._lock:
+            # The pool may have been closed meanwhile, without seeing the
+            # connections out of the pool.
+            if self._closed:
+                for conn in good:
+                    await conn.close()
+                return
+
+            while good and not self._waiting:
+                self._pool.appendleft(good.pop())
+
+        for conn in good:
+            await self._add_to_pool(conn)
+
+    async def _autoscale(self) -> None:
+        to_close: ACT | None = None
+        async with self._lock:
+            target = self._update_target_size(len(self._waiting))
+
+            # Grow in steps, shrink by one connection at time.
+            ngrow = min(target - self._nconns, self._AUTOSCALE_STEP)
+            if self._manager and (room := self._manager._room()) is not None:
+                # Don't open more connections than the manager allows.
+                ngrow = min(ngrow, room)
+            if ngrow > 0:
+                self._nconns += ngrow
+                logger.info("autoscaling pool %r to %s", self.name, self._nconns)
+            elif target < self._nconns and self._pool:
+                to_close = self._pool.popleft()
+                self._nconns -= 1
+                logger.info("autoscaling pool %r to %s", self.name, self._nconns)
+
+        for i in range(ngrow):
+            self.run_task(AddConnection(self))
+
+        if to_close:
+            to_close._pool = None
+            await to_close.close()
+
+    async def _rotate_pool(self) -> None:
+        async with self._lock:
+            if self._growing or not self._get_rotation_candidate():
+                return
+
+        # Open the new connection before closing the old one, so that the
+        # number of connections available doesn't decrease.
+        try:
+            conn = await self._connect()
+        except Exception as ex:
+            logger.warning(f"error connecting in {self.name!r}: {ex}")
+            return
+
+        # The connection might have been taken by a client in the meantime:
+        # look for a candidate again.
+        async with self._lock:
+            if to_close := cast("ACT | None", self._get_rotation_candidate()):
+                self._pool.remove(to_close)
+
+        if not to_close:
+            logger.debug("no connection to rotate, discarding %s", conn)
+            conn._pool = None
+            await conn.close()
+            return
+
+        logger.info("rotating connection %s about to expire", to_close)
+        self._stats[self._ROTATIONS_NUM] += 1
+        await self._add_to_pool(conn)
+        to_close._pool = None
+        await to_close.close()
+
     def _get_measures(self) -> dict[str, int]:
         rv = super()._get_measures()
         rv[self._REQUESTS_WAITING] = len(self._waiting)
@@ -1061,6 +1310,39 @@ class ShrinkPool(MaintenanceTask):
         await pool._shrink_pool()
 
 
+class ValidatePool(MaintenanceTask):
+    """Check a few connections idle in the pool and replace the broken ones.
+
+    Re-schedule periodically.
+    """
+
+    async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
+        await pool.schedule_task(self, pool.validate_interval)
+        await pool._validate_pool()
+
+
+class AutoscalePool(MaintenanceTask):
+    """Adapt the size of the pool to the load measured.
+
+    Re-schedule periodically.
+    """
+
+    async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
+        await pool.schedule_task(self, pool.autoscale_interval)
+        await pool._autoscale()
+
+
+class RotatePool(MaintenanceTask):
+    """Replace a connection close to its expiry date with a new one.
+
+    Re-schedule periodically.
+    """
+
+    async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
+        await pool.schedule_task(self, pool.rotate_interval)
+        await pool._rotate_pool()
+
+
 class Schedule(MaintenanceTask):
     """Schedule a task in the pool scheduler.
 
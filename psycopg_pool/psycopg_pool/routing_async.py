@@ -0,0 +1,404 @@
+"""
+Psycopg routing pool module (async version).
+"""
+
+# Copyright (C) 2025 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+from time import monotonic
+from types import TracebackType
+from typing import Any
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Sequence
+
+from psycopg import errors as e
+from psycopg.pq import TransactionStatus
+
+from .errors import PoolClosed, PoolTimeout, TooManyRequests
+from ._compat import Self
+from ._acompat import ALock, AWorker, agather, aspawn
+from .pool_async import AsyncConnectionPool
+
+logger = logging.getLogger("psycopg.pool")
+
+
+class AsyncRoutingPool:
+    """
+    A pool routing the connection requests to a primary server and its replicas.
+
+    Keep a pool for each server: serve the read-write requests from the
+    primary and spread the read-only requests across the replicas.
+    """
+
+    # Used to generate pool names
+    _num_pool = 0
+
+    def __init__(
+        self,
+        conninfo: Sequence[str],
+        *,
+        pool_class: type[AsyncConnectionPool[Any]] = AsyncConnectionPool,
+        pool_kwargs: dict[str, Any] | None = None,
+        failover_timeout: float = 5.0,
+        retry_interval: float = 10.0,
+        name: str | None = None,
+    ):
+        if not conninfo:
+            raise ValueError("at least one conninfo is required")
+
+        if not name:
+            num = AsyncRoutingPool._num_pool = AsyncRoutingPool._num_pool + 1
+            name = f"routing-{num}"
+
+        self.name = name
+        self.failover_timeout = failover_timeout
+        self.retry_interval = retry_interval
+
+        pool_kwargs = pool_kwargs or {}
+        self._hosts = [
+            _Host(pool_class(ci, open=False, name=f"{name}-{i}", **pool_kwargs))
+            for i, ci in enumerate(conninfo)
+        ]
+        # Used to choose in turn among replicas with the same usage
+        self._nreq = 0
+
+        # The task detecting the role of the servers, if running, and the time
+        # after which to check the replicas again if there is no primary
+        self._checker: AWorker | None = None
+        self._recheck_at = 0.0
+
+        self._lock: ALock
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__module__}.{self.__class__.__name__}"
+            f" {self.name!r} at 0x{id(self):x}>"
+        )
+
+    @property
+    def closed(self) -> bool:
+        """`!True` if the pool is closed."""
+        return self._hosts[0].pool.closed
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def open(self, wait: bool = False, timeout: float = 30.0) -> None:
+        """Open the pools of all the servers.
+
+        If *wait* is `!True`, wait for the pools to be filled and detect the
+        role of the servers before returning.
+        """
+        try:
+            self._lock
+        except AttributeError:
+            self._lock = ALock()
+
+        for host in self._hosts:
+            await host.pool.open()
+
+        if wait:
+            for host in self._hosts:
+                await host.pool.wait(timeout=timeout)
+            await self.refresh()
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Close the pools of all the servers."""
+        for host in self._hosts:
+            await host.pool.close(timeout=timeout)
+        if checker := self._checker:
+            await agather(checker, timeout=timeout)
+
+    async def refresh(self) -> None:
+        """Detect again which server is the primary and which are replicas."""
+        # Let a check already running finish, before forgetting the roles.
+        if checker := self._checker:
+            await agather(checker)
+        async with self._lock:
+            for host in self._hosts:
+                host.primary = None
+                host.down_until = 0.0
+            self._recheck_at = 0.0
+            checker = self._start_check()
+        if checker:
+            await agather(checker)
+
+    @asynccontextmanager
+    async def connection(
+        self, readonly: bool = False, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        """Context manager to obtain a connection from one of the servers.
+
+        If *readonly* is `!False`, return a connection to the primary server.
+        Otherwise, return a connection to the replica with the least
+        connections in use, or to the primary if no replica is available; in
+        this case, the connection is `~psycopg.Connection.read_only` until it
+        is returned.
+
+        If a server doesn't provide a connection within `!failover_timeout`,
+        try with the next one; wait up to *timeout* on the last one.
+        """
+        if self.closed:
+            raise PoolClosed(f"the pool {self.name!r} is closed")
+
+        host, conn = await self._getconn(readonly, timeout)
+        # A read-only request served by the primary must not write.
+        fallback = readonly and host.primary is not False
+        t0 = monotonic()
+        try:
+            if fallback:
+                read_only = conn.read_only
+                await conn.set_read_only(True)
+            async with conn:
+                yield conn
+        finally:
+            if fallback:
+                await self._restore_read_only(conn, read_only)
+            async with self._lock:
+                host.outstanding -= 1
+            await host.pool.putconn(conn)
+            # Account the usage to the server pool, as its connection() does.
+            host.pool._record_usage(t0)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return current stats about the servers.
+        """
+        now = monotonic()
+        up = [h for h in self._hosts if h.down_until <= now]
+        return {
+            "servers_num": len(self._hosts),
+            "servers_up": len(up),
+            "primary_num": sum(h.primary is True for h in up),
+            "replicas_num": sum(h.primary is False for h in up),
+        }
+
+    async def _getconn(
+        self, readonly: bool, timeout: float | None, retry: bool = True
+    ) -> tuple[_Host, Any]:
+        async with self._lock:
+            candidates = self._candidates(readonly)
+            # Detect the roles not known in the background, not to keep the
+            # requests to the servers already known waiting.
+            checker = self._start_check()
+
+        if not candidates and checker:
+            await agather(checker)
+            async with self._lock:
+                candidates = self._candidates(readonly)
+
+        if not candidates:
+            raise e.OperationalError(
+                f"no {'server' if readonly else 'primary server'} available"
+                f" in {self.name!r}"
+            )
+
+        for i, host in enumerate(candidates):
+            last = i == len(candidates) - 1
+            try:
+                conn = await host.pool.getconn(
+                    timeout=timeout if last else self.failover_timeout
+                )
+            except Exception as ex:
+                logger.warning("failed to get a connection from %r: %s", host, ex)
+                async with self._lock:
+                    if self._is_down(host, ex):
+                        self._mark_down(host)
+                if last:
+                    raise
+                continue
+
+            if not readonly and self._in_hot_standby(conn):
+                # The primary is now a replica: look for the new one.
+                logger.warning("the primary server %r is now a replica", host)
+                await host.pool.putconn(conn)
+                async with self._lock:
+                    host.primary = False
+                    self._recheck_at = 0.0
+                if retry:
+                    return await self._getconn(readonly, timeout, retry=False)
+                raise e.OperationalError(
+                    f"no primary server available in {self.name!r}"
+                )
+
+            async with self._lock:
+                host.outstanding += 1
+            return host, conn
+
+        assert False, "unreachable"
+
+    def _candidates(self, readonly: bool) -> list[_Host]:
+        """Return the servers to use, in order of preference."""
+        now = monotonic()
+        up = [h for h in self._hosts if h.down_until <= now]
+        primaries = [h for h in up if h.primary]
+        if not readonly:
+            return primaries[:1]
+
+        # Rotate the replicas before sorting them, so that the ones with the
+        # same usage are used in turn.
+        replicas = [h for h in up if h.primary is False]
+        if replicas:
+            self._nreq += 1
+            n = self._nreq % len(replicas)
+            replicas = replicas[n:] + replicas[:n]
+            replicas.sort(key=lambda h: h.outstanding)
+        return replicas + primaries
+
+    def _start_check(self) -> AWorker | None:
+        """Start detecting the role of the servers, if needed.
+
+        Return the task detecting the roles, if any is running.
+
+        Must be called with the lock held.
+        """
+        if self._checker or not self._to_check():
+            return self._checker
+        self._checker = aspawn(self._check_roles, name=f"{self.name}-check")
+        return self._checker
+
+    def _to_check(self) -> list[_Host]:
+        """Return the servers whose role should be detected.
+
+        These are the servers not down whose role is not known and, if the
+        primary is not known, the replicas too, as one may have been promoted.
+        """
+        now = monotonic()
+        up = [h for h in self._hosts if h.down_until <= now]
+        if any(h.primary for h in up) or now < self._recheck_at:
+            return [h for h in up if h.primary is None]
+        else:
+            return up
+
+    async def _check_roles(self) -> None:
+        """Detect the role of the servers to check, concurrently."""
+        try:
+            async with self._lock:
+                hosts = self._to_check()
+            await agather(*(aspawn(self._check_role, args=(h,)) for h in hosts))
+        finally:
+            async with self._lock:
+                self._checker = None
+                if not any(h.primary for h in self._hosts):
+                    # Don't check the replicas at every request.
+                    self._recheck_at = monotonic() + self.retry_interval
+
+    async def _check_role(self, host: _Host) -> None:
+        """Detect the role of a server, or mark it down if it fails."""
+        try:
+            conn = await host.pool.getconn(timeout=self.failover_timeout)
+        except Exception as ex:
+            logger.warning("failed to check the role of %r: %s", host, ex)
+            async with self._lock:
+                if self._is_down(host, ex):
+                    self._mark_down(host)
+            return
+
+        try:
+            primary = not await self._is_standby(conn)
+        except Exception as ex:
+            logger.warning("failed to check the role of %r: %s", host, ex)
+            async with self._lock:
+                if self._is_down(host, ex):
+                    self._mark_down(host)
+            return
+        finally:
+            await host.pool.putconn(conn)
+
+        async with self._lock:
+            host.primary = primary
+            logger.info("server %r role: %s", host, host.role)
+            if primary and sum(h.primary is True for h in self._hosts) > 1:
+                logger.warning("more than one primary server in %r", self.name)
+
+    def _is_down(self, host: _Host, ex: Exception) -> bool:
+        """Return `!True` if the error *ex* means that *host* is not reachable.
+
+        A pool timing out with connections in use is only busy. Must be called
+        with the lock held.
+        """
+        if isinstance(ex, TooManyRequests):
+            return False
+        if isinstance(ex, PoolTimeout):
+            return not host.outstanding
+        return isinstance(ex, e.OperationalError)
+
+    def _mark_down(self, host: _Host) -> None:
+        """Exclude a server for retry_interval, until its role is checked again.
+
+        If the server was the primary, the role of the replicas will be checked
+        again, as one of them may be promoted.
+        """
+        if host.primary:
+            self._recheck_at = 0.0
+        host.primary = None
+        host.down_until = monotonic() + self.retry_interval
+
+    async def _restore_read_only(self, conn: Any, value: bool | None) -> None:
+        """Restore the read_only state of a connection, or discard it."""
+        if conn.pgconn.transaction_status == TransactionStatus.IDLE:
+            try:
+                await conn.set_read_only(value)
+                return
+            except Exception as ex:
+                logger.warning("failed to restore read-only state: %s", ex)
+
+        # Don't let the connection be used for read-write requests.
+        await conn.close()
+
+    @staticmethod
+    def _in_hot_standby(conn: Any) -> bool | None:
+        """Return the recovery state of the server, if reported.
+
+        The state is reported, without a round trip, from PostgreSQL 14.
+        """
+        if (status := conn.info.parameter_status("in_hot_standby")) is None:
+            return None
+        return bool(status == "on")
+
+    async def _is_standby(self, conn: Any) -> bool:
+        if (rv := self._in_hot_standby(conn)) is not None:
+            return rv
+
+        try:
+            cur = await conn.execute("select pg_is_in_recovery()")
+            return bool(row[0]) if (row := await cur.fetchone()) else False
+        finally:
+            # Don't leave a transaction open on the connection.
+            if not conn.autocommit:
+                await conn.rollback()
+
+
+class _Host:
+    """The state of a server in a routing pool."""
+
+    __slots__ = ("pool", "primary", "down_until", "outstanding")
+
+    def __init__(self, pool: AsyncConnectionPool[Any]):
+        self.pool = pool
+        # True if primary, False if replica, None if unknown
+        self.primary: bool | None = None
+        # Time until the server is not used because of a failure
+        self.down_until = 0.0
+        # Number of connections of the server in use
+        self.outstanding = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.pool.name!r} {self.role}>"
+
+    @property
+    def role(self) -> str:
+        if self.primary is None:
+            return "unknown"
+        return "primary" if self.primary else "replica"
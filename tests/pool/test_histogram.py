@@ -0,0 +1,54 @@
+from math import inf
+
+try:
+    from psycopg_pool import Histogram
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+def test_empty():
+    h = Histogram()
+    assert h.count == 0
+    assert h.percentile(50) == 0.0
+    assert h.percentile(99) == 0.0
+    assert all(n == 0 for _, n in h.buckets())
+
+
+def test_record():
+    h = Histogram()
+    for ms in [0.5, 3, 3, 4, 150, 150, 900, 70_000]:
+        h.record(ms)
+
+    assert h.count == 8
+    assert h.total_ms == 71_210.5
+    assert h.max_ms == 70_000
+    buckets = dict(h.buckets())
+    assert buckets[1] == 1
+    assert buckets[5] == 3
+    assert buckets[200] == 2
+    assert buckets[1000] == 1
+    assert buckets[inf] == 1
+    assert sum(buckets.values()) == 8
+
+
+def test_percentile():
+    h = Histogram()
+    for i in range(100):
+        h.record(3 if i < 90 else 150)
+
+    assert h.percentile(50) == 5
+    assert h.percentile(90) == 5
+    assert h.percentile(91) == 150
+    assert h.percentile(99) == 150
+    assert h.percentile(100) == 150
+
+
+def test_copy():
+    h = Histogram()
+    h.record(10)
+    h2 = h.copy()
+    h.record(10)
+    assert h.count == 2
+    assert h2.count == 1
+    assert dict(h2.buckets())[10] == 1
@@ -0,0 +1,173 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'test_manager_async.py'
+# DO NOT CHANGE! Change the original file instead.
+from __future__ import annotations
+
+import pytest
+
+from ..acompat import sleep
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+def test_connection(dsn):
+    keys = []
+
+    def conninfo(key):
+        keys.append(key)
+        return f"{dsn} application_name={key}"
+
+    with pool.PoolManager(conninfo, pool_kwargs={"min_size": 1}) as m:
+        for key in ["foo", "bar", "foo"]:
+            with m.connection(key) as conn:
+                cur = conn.execute("show application_name")
+                assert cur.fetchone() == (key,)
+
+        assert keys == ["foo", "bar"]
+        assert m.get_stats()["pools_open"] == 2
+
+
+def test_shared_workers(dsn):
+    with pool.PoolManager(lambda key: dsn, num_workers=2) as m:
+        p1 = m.get_pool(1)
+        p2 = m.get_pool(2)
+        assert p1 is not p2
+        assert p1 is m.get_pool(1)
+        assert len(m._workers) == 2
+        for p in (p1, p2):
+            assert not p._workers
+            assert p._sched is m._sched
+            p.wait()
+
+    assert m.closed
+    assert p1.closed and p2.closed
+    assert not m._workers
+
+
+def test_closed(dsn):
+    m = pool.PoolManager(lambda key: dsn)
+    with pytest.raises(pool.PoolClosed):
+        m.get_pool(1)
+
+    m.open()
+    m.close()
+    with pytest.raises(pool.PoolClosed):
+        with m.connection(1):
+            pass
+    with pytest.raises(pool.PoolClosed):
+        m.open()
+
+
+@pytest.mark.slow
+def test_max_connections(dsn):
+    with pool.PoolManager(
+        lambda key: dsn, max_connections=2, pool_kwargs={"min_size": 1, "max_size": 2}
+    ) as m:
+        for key in (1, 2):
+            m.get_pool(key).wait()
+
+        with m.connection(1), m.connection(2):
+            with pytest.raises(pool.PoolTimeout):
+                with m.connection(1, timeout=0.5):
+                    pass
+            with pytest.raises(pool.TooManyRequests):
+                m.get_pool(3)
+
+        # Make room for a new pool closing an unused one.
+        with m.connection(3):
+            pass
+
+        stats = m.get_stats()
+        assert stats["pools_open"] == 2
+        assert stats["pools_evicted"] == 1
+        assert stats["pool_size"] == 2
+
+
+def test_evict_open_error(dsn):
+
+    class FailingPool(pool.ConnectionPool):
+
+        def open(self, *args, **kwargs):
+            if self.name.endswith("-2"):
+                raise ZeroDivisionError
+            super().open(*args, **kwargs)
+
+    with pool.PoolManager(
+        lambda key: dsn,
+        pool_class=FailingPool,
+        max_connections=1,
+        pool_kwargs={"min_size": 1},
+    ) as m:
+        p1 = m.get_pool(1)
+        p1.wait()
+        with pytest.raises(ZeroDivisionError):
+            m.get_pool(2)
+
+        # The pool evicted to make room is closed anyway.
+        assert p1.closed
+        stats = m.get_stats()
+        assert stats["pools_open"] == 0
+        assert stats["pools_evicted"] == 1
+        assert stats["pool_size"] == 0
+
+
+def test_autoscale_max_connections(dsn, monkeypatch):
+    with pool.PoolManager(
+        lambda key: dsn,
+        max_connections=2,
+        pool_kwargs={"min_size": 1, "max_size": 8, "autoscale_interval": 60},
+    ) as m:
+        p = m.get_pool(1)
+        p.wait()
+        monkeypatch.setattr(p, "_update_target_size", lambda nwaiting: 8)
+        p._autoscale()
+        assert p._nconns == 2
+        assert m.get_stats()["pool_size"] == 2
+
+        # The manager is full: the pool doesn't grow anymore.
+        p._autoscale()
+        assert p._nconns == 2
+
+
+def test_pool_size(dsn):
+    with pool.PoolManager(
+        lambda key: dsn, pool_kwargs={"min_size": 1, "max_size": 3}
+    ) as m:
+        p1 = m.get_pool(1)
+        p2 = m.get_pool(2)
+        assert m.get_stats()["pool_size"] == 2
+
+        with p1.connection(), p1.connection(), p2.connection():
+            assert p1._nconns >= 2
+            assert m.get_stats()["pool_size"] == p1._nconns + p2._nconns
+
+        p1.resize(3)
+        assert m.get_stats()["pool_size"] == p1._nconns + p2._nconns
+
+    assert m.get_stats()["pool_size"] == 0
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+def test_evict_idle(dsn):
+    with pool.PoolManager(
+        lambda key: dsn, max_idle=0.2, pool_kwargs={"min_size": 1}
+    ) as m:
+        with m.connection(1):
+            sleep(0.5)
+        assert m.get_stats()["pools_open"] == 1
+
+        sleep(0.5)
+        stats = m.get_stats()
+        assert stats["pools_open"] == 0
+        assert stats["pools_evicted"] == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"num_workers": 0}, {"max_connections": -1}])
+def test_bad_params(dsn, kwargs):
+    with pytest.raises(ValueError):
+        pool.PoolManager(lambda key: dsn, **kwargs)
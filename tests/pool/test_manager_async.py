@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import pytest
+
+from ..acompat import asleep
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+if True:  # ASYNC
+    pytestmark = [pytest.mark.anyio]
+
+
+async def test_connection(dsn):
+    keys = []
+
+    def conninfo(key):
+        keys.append(key)
+        return f"{dsn} application_name={key}"
+
+    async with pool.AsyncPoolManager(conninfo, pool_kwargs={"min_size": 1}) as m:
+        for key in ["foo", "bar", "foo"]:
+            async with m.connection(key) as conn:
+                cur = await conn.execute("show application_name")
+                assert await cur.fetchone() == (key,)
+
+        assert keys == ["foo", "bar"]
+        assert m.get_stats()["pools_open"] == 2
+
+
+async def test_shared_workers(dsn):
+    async with pool.AsyncPoolManager(lambda key: dsn, num_workers=2) as m:
+        p1 = await m.get_pool(1)
+        p2 = await m.get_pool(2)
+        assert p1 is not p2
+        assert p1 is await m.get_pool(1)
+        assert len(m._workers) == 2
+        for p in (p1, p2):
+            assert not p._workers
+            assert p._sched is m._sched
+            await p.wait()
+
+    assert m.closed
+    assert p1.closed and p2.closed
+    assert not m._workers
+
+
+async def test_closed(dsn):
+    m = pool.AsyncPoolManager(lambda key: dsn)
+    with pytest.raises(pool.PoolClosed):
+        await m.get_pool(1)
+
+    await m.open()
+    await m.close()
+    with pytest.raises(pool.PoolClosed):
+        async with m.connection(1):
+            pass
+    with pytest.raises(pool.PoolClosed):
+        await m.open()
+
+
+@pytest.mark.slow
+async def test_max_connections(dsn):
+    async with pool.AsyncPoolManager(
+        lambda key: dsn,
+        max_connections=2,
+        pool_kwargs={"min_size": 1, "max_size": 2},
+    ) as m:
+        for key in (1, 2):
+            await (await m.get_pool(key)).wait()
+
+        async with m.connection(1), m.connection(2):
+            with pytest.raises(pool.PoolTimeout):
+                async with m.connection(1, timeout=0.5):
+                    pass
+            with pytest.raises(pool.TooManyRequests):
+                await m.get_pool(3)
+
+        # Make room for a new pool closing an unused one.
+        async with m.connection(3):
+            pass
+
+        stats = m.get_stats()
+        assert stats["pools_open"] == 2
+        assert stats["pools_evicted"] == 1
+        assert stats["pool_size"] == 2
+
+
+async def test_evict_open_error(dsn):
+    class FailingPool(pool.AsyncConnectionPool):
+        async def open(self, *args, **kwargs):
+            if self.name.endswith("-2"):
+                raise ZeroDivisionError
+            await super().open(*args, **kwargs)
+
+    async with pool.AsyncPoolManager(
+        lambda key: dsn,
+        pool_class=FailingPool,
+        max_connections=1,
+        pool_kwargs={"min_size": 1},
+    ) as m:
+        p1 = await m.get_pool(1)
+        await p1.wait()
+        with pytest.raises(ZeroDivisionError):
+            await m.get_pool(2)
+
+        # The pool evicted to make room is closed anyway.
+        assert p1.closed
+        stats = m.get_stats()
+        assert stats["pools_open"] == 0
+        assert stats["pools_evicted"] == 1
+        assert stats["pool_size"] == 0
+
+
+async def test_autoscale_max_connections(dsn, monkeypatch):
+    async with pool.AsyncPoolManager(
+        lambda key: dsn,
+        max_connections=2,
+        pool_kwargs={"min_size": 1, "max_size": 8, "autoscale_interval": 60},
+    ) as m:
+        p = await m.get_pool(1)
+        await p.wait()
+        monkeypatch.setattr(p, "_update_target_size", lambda nwaiting: 8)
+        await p._autoscale()
+        assert p._nconns == 2
+        assert m.get_stats()["pool_size"] == 2
+
+        # The manager is full: the pool doesn't grow anymore.
+        await p._autoscale()
+        assert p._nconns == 2
+
+
+async def test_pool_size(dsn):
+    async with pool.AsyncPoolManager(
+        lambda key: dsn, pool_kwargs={"min_size": 1, "max_size": 3}
+    ) as m:
+        p1 = await m.get_pool(1)
+        p2 = await m.get_pool(2)
+        assert m.get_stats()["pool_size"] == 2
+
+        async with p1.connection(), p1.connection(), p2.connection():
+            assert p1._nconns >= 2
+            assert m.get_stats()["pool_size"] == p1._nconns + p2._nconns
+
+        await p1.resize(3)
+        assert m.get_stats()["pool_size"] == p1._nconns + p2._nconns
+
+    assert m.get_stats()["pool_size"] == 0
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_evict_idle(dsn):
+    async with pool.AsyncPoolManager(
+        lambda key: dsn, max_idle=0.2, pool_kwargs={"min_size": 1}
+    ) as m:
+        async with m.connection(1):
+            await asleep(0.5)
+        assert m.get_stats()["pools_open"] == 1
+
+        await asleep(0.5)
+        stats = m.get_stats()
+        assert stats["pools_open"] == 0
+        assert stats["pools_evicted"] == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"num_workers": 0}, {"max_connections": -1}])
+async def test_bad_params(dsn, kwargs):
+    with pytest.raises(ValueError):
+        pool.AsyncPoolManager(lambda key: dsn, **kwargs)
@@ -17,7 +17,7 @@ from psycopg.rows import Row, TupleRow, class_row
 
 from ..utils import assert_type, set_autocommit
 from ..acompat import Event, gather, skip_sync, sleep, spawn
-from .test_pool_common import delay_connection
+from .test_pool_common import delay_connection, ensure_waiting
 
 try:
     import psycopg_pool as pool
@@ -448,6 +448,82 @@ def test_grow(dsn, monkeypatch, min_size, want_times):
         assert got == pytest.approx(want, 0.1), times
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+def test_grow_concurrency(dsn, monkeypatch):
+    delay_connection(monkeypatch, 0.2)
+
+    def worker(n):
+        t0 = time()
+        with p.connection() as conn:
+            conn.execute("select 1 from pg_sleep(0.2)")
+        t1 = time()
+        results.append((n, t1 - t0))
+
+    with pool.ConnectionPool(
+        dsn, min_size=1, max_size=5, num_workers=4, grow_concurrency=4
+    ) as p:
+        p.wait(1.0)
+        results: list[tuple[int, float]] = []
+        ts = [spawn(worker, args=(i,)) for i in range(5)]
+        gather(*ts)
+        stats = p.get_stats()
+
+    # Growing one connection at time the last client would have waited 0.8s
+    times = [item[1] for item in results]
+    assert max(times) < 0.6, times
+    assert stats["pool_size"] == 5
+    assert stats["refills_num"] >= 1
+    assert 150 <= stats["refills_ms"] < 600
+
+
+def test_grow_concurrency_bad(dsn):
+    with pytest.raises(ValueError):
+        pool.ConnectionPool(dsn, grow_concurrency=0, open=False)
+
+
+@pytest.mark.parametrize("strategy", ["fifo", "lifo"])
+def test_strategy(dsn, strategy):
+    with pool.ConnectionPool(dsn, min_size=3, strategy=strategy) as p:
+        p.wait()
+        pids = []
+        for i in range(3):
+            with p.connection() as conn:
+                pids.append(conn.info.backend_pid)
+
+    if strategy == "lifo":
+        assert len(set(pids)) == 1
+    else:
+        assert len(set(pids)) == 3
+
+
+def test_strategy_bad(dsn):
+    with pytest.raises(ValueError, match="strategy"):
+        pool.ConnectionPool(dsn, strategy="random", open=False)
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+def test_shrink_lifo(dsn):
+    with pool.ConnectionPool(
+        dsn, min_size=1, max_size=3, max_idle=0.3, strategy="lifo"
+    ) as p:
+        p.wait()
+        with p.connection(), p.connection(), p.connection():
+            pass
+        assert p.get_stats()["pool_size"] == 3
+
+        # Using the connections one at time, the other ones can be shrunk.
+        t0 = time()
+        while time() - t0 < 1.2:
+            with p.connection() as conn:
+                conn.execute("select 1")
+            sleep(0.02)
+
+        stats = p.get_stats()
+        assert stats["pool_size"] == 1
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 def test_shrink(dsn, monkeypatch):
@@ -824,6 +900,131 @@ def test_getconn_check(dsn, caplog, autocommit):
     assert not caplog.records
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+def test_check_idle_after(dsn):
+    checked = 0
+
+    def check(conn):
+        nonlocal checked
+        checked += 1
+
+    with pool.ConnectionPool(dsn, min_size=1, check=check, check_idle_after=0.2) as p:
+        p.wait()
+        with p.connection():
+            pass
+        with p.connection():
+            pass
+        assert checked == 0
+
+        sleep(0.3)
+        with p.connection():
+            pass
+        assert checked == 1
+
+
+def test_check_idle_after_bad(dsn):
+    with pytest.raises(ValueError, match="check_idle_after"):
+        pool.ConnectionPool(dsn, check_idle_after=-1, open=False)
+
+
+@pytest.mark.crdb_skip("pg_terminate_backend")
+def test_check_socket(dsn):
+    with psycopg.Connection.connect(dsn) as conn:
+        pool.ConnectionPool.check_socket(conn)
+
+        with psycopg.Connection.connect(dsn) as conn2:
+            conn2.execute("select pg_terminate_backend(%s)", [conn.info.backend_pid])
+        sleep(0.1)
+        with pytest.raises(psycopg.OperationalError):
+            pool.ConnectionPool.check_socket(conn)
+
+    with pytest.raises(psycopg.OperationalError):
+        pool.ConnectionPool.check_socket(conn)
+
+
+@pytest.mark.crdb_skip("pg_terminate_backend")
+def test_getconn_check_socket(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    with pool.ConnectionPool(
+        dsn, min_size=2, check=pool.ConnectionPool.check_socket
+    ) as p:
+        p.wait(1.0)
+        with p.connection() as conn:
+            with p.connection() as conn2:
+                pid2 = conn2.info.backend_pid
+            conn.execute("select pg_terminate_backend(%s)", [pid2])
+
+        sleep(0.1)
+        with p.connection() as conn:
+            with p.connection() as conn2:
+                conn.execute("select 1")
+                conn2.execute("select 1")
+                pids = {c.info.backend_pid for c in [conn, conn2]}
+
+    assert pid2 not in pids
+    assert not caplog.records
+
+
+@pytest.mark.slow
+@pytest.mark.crdb_skip("pg_terminate_backend")
+def test_validate(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    with pool.ConnectionPool(
+        dsn, min_size=2, validate_interval=0.1, validate_batch=2
+    ) as p:
+        p.wait()
+        with p.connection() as conn, p.connection() as conn2:
+            pid2 = conn2.info.backend_pid
+            conn.execute("select pg_terminate_backend(%s)", [pid2])
+
+        sleep(0.5)
+        stats = p.get_stats()
+        assert stats["validations_num"] >= 4
+        assert stats["validations_errors"] == 1
+        assert stats["connections_lost"] == 1
+
+        with p.connection() as conn, p.connection() as conn2:
+            pids = {c.info.backend_pid for c in [conn, conn2]}
+            assert pid2 not in pids
+
+    assert len(caplog.records) == 1
+    assert "broken" in caplog.records[0].message
+
+
+@pytest.mark.slow
+def test_validate_close(dsn):
+    checked: list[psycopg.Connection[Any]] = []
+
+    def check(conn):
+        checked.append(conn)
+        sleep(0.3)
+
+    p = pool.ConnectionPool(
+        dsn,
+        min_size=2,
+        check=check,
+        validate_interval=0.1,
+        validate_batch=2,
+        open=False,
+    )
+    p.open(wait=True)
+    sleep(0.2)
+    assert checked
+
+    # The connections being validated are closed with the pool.
+    p.close()
+    assert all(conn.closed for conn in checked)
+
+
+@pytest.mark.parametrize("kwargs", [{"validate_interval": -1}, {"validate_batch": 0}])
+def test_validate_bad(dsn, kwargs):
+    with pytest.raises(ValueError, match=list(kwargs)[0]):
+        pool.ConnectionPool(dsn, open=False, **kwargs)
+
+
 @pytest.mark.slow
 def test_connect_check_timeout(dsn, proxy):
     proxy.start()
@@ -860,6 +1061,172 @@ def test_check_max_lifetime(dsn):
             assert conn.info.backend_pid != pid
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+@pytest.mark.crdb_skip("backend pid")
+def test_rotate(dsn):
+    with pool.ConnectionPool(
+        dsn, min_size=2, max_lifetime=1.0, rotate_interval=0.05
+    ) as p:
+        p.wait()
+        pids = {c.info.backend_pid for c in p._pool}
+
+        sleep(0.7)
+        assert p.get_stats().get("rotations_num", 0) == 0
+
+        sleep(0.5)
+        stats = p.get_stats()
+        assert stats["rotations_num"] == 2
+        assert stats["pool_available"] == 2
+        assert not pids & {c.info.backend_pid for c in p._pool}
+        # The connections closed are forgotten.
+        assert len(p._expiries) == 2
+
+
+def test_rotate_no_lifetime(dsn):
+    with pool.ConnectionPool(
+        dsn, min_size=2, max_lifetime=float("inf"), rotate_interval=0.01
+    ) as p:
+        p.wait()
+        assert p._get_rotation_candidate() is None
+        sleep(0.1)
+        assert p.get_stats().get("rotations_num", 0) == 0
+
+
+def test_rotate_bad(dsn):
+    with pytest.raises(ValueError, match="rotate_interval"):
+        pool.ConnectionPool(dsn, rotate_interval=-1, open=False)
+
+
+def test_reserved(dsn):
+
+    def worker():
+        with p.connection(timeout=1.0):
+            pass
+
+    with pool.ConnectionPool(dsn, min_size=2, max_size=2, reserved={10: 1}) as p:
+        p.wait()
+        conn = p.getconn()
+        with pytest.raises(pool.PoolTimeout):
+            p.getconn(timeout=0.1)
+        with p.connection(timeout=0.1, priority=10):
+            pass
+
+        # A connection returned is given to the client waiting if the reserved
+        # connection is available.
+        t = spawn(worker)
+        ensure_waiting(p)
+        p.putconn(conn)
+        gather(t)
+
+
+@pytest.mark.parametrize("reserved", [{1: -1}, {1: 1, 2: 1}])
+def test_reserved_bad(dsn, reserved):
+    with pytest.raises(ValueError, match="reserved"):
+        pool.ConnectionPool(dsn, min_size=2, reserved=reserved, open=False)
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+def test_autoscale(dsn):
+
+    def worker():
+        with p.connection() as conn:
+            conn.execute("select pg_sleep(0.1)")
+
+    with pool.ConnectionPool(dsn, min_size=1, max_size=8, autoscale_interval=0.1) as p:
+        p.wait()
+        assert p.get_stats()["pool_target"] == 1
+
+        for i in range(8):
+            gather(*[spawn(worker) for j in range(4)])
+        stats = p.get_stats()
+        assert 4 <= stats["pool_target"] <= 8
+        assert stats["pool_size"] >= 4
+
+        sleep(1.5)
+        stats = p.get_stats()
+        assert stats["pool_target"] == 1
+        assert stats["pool_size"] == 1
+
+
+def test_autoscale_disabled(dsn):
+    with pool.ConnectionPool(dsn, min_size=1) as p:
+        assert "pool_target" not in p.get_stats()
+    with pytest.raises(ValueError, match="autoscale_interval"):
+        pool.ConnectionPool(dsn, autoscale_interval=-1, open=False)
+
+
+@pytest.mark.crdb_skip("backend pid")
+def test_prepare_warmup(dsn):
+    with pool.ConnectionPool(dsn, min_size=1, prepare_warmup=10) as p:
+        with p.connection() as conn:
+            pid = conn.info.backend_pid
+            conn.execute("select %s::int", [1], prepare=True)
+            conn.execute("create temp table warmtmp (id int)")
+            conn.execute("select * from warmtmp", prepare=True)
+            conn.close()
+
+        p.wait(1.0)
+        with p.connection() as conn:
+            assert conn.info.backend_pid != pid
+            assert len(conn._prepared._names) == 1
+            cur = conn.execute("select statement from pg_prepared_statements")
+            assert cur.fetchall() == [("select $1::int",)]
+            cur = conn.execute("select %s::int", [2])
+            assert cur.fetchone() == (2,)
+            assert len(conn._prepared._names) == 1
+
+        stats = p.get_stats()
+        assert stats["prepared_warmed"] == 1
+
+
+def test_prepare_warmup_lru(dsn):
+    with pool.ConnectionPool(dsn, min_size=1, prepare_warmup=2) as p:
+        for i in range(3):
+            with p.connection() as conn:
+                conn.execute(f"select {i}", prepare=True)
+                conn.execute("select 0", prepare=True)
+
+        assert list(p._prepared_keys) == [(b"select 2", ()), (b"select 0", ())]
+
+
+def test_prepare_warmup_learn_new(dsn, monkeypatch):
+    with pool.ConnectionPool(dsn, min_size=1, prepare_warmup=10) as p:
+        learnt = []
+        add_prepared_keys = p._add_prepared_keys
+
+        def add_prepared_keys_spy(keys):
+            learnt.append(keys)
+            add_prepared_keys(keys)
+
+        monkeypatch.setattr(p, "_add_prepared_keys", add_prepared_keys_spy)
+
+        with p.connection() as conn:
+            conn.execute("select 1", prepare=True)
+        assert len(learnt) == 1
+
+        # Nothing new prepared: the registry is not updated
+        with p.connection() as conn:
+            conn.execute("select 1", prepare=True)
+        assert len(learnt) == 1
+
+        with p.connection() as conn:
+            conn.execute("select 2", prepare=True)
+        assert len(learnt) == 2
+        assert list(p._prepared_keys) == [(b"select 1", ()), (b"select 2", ())]
+
+
+def test_prepare_warmup_disabled(dsn):
+    with pool.ConnectionPool(dsn, min_size=1) as p:
+        with p.connection() as conn:
+            conn.execute("select 1", prepare=True)
+        assert not p._prepared_keys
+
+    with pytest.raises(ValueError):
+        pool.ConnectionPool(dsn, prepare_warmup=-1, open=False)
+
+
 @pytest.mark.slow
 def test_stats_connect(proxy, monkeypatch):
     proxy.start()
@@ -881,6 +1248,50 @@ def test_stats_connect(proxy, monkeypatch):
         assert stats["connections_lost"] == 3
 
 
+def test_histograms(dsn):
+    with pool.ConnectionPool(dsn, min_size=1, histograms=True) as p:
+        p.wait()
+        for i in range(3):
+            with p.connection() as conn:
+                conn.execute("select pg_sleep(0.05)")
+
+        stats = p.get_stats()
+        hists = p.get_histograms()
+        assert hists["connections_ms"].count == 1
+        assert hists["requests_wait_ms"].count == 3
+        assert hists["usage_ms"].count == 3
+        assert 50 <= stats["usage_ms_p50"] <= 100
+        assert stats["usage_ms_p99"] <= 100
+        assert stats["usage_ms_max"] >= 50
+        assert stats["requests_wait_ms_p99"] <= 5
+
+        stats = p.pop_stats()
+        assert stats["usage_ms_p99"] <= 100
+        assert not any((h.count for h in p.get_histograms().values()))
+        assert "usage_ms_p99" not in p.get_stats()
+
+
+def test_histograms_timeout(dsn):
+    with pool.ConnectionPool(dsn, min_size=1, histograms=True) as p:
+        p.wait()
+        with p.connection():
+            with pytest.raises(pool.PoolTimeout):
+                p.getconn(timeout=0.1)
+
+        stats = p.get_stats()
+        assert p.get_histograms()["requests_wait_ms"].count == 2
+        assert stats["requests_wait_ms_max"] >= 100
+
+
+def test_histograms_disabled(dsn):
+    with pool.ConnectionPool(dsn, min_size=1) as p:
+        with p.connection() as conn:
+            conn.execute("select 1")
+
+        assert p.get_histograms() == {}
+        assert not [k for k in p.get_stats() if k.endswith("_p99")]
+
+
 @pytest.mark.crdb_skip("pg_terminate_backend")
 def test_stats_check(dsn):
     with pool.ConnectionPool(
@@ -14,7 +14,7 @@ from psycopg.rows import Row, TupleRow, class_row
 
 from ..utils import assert_type, set_autocommit
 from ..acompat import AEvent, asleep, gather, skip_sync, spawn
-from .test_pool_common_async import delay_connection
+from .test_pool_common_async import delay_connection, ensure_waiting
 
 try:
     import psycopg_pool as pool
@@ -450,6 +450,82 @@ async def test_grow(dsn, monkeypatch, min_size, want_times):
         assert got == pytest.approx(want, 0.1), times
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_grow_concurrency(dsn, monkeypatch):
+    delay_connection(monkeypatch, 0.2)
+
+    async def worker(n):
+        t0 = time()
+        async with p.connection() as conn:
+            await conn.execute("select 1 from pg_sleep(0.2)")
+        t1 = time()
+        results.append((n, t1 - t0))
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, max_size=5, num_workers=4, grow_concurrency=4
+    ) as p:
+        await p.wait(1.0)
+        results: list[tuple[int, float]] = []
+        ts = [spawn(worker, args=(i,)) for i in range(5)]
+        await gather(*ts)
+        stats = p.get_stats()
+
+    # Growing one connection at time the last client would have waited 0.8s
+    times = [item[1] for item in results]
+    assert max(times) < 0.6, times
+    assert stats["pool_size"] == 5
+    assert stats["refills_num"] >= 1
+    assert 150 <= stats["refills_ms"] < 600
+
+
+async def test_grow_concurrency_bad(dsn):
+    with pytest.raises(ValueError):
+        pool.AsyncConnectionPool(dsn, grow_concurrency=0, open=False)
+
+
+@pytest.mark.parametrize("strategy", ["fifo", "lifo"])
+async def test_strategy(dsn, strategy):
+    async with pool.AsyncConnectionPool(dsn, min_size=3, strategy=strategy) as p:
+        await p.wait()
+        pids = []
+        for i in range(3):
+            async with p.connection() as conn:
+                pids.append(conn.info.backend_pid)
+
+    if strategy == "lifo":
+        assert len(set(pids)) == 1
+    else:
+        assert len(set(pids)) == 3
+
+
+async def test_strategy_bad(dsn):
+    with pytest.raises(ValueError, match="strategy"):
+        pool.AsyncConnectionPool(dsn, strategy="random", open=False)
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_shrink_lifo(dsn):
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, max_size=3, max_idle=0.3, strategy="lifo"
+    ) as p:
+        await p.wait()
+        async with p.connection(), p.connection(), p.connection():
+            pass
+        assert p.get_stats()["pool_size"] == 3
+
+        # Using the connections one at time, the other ones can be shrunk.
+        t0 = time()
+        while time() - t0 < 1.2:
+            async with p.connection() as conn:
+                await conn.execute("select 1")
+            await asleep(0.02)
+
+        stats = p.get_stats()
+        assert stats["pool_size"] == 1
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 async def test_shrink(dsn, monkeypatch):
@@ -825,6 +901,135 @@ async def test_getconn_check(dsn, caplog, autocommit):
     assert not caplog.records
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_check_idle_after(dsn):
+    checked = 0
+
+    async def check(conn):
+        nonlocal checked
+        checked += 1
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, check=check, check_idle_after=0.2
+    ) as p:
+        await p.wait()
+        async with p.connection():
+            pass
+        async with p.connection():
+            pass
+        assert checked == 0
+
+        await asleep(0.3)
+        async with p.connection():
+            pass
+        assert checked == 1
+
+
+async def test_check_idle_after_bad(dsn):
+    with pytest.raises(ValueError, match="check_idle_after"):
+        pool.AsyncConnectionPool(dsn, check_idle_after=-1, open=False)
+
+
+@pytest.mark.crdb_skip("pg_terminate_backend")
+async def test_check_socket(dsn):
+    async with await psycopg.AsyncConnection.connect(dsn) as conn:
+        await pool.AsyncConnectionPool.check_socket(conn)
+
+        async with await psycopg.AsyncConnection.connect(dsn) as conn2:
+            await conn2.execute(
+                "select pg_terminate_backend(%s)", [conn.info.backend_pid]
+            )
+        await asleep(0.1)
+        with pytest.raises(psycopg.OperationalError):
+            await pool.AsyncConnectionPool.check_socket(conn)
+
+    with pytest.raises(psycopg.OperationalError):
+        await pool.AsyncConnectionPool.check_socket(conn)
+
+
+@pytest.mark.crdb_skip("pg_terminate_backend")
+async def test_getconn_check_socket(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=2, check=pool.AsyncConnectionPool.check_socket
+    ) as p:
+        await p.wait(1.0)
+        async with p.connection() as conn:
+            async with p.connection() as conn2:
+                pid2 = conn2.info.backend_pid
+            await conn.execute("select pg_terminate_backend(%s)", [pid2])
+
+        await asleep(0.1)
+        async with p.connection() as conn:
+            async with p.connection() as conn2:
+                await conn.execute("select 1")
+                await conn2.execute("select 1")
+                pids = {c.info.backend_pid for c in [conn, conn2]}
+
+    assert pid2 not in pids
+    assert not caplog.records
+
+
+@pytest.mark.slow
+@pytest.mark.crdb_skip("pg_terminate_backend")
+async def test_validate(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=2, validate_interval=0.1, validate_batch=2
+    ) as p:
+        await p.wait()
+        async with p.connection() as conn, p.connection() as conn2:
+            pid2 = conn2.info.backend_pid
+            await conn.execute("select pg_terminate_backend(%s)", [pid2])
+
+        await asleep(0.5)
+        stats = p.get_stats()
+        assert stats["validations_num"] >= 4
+        assert stats["validations_errors"] == 1
+        assert stats["connections_lost"] == 1
+
+        async with p.connection() as conn, p.connection() as conn2:
+            pids = {c.info.backend_pid for c in [conn, conn2]}
+            assert pid2 not in pids
+
+    assert len(caplog.records) == 1
+    assert "broken" in caplog.records[0].message
+
+
+@pytest.mark.slow
+async def test_validate_close(dsn):
+    checked: list[psycopg.AsyncConnection[Any]] = []
+
+    async def check(conn):
+        checked.append(conn)
+        await asleep(0.3)
+
+    p = pool.AsyncConnectionPool(
+        dsn,
+        min_size=2,
+        check=check,
+        validate_interval=0.1,
+        validate_batch=2,
+        open=False,
+    )
+    await p.open(wait=True)
+    await asleep(0.2)
+    assert checked
+
+    # The connections being validated are closed with the pool.
+    await p.close()
+    assert all(conn.closed for conn in checked)
+
+
+@pytest.mark.parametrize("kwargs", [{"validate_interval": -1}, {"validate_batch": 0}])
+async def test_validate_bad(dsn, kwargs):
+    with pytest.raises(ValueError, match=list(kwargs)[0]):
+        pool.AsyncConnectionPool(dsn, open=False, **kwargs)
+
+
 @pytest.mark.slow
 async def test_connect_check_timeout(dsn, proxy):
     proxy.start()
@@ -861,6 +1066,174 @@ async def test_check_max_lifetime(dsn):
             assert conn.info.backend_pid != pid
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+@pytest.mark.crdb_skip("backend pid")
+async def test_rotate(dsn):
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=2, max_lifetime=1.0, rotate_interval=0.05
+    ) as p:
+        await p.wait()
+        pids = {c.info.backend_pid for c in p._pool}
+
+        await asleep(0.7)
+        assert p.get_stats().get("rotations_num", 0) == 0
+
+        await asleep(0.5)
+        stats = p.get_stats()
+        assert stats["rotations_num"] == 2
+        assert stats["pool_available"] == 2
+        assert not pids & {c.info.backend_pid for c in p._pool}
+        # The connections closed are forgotten.
+        assert len(p._expiries) == 2
+
+
+async def test_rotate_no_lifetime(dsn):
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=2, max_lifetime=float("inf"), rotate_interval=0.01
+    ) as p:
+        await p.wait()
+        assert p._get_rotation_candidate() is None
+        await asleep(0.1)
+        assert p.get_stats().get("rotations_num", 0) == 0
+
+
+async def test_rotate_bad(dsn):
+    with pytest.raises(ValueError, match="rotate_interval"):
+        pool.AsyncConnectionPool(dsn, rotate_interval=-1, open=False)
+
+
+async def test_reserved(dsn):
+    async def worker():
+        async with p.connection(timeout=1.0):
+            pass
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=2, max_size=2, reserved={10: 1}
+    ) as p:
+        await p.wait()
+        conn = await p.getconn()
+        with pytest.raises(pool.PoolTimeout):
+            await p.getconn(timeout=0.1)
+        async with p.connection(timeout=0.1, priority=10):
+            pass
+
+        # A connection returned is given to the client waiting if the reserved
+        # connection is available.
+        t = spawn(worker)
+        await ensure_waiting(p)
+        await p.putconn(conn)
+        await gather(t)
+
+
+@pytest.mark.parametrize("reserved", [{1: -1}, {1: 1, 2: 1}])
+async def test_reserved_bad(dsn, reserved):
+    with pytest.raises(ValueError, match="reserved"):
+        pool.AsyncConnectionPool(dsn, min_size=2, reserved=reserved, open=False)
+
+
+@pytest.mark.slow
+@pytest.mark.timing
+async def test_autoscale(dsn):
+    async def worker():
+        async with p.connection() as conn:
+            await conn.execute("select pg_sleep(0.1)")
+
+    async with pool.AsyncConnectionPool(
+        dsn, min_size=1, max_size=8, autoscale_interval=0.1
+    ) as p:
+        await p.wait()
+        assert p.get_stats()["pool_target"] == 1
+
+        for i in range(8):
+            await gather(*[spawn(worker) for j in range(4)])
+        stats = p.get_stats()
+        assert 4 <= stats["pool_target"] <= 8
+        assert stats["pool_size"] >= 4
+
+        await asleep(1.5)
+        stats = p.get_stats()
+        assert stats["pool_target"] == 1
+        assert stats["pool_size"] == 1
+
+
+async def test_autoscale_disabled(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1) as p:
+        assert "pool_target" not in p.get_stats()
+    with pytest.raises(ValueError, match="autoscale_interval"):
+        pool.AsyncConnectionPool(dsn, autoscale_interval=-1, open=False)
+
+
+@pytest.mark.crdb_skip("backend pid")
+async def test_prepare_warmup(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1, prepare_warmup=10) as p:
+        async with p.connection() as conn:
+            pid = conn.info.backend_pid
+            await conn.execute("select %s::int", [1], prepare=True)
+            await conn.execute("create temp table warmtmp (id int)")
+            await conn.execute("select * from warmtmp", prepare=True)
+            await conn.close()
+
+        await p.wait(1.0)
+        async with p.connection() as conn:
+            assert conn.info.backend_pid != pid
+            assert len(conn._prepared._names) == 1
+            cur = await conn.execute("select statement from pg_prepared_statements")
+            assert await cur.fetchall() == [("select $1::int",)]
+            cur = await conn.execute("select %s::int", [2])
+            assert (await cur.fetchone()) == (2,)
+            assert len(conn._prepared._names) == 1
+
+        stats = p.get_stats()
+        assert stats["prepared_warmed"] == 1
+
+
+async def test_prepare_warmup_lru(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1, prepare_warmup=2) as p:
+        for i in range(3):
+            async with p.connection() as conn:
+                await conn.execute(f"select {i}", prepare=True)
+                await conn.execute("select 0", prepare=True)
+
+        assert list(p._prepared_keys) == [(b"select 2", ()), (b"select 0", ())]
+
+
+async def test_prepare_warmup_learn_new(dsn, monkeypatch):
+    async with pool.AsyncConnectionPool(dsn, min_size=1, prepare_warmup=10) as p:
+        learnt = []
+        add_prepared_keys = p._add_prepared_keys
+
+        def add_prepared_keys_spy(keys):
+            learnt.append(keys)
+            add_prepared_keys(keys)
+
+        monkeypatch.setattr(p, "_add_prepared_keys", add_prepared_keys_spy)
+
+        async with p.connection() as conn:
+            await conn.execute("select 1", prepare=True)
+        assert len(learnt) == 1
+
+        # Nothing new prepared: the registry is not updated
+        async with p.connection() as conn:
+            await conn.execute("select 1", prepare=True)
+        assert len(learnt) == 1
+
+        async with p.connection() as conn:
+            await conn.execute("select 2", prepare=True)
+        assert len(learnt) == 2
+        assert list(p._prepared_keys) == [(b"select 1", ()), (b"select 2", ())]
+
+
+async def test_prepare_warmup_disabled(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1) as p:
+        async with p.connection() as conn:
+            await conn.execute("select 1", prepare=True)
+        assert not p._prepared_keys
+
+    with pytest.raises(ValueError):
+        pool.AsyncConnectionPool(dsn, prepare_warmup=-1, open=False)
+
+
 @pytest.mark.slow
 async def test_stats_connect(proxy, monkeypatch):
     proxy.start()
@@ -882,6 +1255,50 @@ async def test_stats_connect(proxy, monkeypatch):
         assert stats["connections_lost"] == 3
 
 
+async def test_histograms(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1, histograms=True) as p:
+        await p.wait()
+        for i in range(3):
+            async with p.connection() as conn:
+                await conn.execute("select pg_sleep(0.05)")
+
+        stats = p.get_stats()
+        hists = p.get_histograms()
+        assert hists["connections_ms"].count == 1
+        assert hists["requests_wait_ms"].count == 3
+        assert hists["usage_ms"].count == 3
+        assert 50 <= stats["usage_ms_p50"] <= 100
+        assert stats["usage_ms_p99"] <= 100
+        assert stats["usage_ms_max"] >= 50
+        assert stats["requests_wait_ms_p99"] <= 5
+
+        stats = p.pop_stats()
+        assert stats["usage_ms_p99"] <= 100
+        assert not any(h.count for h in p.get_histograms().values())
+        assert "usage_ms_p99" not in p.get_stats()
+
+
+async def test_histograms_timeout(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1, histograms=True) as p:
+        await p.wait()
+        async with p.connection():
+            with pytest.raises(pool.PoolTimeout):
+                await p.getconn(timeout=0.1)
+
+        stats = p.get_stats()
+        assert p.get_histograms()["requests_wait_ms"].count == 2
+        assert stats["requests_wait_ms_max"] >= 100
+
+
+async def test_histograms_disabled(dsn):
+    async with pool.AsyncConnectionPool(dsn, min_size=1) as p:
+        async with p.connection() as conn:
+            await conn.execute("select 1")
+
+        assert p.get_histograms() == {}
+        assert not [k for k in p.get_stats() if k.endswith("_p99")]
+
+
 @pytest.mark.crdb_skip("pg_terminate_backend")
 async def test_stats_check(dsn):
     async with pool.AsyncConnectionPool(
@@ -186,6 +186,25 @@ def test_queue(pool_cls, dsn):
     assert len({r[2] for r in results}) == 2, results
 
 
+def test_priority(pool_cls, dsn):
+
+    def worker(n, priority):
+        with p.connection(priority=priority):
+            results.append(n)
+
+    results: list[int] = []
+    with pool_cls(dsn, min_size=min_size(pool_cls, 1), max_size=1) as p:
+        p.wait()
+        ts = []
+        with p.connection():
+            for i, priority in enumerate([0, 0, 10, -1, 10]):
+                ts.append(spawn(worker, args=(i, priority)))
+                ensure_waiting(p, i + 1)
+        gather(*ts)
+
+    assert results == [2, 4, 0, 1, 3]
+
+
 @pytest.mark.slow
 def test_queue_size(pool_cls, dsn):
 
@@ -196,6 +196,24 @@ async def test_queue(pool_cls, dsn):
     assert len({r[2] for r in results}) == 2, results
 
 
+async def test_priority(pool_cls, dsn):
+    async def worker(n, priority):
+        async with p.connection(priority=priority):
+            results.append(n)
+
+    results: list[int] = []
+    async with pool_cls(dsn, min_size=min_size(pool_cls, 1), max_size=1) as p:
+        await p.wait()
+        ts = []
+        async with p.connection():
+            for i, priority in enumerate([0, 0, 10, -1, 10]):
+                ts.append(spawn(worker, args=(i, priority)))
+                await ensure_waiting(p, i + 1)
+        await gather(*ts)
+
+    assert results == [2, 4, 0, 1, 3]
+
+
 @pytest.mark.slow
 async def test_queue_size(pool_cls, dsn):
     async def worker(t, ev=None):
@@ -45,6 +45,26 @@ class MyRow(dict[str, Any]):
     pass
 
 
+@pytest.mark.parametrize(
+    "param",
+    [
+        "strategy",
+        "check_idle_after",
+        "validate_interval",
+        "validate_batch",
+        "rotate_interval",
+        "grow_concurrency",
+        "reserved",
+        "autoscale_interval",
+        "prepare_warmup",
+    ],
+)
+def test_unsupported_params(dsn, param):
+    kwargs: dict[str, Any] = {param: 1}
+    with pytest.raises(TypeError, match=param):
+        pool.NullConnectionPool(dsn, open=False, **kwargs)
+
+
 def test_generic_connection_type(dsn):
 
     def configure(conn: psycopg.Connection[Any]) -> None:
@@ -45,6 +45,26 @@ class MyRow(dict[str, Any]):
     pass
 
 
+@pytest.mark.parametrize(
+    "param",
+    [
+        "strategy",
+        "check_idle_after",
+        "validate_interval",
+        "validate_batch",
+        "rotate_interval",
+        "grow_concurrency",
+        "reserved",
+        "autoscale_interval",
+        "prepare_warmup",
+    ],
+)
+async def test_unsupported_params(dsn, param):
+    kwargs: dict[str, Any] = {param: 1}
+    with pytest.raises(TypeError, match=param):
+        pool.AsyncNullConnectionPool(dsn, open=False, **kwargs)
+
+
 async def test_generic_connection_type(dsn):
     async def configure(conn: psycopg.AsyncConnection[Any]) -> None:
         await set_autocommit(conn, True)
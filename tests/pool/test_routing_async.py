@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import pytest
+
+import psycopg
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+if True:  # ASYNC
+    pytestmark = [pytest.mark.anyio]
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    """Consider replicas the servers with application_name starting with 'r'."""
+
+    async def _is_standby(self, conn):
+        return conn.info.parameter_status("application_name").startswith("r")
+
+    monkeypatch.setattr(
+        pool.AsyncRoutingPool, "_in_hot_standby", staticmethod(lambda conn: None)
+    )
+    monkeypatch.setattr(pool.AsyncRoutingPool, "_is_standby", _is_standby)
+
+
+async def test_primary(dsn):
+    async with pool.AsyncRoutingPool([dsn], pool_kwargs={"min_size": 1}) as p:
+        async with p.connection() as conn:
+            await conn.execute("select 1")
+        # Without replicas, the primary is used for readonly requests too.
+        async with p.connection(readonly=True) as conn:
+            await conn.execute("select 1")
+
+        assert p.get_stats() == {
+            "servers_num": 1,
+            "servers_up": 1,
+            "primary_num": 1,
+            "replicas_num": 0,
+        }
+
+    assert p.closed
+    with pytest.raises(pool.PoolClosed):
+        async with p.connection():
+            pass
+
+
+async def test_usage_stats(dsn):
+    async with pool.AsyncRoutingPool(
+        [dsn], pool_kwargs={"min_size": 1, "histograms": True}
+    ) as p:
+        for readonly in (False, True):
+            async with p.connection(readonly=readonly) as conn:
+                await conn.execute("select pg_sleep(0.05)")
+
+        # The usage is accounted to the server pool.
+        stats = p._hosts[0].pool.get_stats()
+        assert stats["usage_ms"] >= 100
+        assert p._hosts[0].pool.get_histograms()["usage_ms"].count == 2
+
+
+@pytest.mark.usefixtures("replicas")
+async def test_route(dsn):
+    names = ["p", "r1", "r2"]
+    async with pool.AsyncRoutingPool(
+        [f"{dsn} application_name={name}" for name in names],
+        pool_kwargs={"min_size": 2},
+    ) as p:
+        await p.refresh()
+        stats = p.get_stats()
+        assert stats["primary_num"] == 1
+        assert stats["replicas_num"] == 2
+
+        async with p.connection() as conn:
+            assert conn.info.parameter_status("application_name") == "p"
+
+        # Replicas are chosen by number of connections in use.
+        async with p.connection(readonly=True) as conn1:
+            name1 = conn1.info.parameter_status("application_name")
+            assert name1 in ("r1", "r2")
+            async with p.connection(readonly=True) as conn2:
+                name2 = conn2.info.parameter_status("application_name")
+                assert {name1, name2} == {"r1", "r2"}
+                async with p.connection(readonly=True) as conn3:
+                    name3 = conn3.info.parameter_status("application_name")
+                    assert name3 in ("r1", "r2")
+
+
+@pytest.mark.usefixtures("replicas")
+async def test_no_primary(dsn):
+    async with pool.AsyncRoutingPool(
+        [f"{dsn} application_name=r1"], pool_kwargs={"min_size": 1}
+    ) as p:
+        with pytest.raises(psycopg.OperationalError, match="no primary"):
+            async with p.connection():
+                pass
+        async with p.connection(readonly=True) as conn:
+            await conn.execute("select 1")
+
+
+async def test_readonly_primary(dsn):
+    async with pool.AsyncRoutingPool([dsn], pool_kwargs={"min_size": 1}) as p:
+        # A read-only request served by the primary can't write.
+        async with p.connection(readonly=True) as conn:
+            assert conn.read_only
+            with pytest.raises(psycopg.errors.ReadOnlySqlTransaction):
+                await conn.execute("create temp table routing_ro (id int)")
+
+        async with p.connection() as conn:
+            assert conn.read_only is None
+            await conn.execute("create temp table routing_ro (id int)")
+
+
+async def test_is_standby_idle(dsn, monkeypatch):
+    monkeypatch.setattr(
+        pool.AsyncRoutingPool, "_in_hot_standby", staticmethod(lambda conn: None)
+    )
+    async with pool.AsyncRoutingPool([dsn], pool_kwargs={"min_size": 1}) as p:
+        async with p.connection() as conn:
+            assert not await p._is_standby(conn)
+            assert conn.info.transaction_status == psycopg.pq.TransactionStatus.IDLE
+
+
+@pytest.mark.usefixtures("replicas")
+async def test_primary_down(dsn):
+    names = ["p", "r1", "r2"]
+    async with pool.AsyncRoutingPool(
+        [f"{dsn} application_name={name}" for name in names],
+        pool_kwargs={"min_size": 1},
+    ) as p:
+        await p.refresh()
+        async with p._lock:
+            p._mark_down(p._hosts[0])
+
+        # The replicas keep serving read-only requests, without waiting.
+        async with p.connection(readonly=True) as conn:
+            assert conn.info.parameter_status("application_name") in ("r1", "r2")
+            assert not conn.read_only
+
+        # The replicas are checked again, but no primary is found.
+        with pytest.raises(psycopg.OperationalError, match="no primary"):
+            async with p.connection():
+                pass
+
+        stats = p.get_stats()
+        assert stats["servers_up"] == 2
+        assert stats["replicas_num"] == 2
+
+
+async def test_busy_not_down(dsn):
+    async with pool.AsyncRoutingPool(
+        [dsn], pool_kwargs={"min_size": 1, "max_size": 1}
+    ) as p:
+        async with p.connection():
+            with pytest.raises(pool.PoolTimeout):
+                async with p.connection(timeout=0.5):
+                    pass
+
+        assert p.get_stats()["servers_up"] == 1
+        async with p.connection() as conn:
+            await conn.execute("select 1")
+
+
+@pytest.mark.slow
+async def test_failover(dsn):
+    async with pool.AsyncRoutingPool(
+        [f"{dsn} port=1", dsn],
+        pool_kwargs={"min_size": 1},
+        failover_timeout=0.2,
+    ) as p:
+        async with p.connection(readonly=True) as conn:
+            await conn.execute("select 1")
+        stats = p.get_stats()
+        assert stats["servers_up"] == 1
+        assert stats["primary_num"] == 1
+
+
+async def test_bad_params():
+    with pytest.raises(ValueError):
+        pool.AsyncRoutingPool([])
@@ -176,6 +176,40 @@ def test_get_value(pgconn):
     assert res.get_value(0, 0) is None
 
 
+def test_get_value_view(pgconn):
+    res = pgconn.exec_(b"select 'abc', '', NULL")
+    assert res.status == pq.ExecStatus.TUPLES_OK, res.error_message
+    view = res.get_value_view(0, 0)
+    # The Python implementation returns a copy, cheaper than a ctypes view.
+    assert isinstance(view, bytes if pq.__impl__ == "python" else memoryview)
+    assert view[0] == ord("a")
+    assert bytes(view[1:]) == b"bc"
+    assert res.get_value_view(0, 1) == b""
+    assert res.get_value_view(0, 2) is None
+
+    # The view keeps the result alive
+    del res
+    assert bytes(view) == b"abc"
+
+
+def test_get_fixed_column(pgconn):
+    res = pgconn.exec_params(
+        b"select x::int2 from (values (1), (NULL), (-2)) as t(x)",
+        [],
+        result_format=1,
+    )
+    assert res.status == pq.ExecStatus.TUPLES_OK, res.error_message
+    assert res.get_fixed_column(0, 0, 3, 2) == (b"\x00\x01\x00\x00\xff\xfe", b"\0\1\0")
+    assert res.get_fixed_column(0, 1, 3, 2) == (b"\x00\x00\xff\xfe", b"\1\0")
+    assert res.get_fixed_column(0, 1, 1, 2) == (b"", b"")
+    with pytest.raises(ValueError):
+        res.get_fixed_column(0, 0, 3, 4)
+    with pytest.raises(ValueError):
+        res.get_fixed_column(1, 0, 3, 2)
+    with pytest.raises(ValueError):
+        res.get_fixed_column(0, 0, 4, 2)
+
+
 def test_nparams_types(pgconn):
     res = pgconn.prepare(b"", b"select $1::int4, $2::text")
     assert res.status == pq.ExecStatus.COMMAND_OK, res.error_message
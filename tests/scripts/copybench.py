@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""Measure the throughput of copy operations with different tuning parameters."""
+
+from __future__ import annotations
+
+import sys
+import asyncio
+import logging
+from time import monotonic
+from typing import Any
+from argparse import ArgumentParser, Namespace
+from itertools import product
+
+import psycopg
+from psycopg import sql
+
+logger = logging.getLogger()
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+
+
+def main():
+    args = parse_cmdline()
+    logger.setLevel(args.loglevel)
+
+    configs = list(
+        product(args.buffer_size, args.queue_size or [None], args.flush_policy)
+    )
+    records = [get_record(args)] * args.nrecs
+    nbytes = sum(len(f) + 1 for f in records[0]) * args.nrecs
+
+    results = []
+    for buffer_size, queue_size, flush_policy in configs:
+        kwargs: dict[str, Any] = {
+            "buffer_size": buffer_size,
+            "queue_size": queue_size,
+            "flush_policy": flush_policy,
+        }
+        times = []
+        for _ in range(args.repeat):
+            if getattr(args, "async"):
+                t = asyncio.run(run_async(args, records, kwargs))
+            else:
+                t = run_sync(args, records, kwargs)
+            times.append(t)
+
+        best = min(times)
+        logger.info(
+            "buffer_size=%s queue_size=%s flush_policy=%s: %.3f sec, %.1f MB/s",
+            buffer_size,
+            queue_size,
+            flush_policy,
+            best,
+            nbytes / best / 1024 / 1024,
+        )
+        results.append((best, kwargs))
+
+    results.sort(key=lambda r: r[0])
+    print(f"{'buffer_size':>12} {'queue_size':>10} {'flush_policy':>12} {'MB/s':>8}")
+    for best, kwargs in results:
+        print(
+            f"{kwargs['buffer_size']:>12} {kwargs['queue_size'] or '-':>10}"
+            f" {kwargs['flush_policy']:>12} {nbytes / best / 1024 / 1024:>8.1f}"
+        )
+
+
+def run_sync(args: Namespace, records: list[tuple[Any, ...]], kwargs: Any) -> float:
+    with psycopg.Connection.connect(args.dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute(get_table_stmt(args))
+            t0 = monotonic()
+            with cur.copy(get_copy_stmt(args), **kwargs) as copy:
+                for record in records:
+                    copy.write_row(record)
+            return monotonic() - t0
+
+
+async def run_async(
+    args: Namespace, records: list[tuple[Any, ...]], kwargs: Any
+) -> float:
+    async with await psycopg.AsyncConnection.connect(args.dsn) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(get_table_stmt(args))
+            t0 = monotonic()
+            async with cur.copy(get_copy_stmt(args), **kwargs) as copy:
+                for record in records:
+                    await copy.write_row(record)
+            return monotonic() - t0
+
+
+def get_table_stmt(args: Namespace) -> sql.Composed:
+    fields = sql.SQL(", ").join([sql.SQL(f"f{i} text") for i in range(args.nfields)])
+    return sql.SQL("create temp table testcopy ({})").format(fields)
+
+
+def get_copy_stmt(args: Namespace) -> sql.Composed:
+    fields = sql.SQL(", ").join([sql.Identifier(f"f{i}") for i in range(args.nfields)])
+    return sql.SQL("copy testcopy ({}) from stdin").format(fields)
+
+
+def get_record(args: Namespace) -> tuple[Any, ...]:
+    return tuple("x" * args.colsize for _ in range(args.nfields))
+
+
+def parse_cmdline() -> Namespace:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default="", help="database connection string")
+    parser.add_argument(
+        "--async", action="store_true", default=False, help="test async objects"
+    )
+    parser.add_argument(
+        "--nrecs",
+        type=int,
+        default=100_000,
+        help="number of records to write [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--nfields",
+        type=int,
+        default=10,
+        help="number of columns to write [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--colsize",
+        type=int,
+        default=10,
+        help="width of each column to write [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of runs for each configuration; the best is reported"
+        " [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        nargs="+",
+        default=[8 * 1024, 32 * 1024, 128 * 1024, 1024 * 1024],
+        help="buffer sizes to test [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        nargs="+",
+        help="queue sizes to test; if not specified, don't use a queued writer",
+    )
+    parser.add_argument(
+        "--flush-policy",
+        nargs="+",
+        choices=["auto", "always", "never"],
+        default=["always", "never"],
+        help="flush policies to test [default: %(default)s]",
+    )
+
+    g = parser.add_mutually_exclusive_group()
+    g.add_argument(
+        "-q",
+        "--quiet",
+        help="Talk less",
+        dest="loglevel",
+        action="store_const",
+        const=logging.WARN,
+        default=logging.INFO,
+    )
+    g.add_argument(
+        "-v",
+        "--verbose",
+        help="Talk more",
+        dest="loglevel",
+        action="store_const",
+        const=logging.DEBUG,
+        default=logging.INFO,
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
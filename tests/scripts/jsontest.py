@@ -0,0 +1,159 @@
+"""
+A quick and rough performance comparison of the JSON loading strategies.
+
+Compare loading json and jsonb with the C loaders and with the Python ones,
+using the default `json.loads()` and `orjson` (if installed), either receiving
+bytes or memory buffers.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import logging
+import argparse
+from typing import Any
+from collections.abc import Callable
+
+import psycopg
+from psycopg.types import json as pjson
+from psycopg.types.json import set_json_loads
+
+logger = logging.getLogger()
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+
+# Subclasses defined outside psycopg.types are not replaced by the C loaders.
+class PyJsonLoader(pjson.JsonLoader):
+    pass
+
+
+class PyJsonBinaryLoader(pjson.JsonBinaryLoader):
+    pass
+
+
+class PyJsonbLoader(pjson.JsonbLoader):
+    pass
+
+
+class PyJsonbBinaryLoader(pjson.JsonbBinaryLoader):
+    pass
+
+
+def main():
+    opt = parse_cmdline()
+    if opt.loglevel:
+        logger.setLevel(opt.loglevel)
+
+    logger.info("using psycopg %s implementation", psycopg.pq.__impl__)
+
+    impls = ["python"]
+    if psycopg.pq.__impl__ in ("c", "binary"):
+        impls.insert(0, "c")
+    else:
+        logger.warning("C implementation not available: only testing Python")
+
+    tests: list[tuple[str, Callable[[Any], Any], bool]] = [
+        ("json.loads", json.loads, False)
+    ]
+    try:
+        import orjson
+    except ImportError:
+        logger.warning("orjson not available: install it to compare")
+    else:
+        tests.append(("orjson.loads", orjson.loads, False))
+        tests.append(("orjson.loads buffers", orjson.loads, True))
+
+    for impl in impls:
+        for title, loads, buffers in tests:
+            set_json_loads(loads, accepts_buffers=buffers)
+            for pgtype in ("json", "jsonb"):
+                for binary in (False, True):
+                    t = run_test(opt, impl, pgtype, binary)
+                    logger.info(
+                        "%-6s %-22s %-5s %-6s: %.3f sec",
+                        impl,
+                        title,
+                        pgtype,
+                        "binary" if binary else "text",
+                        t,
+                    )
+
+    set_json_loads(json.loads)
+
+
+def run_test(opt: argparse.Namespace, impl: str, pgtype: str, binary: bool) -> float:
+    with psycopg.connect(opt.dsn) as conn:
+        if impl == "python":
+            conn.adapters.register_loader("json", PyJsonLoader)
+            conn.adapters.register_loader("json", PyJsonBinaryLoader)
+            conn.adapters.register_loader("jsonb", PyJsonbLoader)
+            conn.adapters.register_loader("jsonb", PyJsonbBinaryLoader)
+
+        query = f"""
+            select json_build_object(
+                'id', i, 'name', 'name-' || i,
+                'tags', array['foo', 'bar', 'baz'],
+                'data', repeat('x', {opt.size}))::{pgtype}
+            from generate_series(1, {opt.nrows}) as i
+            """
+        cur = conn.cursor(binary=binary)
+        t0 = time.monotonic()
+        for i in range(opt.repeat):
+            cur.execute(query)
+            cur.fetchall()
+        elapsed: float = (time.monotonic() - t0) / opt.repeat
+        return elapsed
+
+
+def parse_cmdline() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default="", help="connection string to the database")
+    parser.add_argument(
+        "--nrows",
+        metavar="N",
+        type=int,
+        default=100_000,
+        help="number of records to load [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--size",
+        metavar="BYTES",
+        type=int,
+        default=100,
+        help="size of the string in every document [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--repeat",
+        metavar="N",
+        type=int,
+        default=3,
+        help="number of times to repeat every test [default: %(default)s]",
+    )
+
+    g = parser.add_mutually_exclusive_group()
+    g.add_argument(
+        "-q",
+        "--quiet",
+        help="Talk less",
+        dest="loglevel",
+        action="store_const",
+        const=logging.WARN,
+        default=logging.INFO,
+    )
+    g.add_argument(
+        "-v",
+        "--verbose",
+        help="Talk more",
+        dest="loglevel",
+        action="store_const",
+        const=logging.DEBUG,
+        default=logging.INFO,
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -176,6 +176,28 @@ def test_subclass_loader(conn):
     assert conn.execute("select 'hello'::text").fetchone()[0] == "hellohello"
 
 
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_loader_zero_copy(conn, zero_copy):
+    types = []
+
+    class MyTextLoader(Loader):
+        def load(self, data):
+            types.append(type(data))
+            return bytes(data).decode()
+
+    MyTextLoader.zero_copy = zero_copy
+    conn.adapters.register_loader("text", MyTextLoader)
+    cur = conn.execute("select 'hello'::text, repeat('x', 100000)")
+    rec = cur.fetchone()
+    assert rec == ("hello", "x" * 100000)
+    rec = cur.fetchall()
+    if _psycopg:
+        # The C implementation never copies the data
+        assert types == [memoryview, memoryview]
+    else:
+        assert types == [bytes, bytes]
+
+
 @pytest.mark.parametrize(
     "data, format, type, result",
     [
@@ -1,8 +1,10 @@
 # WARNING: this file is auto-generated by 'async_to_sync.py'
 # from the original file 'test_copy_async.py'
 # DO NOT CHANGE! Change the original file instead.
+import os
 import string
 import hashlib
+import threading
 from io import BytesIO, StringIO
 from random import choice, randrange
 from itertools import cycle
@@ -458,6 +460,44 @@ def test_copy_in_records(conn, format):
     assert data == sample_records
 
 
+@pytest.mark.parametrize("format", pq.Format)
+@pytest.mark.parametrize("buffer_size", [1, 1024])
+def test_write_rows(conn, format, buffer_size, monkeypatch):
+    threads = set()
+    format_rows = psycopg._copy_base.BaseCopy._format_rows
+
+    def format_rows_thread(self, rows):
+        threads.add(threading.get_ident())
+        return format_rows(self, rows)
+
+    monkeypatch.setattr(psycopg._copy_base.BaseCopy, "_format_rows", format_rows_thread)
+
+    cur = conn.cursor()
+    ensure_table(cur, "id int primary key, data text")
+    records = [(i, f"data {i}") for i in range(1000)]
+    with cur.copy(
+        f"copy copy_in from stdin (format {format.name})", buffer_size=buffer_size
+    ) as copy:
+        copy.set_types(["int4", "text"])
+        copy.write_row(records[0])
+        copy.write_rows(records[1:-1], batch_size=100)
+        copy.write_row(records[-1])
+
+    cur.execute("select * from copy_in order by 1")
+    assert cur.fetchall() == records
+
+    assert threads
+    assert threads == {threading.get_ident()}
+
+
+def test_write_rows_bad_batch_size(conn):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(ValueError):
+            copy.write_rows(sample_records, batch_size=0)
+
+
 @pytest.mark.parametrize("format", pq.Format)
 def test_copy_in_records_set_types(conn, format):
     cur = conn.cursor()
@@ -676,6 +716,108 @@ def test_copy_from_insane_size(conn):
     gen.assert_data()
 
 
+@pytest.mark.parametrize("method", ["file", "fd", "path"])
+def test_copy_from_to_file(conn, tmp_path, method):
+    gen = DataGenerator(conn, nrecs=100, srec=1000)
+    gen.ensure_table()
+    src = tmp_path / "src.pgcopy"
+    src.write_text(gen.file().read())
+    tgt = tmp_path / "tgt.pgcopy"
+
+    cur = conn.cursor()
+    with cur.copy("copy copy_in from stdin") as copy:
+        if method == "path":
+            copy.copy_from_path(src)
+        else:
+            with src.open("rb") as f:
+                copy.copy_from_file(
+                    f if method == "file" else f.fileno(), chunk_size=1000
+                )
+
+    assert cur.rowcount == 100
+    gen.assert_data()
+
+    with cur.copy("copy copy_in to stdout") as copy:
+        if method == "path":
+            copy.copy_to_path(tgt)
+        else:
+            with tgt.open("wb") as f:
+                copy.copy_to_file(f if method == "file" else f.fileno())
+
+    assert cur.rowcount == 100
+    assert tgt.read_bytes() == src.read_bytes()
+
+
+def test_copy_to_file_buffer_size(conn, tmp_path, monkeypatch):
+    cur = conn.cursor()
+    tgt = tmp_path / "copy.txt"
+    sizes = []
+    with cur.copy(
+        "copy (select repeat('x', 999) from generate_series(1, 100)) to stdout",
+        buffer_size=10000,
+    ) as copy:
+        write_fd = copy._write_fd
+
+        def write_fd_spy(fd, chunks):
+            sizes.append(sum((len(c) for c in chunks)))
+            write_fd(fd, chunks)
+
+        monkeypatch.setattr(copy, "_write_fd", write_fd_spy)
+        with tgt.open("wb") as f:
+            copy.copy_to_file(f.fileno())
+
+    assert tgt.read_bytes() == (b"x" * 999 + b"\n") * 100
+    assert sizes[:10] == [10000] * 10
+    assert sum(sizes) == 100000
+
+
+def test_copy_from_file_queued(conn):
+    gen = DataGenerator(conn, nrecs=100, srec=1000)
+    gen.ensure_table()
+    f = BytesIO(gen.file().read().encode())
+    cur = conn.cursor()
+    with cur.copy("copy copy_in from stdin", writer=QueuedLibpqWriter(cur)) as copy:
+        copy.copy_from_file(f, chunk_size=1000)
+
+    gen.assert_data()
+
+
+def test_copy_from_file_text(conn):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with cur.copy("copy copy_in from stdin") as copy:
+        copy.copy_from_file(StringIO(sample_text.decode()))
+
+    cur.execute("select * from copy_in order by 1")
+    assert cur.fetchall() == sample_records
+
+
+def test_copy_file_bad_direction(conn):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(e.ProgrammingError):
+            copy.copy_to_file(BytesIO())
+
+    with cur.copy("copy copy_in to stdout") as copy:
+        with pytest.raises(e.ProgrammingError):
+            copy.copy_from_file(BytesIO(sample_text))
+
+
+def test_write_fd_partial(tmp_path, monkeypatch):
+
+    def writev(fd, chunks):
+        # Write at most 3 bytes at time
+        return os.write(fd, b"".join(chunks)[:3])
+
+    monkeypatch.setattr(psycopg._copy_base, "_writev", writev)
+    chunks: list[Buffer] = [b"hello", memoryview(b" "), bytearray(b"world"), b"", b"!"]
+    with (tmp_path / "out").open("wb") as f:
+        psycopg._copy_base.write_fd(f.fileno(), chunks)
+
+    assert (tmp_path / "out").read_bytes() == b"hello world!"
+
+
 def test_copy_rowcount(conn):
     gen = DataGenerator(conn, nrecs=3, srec=10)
     gen.ensure_table()
@@ -791,6 +933,83 @@ def test_worker_life(conn, format, buffer):
     assert data == sample_records
 
 
+@pytest.mark.parametrize("format", pq.Format)
+def test_buffer_size(conn, format):
+    writes = []
+
+    class CountingWriter(LibpqWriter):
+
+        def write(self, data):
+            writes.append(len(data))
+            super().write(data)
+
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with cur.copy(
+        f"copy copy_in from stdin (format {format.name})",
+        writer=CountingWriter(cur),
+        buffer_size=1,
+    ) as copy:
+        for row in sample_records:
+            copy.write_row(row)
+            assert len(writes) == sample_records.index(row) + 1
+
+    cur.execute("select * from copy_in order by 1")
+    assert cur.fetchall() == sample_records
+
+
+def test_queue_size(conn):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with cur.copy("copy copy_in from stdin", queue_size=4) as copy:
+        assert isinstance(copy.writer, QueuedLibpqWriter)
+        assert copy.writer._queue.maxsize == 4
+        for row in sample_records:
+            copy.write_row(row)
+
+    cur.execute("select * from copy_in order by 1")
+    assert cur.fetchall() == sample_records
+
+
+@pytest.mark.parametrize("policy", ["auto", "always", "never"])
+@pytest.mark.parametrize("queue_size", [None, 4])
+def test_flush_policy(conn, policy, queue_size):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with cur.copy(
+        "copy copy_in from stdin", queue_size=queue_size, flush_policy=policy
+    ) as copy:
+        if policy != "auto":
+            assert copy.writer._flush == (policy == "always")
+        copy.write(sample_text)
+
+    cur.execute("select * from copy_in order by 1")
+    assert cur.fetchall() == sample_records
+
+
+@pytest.mark.parametrize(
+    "kwargs, exc",
+    [
+        ({"buffer_size": 0}, ValueError),
+        ({"queue_size": 0}, ValueError),
+        ({"flush_policy": "sometimes"}, ValueError),
+        ({"queue_size": 4, "writer": True}, TypeError),
+        ({"flush_policy": "always", "writer": True}, TypeError),
+    ],
+)
+def test_tuning_bad_params(conn, kwargs, exc):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    if kwargs.get("writer"):
+        kwargs["writer"] = LibpqWriter(cur)
+    with pytest.raises(exc):
+        with cur.copy("copy copy_in from stdin", **kwargs):
+            pass
+
+    # The operation was not started
+    cur.execute("select 1")
+
+
 def test_worker_error_propagated(conn, monkeypatch):
 
     def copy_to_broken(pgconn, buffer, flush=True):
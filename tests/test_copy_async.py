@@ -1,5 +1,7 @@
+import os
 import string
 import hashlib
+import threading
 from io import BytesIO, StringIO
 from random import choice, randrange
 from itertools import cycle
@@ -471,6 +473,47 @@ async def test_copy_in_records(aconn, format):
     assert data == sample_records
 
 
+@pytest.mark.parametrize("format", pq.Format)
+@pytest.mark.parametrize("buffer_size", [1, 1024])
+async def test_write_rows(aconn, format, buffer_size, monkeypatch):
+    threads = set()
+    format_rows = psycopg._copy_base.BaseCopy._format_rows
+
+    def format_rows_thread(self, rows):
+        threads.add(threading.get_ident())
+        return format_rows(self, rows)
+
+    monkeypatch.setattr(psycopg._copy_base.BaseCopy, "_format_rows", format_rows_thread)
+
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "id int primary key, data text")
+    records = [(i, f"data {i}") for i in range(1000)]
+    async with cur.copy(
+        f"copy copy_in from stdin (format {format.name})", buffer_size=buffer_size
+    ) as copy:
+        copy.set_types(["int4", "text"])
+        await copy.write_row(records[0])
+        await copy.write_rows(records[1:-1], batch_size=100)
+        await copy.write_row(records[-1])
+
+    await cur.execute("select * from copy_in order by 1")
+    assert await cur.fetchall() == records
+
+    assert threads
+    if True:  # ASYNC
+        assert threading.get_ident() not in threads
+    else:
+        assert threads == {threading.get_ident()}
+
+
+async def test_write_rows_bad_batch_size(aconn):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    async with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(ValueError):
+            await copy.write_rows(sample_records, batch_size=0)
+
+
 @pytest.mark.parametrize("format", pq.Format)
 async def test_copy_in_records_set_types(aconn, format):
     cur = aconn.cursor()
@@ -689,6 +732,109 @@ async def test_copy_from_insane_size(aconn):
     await gen.assert_data()
 
 
+@pytest.mark.parametrize("method", ["file", "fd", "path"])
+async def test_copy_from_to_file(aconn, tmp_path, method):
+    gen = DataGenerator(aconn, nrecs=100, srec=1000)
+    await gen.ensure_table()
+    src = tmp_path / "src.pgcopy"
+    src.write_text(gen.file().read())
+    tgt = tmp_path / "tgt.pgcopy"
+
+    cur = aconn.cursor()
+    async with cur.copy("copy copy_in from stdin") as copy:
+        if method == "path":
+            await copy.copy_from_path(src)
+        else:
+            with src.open("rb") as f:
+                await copy.copy_from_file(
+                    f if method == "file" else f.fileno(), chunk_size=1000
+                )
+
+    assert cur.rowcount == 100
+    await gen.assert_data()
+
+    async with cur.copy("copy copy_in to stdout") as copy:
+        if method == "path":
+            await copy.copy_to_path(tgt)
+        else:
+            with tgt.open("wb") as f:
+                await copy.copy_to_file(f if method == "file" else f.fileno())
+
+    assert cur.rowcount == 100
+    assert tgt.read_bytes() == src.read_bytes()
+
+
+async def test_copy_to_file_buffer_size(aconn, tmp_path, monkeypatch):
+    cur = aconn.cursor()
+    tgt = tmp_path / "copy.txt"
+    sizes = []
+    async with cur.copy(
+        "copy (select repeat('x', 999) from generate_series(1, 100)) to stdout",
+        buffer_size=10_000,
+    ) as copy:
+        write_fd = copy._write_fd
+
+        async def write_fd_spy(fd, chunks):
+            sizes.append(sum(len(c) for c in chunks))
+            await write_fd(fd, chunks)
+
+        monkeypatch.setattr(copy, "_write_fd", write_fd_spy)
+        with tgt.open("wb") as f:
+            await copy.copy_to_file(f.fileno())
+
+    assert tgt.read_bytes() == (b"x" * 999 + b"\n") * 100
+    assert sizes[:10] == [10_000] * 10
+    assert sum(sizes) == 100_000
+
+
+async def test_copy_from_file_queued(aconn):
+    gen = DataGenerator(aconn, nrecs=100, srec=1000)
+    await gen.ensure_table()
+    f = BytesIO(gen.file().read().encode())
+    cur = aconn.cursor()
+    async with cur.copy(
+        "copy copy_in from stdin", writer=AsyncQueuedLibpqWriter(cur)
+    ) as copy:
+        await copy.copy_from_file(f, chunk_size=1000)
+
+    await gen.assert_data()
+
+
+async def test_copy_from_file_text(aconn):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    async with cur.copy("copy copy_in from stdin") as copy:
+        await copy.copy_from_file(StringIO(sample_text.decode()))
+
+    await cur.execute("select * from copy_in order by 1")
+    assert await cur.fetchall() == sample_records
+
+
+async def test_copy_file_bad_direction(aconn):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    async with cur.copy("copy copy_in from stdin") as copy:
+        with pytest.raises(e.ProgrammingError):
+            await copy.copy_to_file(BytesIO())
+
+    async with cur.copy("copy copy_in to stdout") as copy:
+        with pytest.raises(e.ProgrammingError):
+            await copy.copy_from_file(BytesIO(sample_text))
+
+
+def test_write_fd_partial(tmp_path, monkeypatch):
+    def writev(fd, chunks):
+        # Write at most 3 bytes at time
+        return os.write(fd, b"".join(chunks)[:3])
+
+    monkeypatch.setattr(psycopg._copy_base, "_writev", writev)
+    chunks: list[Buffer] = [b"hello", memoryview(b" "), bytearray(b"world"), b"", b"!"]
+    with (tmp_path / "out").open("wb") as f:
+        psycopg._copy_base.write_fd(f.fileno(), chunks)
+
+    assert (tmp_path / "out").read_bytes() == b"hello world!"
+
+
 async def test_copy_rowcount(aconn):
     gen = DataGenerator(aconn, nrecs=3, srec=10)
     await gen.ensure_table()
@@ -809,6 +955,82 @@ async def test_worker_life(aconn, format, buffer):
     assert data == sample_records
 
 
+@pytest.mark.parametrize("format", pq.Format)
+async def test_buffer_size(aconn, format):
+    writes = []
+
+    class CountingWriter(AsyncLibpqWriter):
+        async def write(self, data):
+            writes.append(len(data))
+            await super().write(data)
+
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    async with cur.copy(
+        f"copy copy_in from stdin (format {format.name})",
+        writer=CountingWriter(cur),
+        buffer_size=1,
+    ) as copy:
+        for row in sample_records:
+            await copy.write_row(row)
+            assert len(writes) == sample_records.index(row) + 1
+
+    await cur.execute("select * from copy_in order by 1")
+    assert await cur.fetchall() == sample_records
+
+
+async def test_queue_size(aconn):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    async with cur.copy("copy copy_in from stdin", queue_size=4) as copy:
+        assert isinstance(copy.writer, AsyncQueuedLibpqWriter)
+        assert copy.writer._queue.maxsize == 4
+        for row in sample_records:
+            await copy.write_row(row)
+
+    await cur.execute("select * from copy_in order by 1")
+    assert await cur.fetchall() == sample_records
+
+
+@pytest.mark.parametrize("policy", ["auto", "always", "never"])
+@pytest.mark.parametrize("queue_size", [None, 4])
+async def test_flush_policy(aconn, policy, queue_size):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    async with cur.copy(
+        "copy copy_in from stdin", queue_size=queue_size, flush_policy=policy
+    ) as copy:
+        if policy != "auto":
+            assert copy.writer._flush == (policy == "always")
+        await copy.write(sample_text)
+
+    await cur.execute("select * from copy_in order by 1")
+    assert await cur.fetchall() == sample_records
+
+
+@pytest.mark.parametrize(
+    "kwargs, exc",
+    [
+        ({"buffer_size": 0}, ValueError),
+        ({"queue_size": 0}, ValueError),
+        ({"flush_policy": "sometimes"}, ValueError),
+        ({"queue_size": 4, "writer": True}, TypeError),
+        ({"flush_policy": "always", "writer": True}, TypeError),
+    ],
+)
+async def test_tuning_bad_params(aconn, kwargs, exc):
+    cur = aconn.cursor()
+    await ensure_table_async(cur, sample_tabledef)
+    if kwargs.get("writer"):
+        kwargs["writer"] = AsyncLibpqWriter(cur)
+    with pytest.raises(exc):
+        async with cur.copy("copy copy_in from stdin", **kwargs):
+            pass
+
+    # The operation was not started
+    await cur.execute("select 1")
+
+
 async def test_worker_error_propagated(aconn, monkeypatch):
     def copy_to_broken(pgconn, buffer, flush=True):
         raise ZeroDivisionError
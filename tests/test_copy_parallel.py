@@ -0,0 +1,186 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'test_copy_parallel_async.py'
+# DO NOT CHANGE! Change the original file instead.
+import logging
+
+import pytest
+
+import psycopg
+from psycopg import errors as e
+from psycopg import pq
+from psycopg.copy import ParallelCopy
+
+from ._test_copy import ensure_table, sample_records, sample_tabledef, sample_text
+
+pytestmark = pytest.mark.crdb_skip("copy")
+
+
+@pytest.fixture
+def aconns(conn_cls, dsn):
+    conns = [conn_cls.connect(dsn) for _ in range(3)]
+    yield conns
+    for conn in conns:
+        conn.close()
+
+
+@pytest.fixture
+def table(conn):
+    ensure_table(conn.cursor(), sample_tabledef, name="copy_parallel")
+    conn.commit()
+    return conn
+
+
+def count_records(conn):
+    cur = conn.execute("select count(*) from copy_parallel")
+    rec = cur.fetchone()
+    conn.rollback()
+    return rec[0]
+
+
+@pytest.mark.parametrize("tpc", [False, True])
+def test_write_row(table, aconns, tpc, request):
+    if tpc:
+        request.getfixturevalue("tpc")
+
+    with ParallelCopy(
+        aconns, "copy copy_parallel (col2, data) from stdin", batch_size=7, tpc=tpc
+    ) as pcopy:
+        for i in range(1000):
+            pcopy.write_row((i, f"row {i}"))
+
+    assert pcopy.rowcount == 1000
+    assert count_records(table) == 1000
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+        assert not conn._tpc
+
+
+def test_write(table, aconns):
+    with ParallelCopy(aconns, "copy copy_parallel from stdin") as pcopy:
+        for line in sample_text.splitlines(keepends=True):
+            pcopy.write(line)
+
+    assert pcopy.rowcount == 2
+    cur = table.execute("select * from copy_parallel order by col1")
+    assert cur.fetchall() == sample_records
+
+
+def test_binary(table, aconns):
+    with ParallelCopy(
+        aconns,
+        "copy copy_parallel from stdin (format binary)",
+        types=["int4", "int4", "text"],
+        batch_size=1,
+    ) as pcopy:
+        for row in sample_records:
+            pcopy.write_row(row)
+
+    cur = table.execute("select * from copy_parallel order by col1")
+    assert cur.fetchall() == sample_records
+
+
+def test_binary_write(table, aconns):
+    with ParallelCopy(aconns, "copy copy_parallel from stdin (format binary)") as pcopy:
+        with pytest.raises(psycopg.ProgrammingError, match="write_row"):
+            pcopy.write(b"PGCOPY\n\xff\r\n\x00")
+
+    assert pcopy.rowcount == 0
+
+
+@pytest.mark.parametrize("tpc", [False, True])
+def test_error_rollback(table, aconns, tpc, request):
+    if tpc:
+        request.getfixturevalue("tpc")
+
+    with pytest.raises(e.InvalidTextRepresentation):
+        with ParallelCopy(
+            aconns, "copy copy_parallel from stdin", batch_size=10, tpc=tpc
+        ) as pcopy:
+            for i in range(1000):
+                pcopy.write_row((i, "bad" if i == 500 else i, "x"))
+
+    assert pcopy.rowcount == -1
+    assert count_records(table) == 0
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+        assert not conn._tpc
+
+
+def test_tpc_commit_error(table, aconns, tpc, monkeypatch, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg")
+    tpc_commit = aconns[1].tpc_commit
+
+    def tpc_commit_fail():
+        raise e.OperationalError("commit failed")
+
+    monkeypatch.setattr(aconns[1], "tpc_commit", tpc_commit_fail)
+    with pytest.raises(e.OperationalError, match="commit failed"):
+        with ParallelCopy(
+            aconns, "copy copy_parallel (col2, data) from stdin", batch_size=1, tpc=True
+        ) as pcopy:
+            for i in range(30):
+                pcopy.write_row((i, f"row {i}"))
+
+    # The transactions of the other connections are committed
+    assert not aconns[0]._tpc and (not aconns[2]._tpc)
+    assert aconns[1]._tpc
+    xid = aconns[1]._tpc[0]
+    assert count_records(table) == 30 - pcopy._rowcounts[1]
+    assert str(xid) in caplog.records[-1].message
+
+    tpc_commit()
+    assert count_records(table) == 30
+
+
+def test_exception_rollback(table, aconns):
+    with pytest.raises(ZeroDivisionError):
+        with ParallelCopy(aconns, "copy copy_parallel from stdin") as pcopy:
+            for i in range(100):
+                pcopy.write_row((i, i, "x"))
+            1 / 0
+
+    assert count_records(table) == 0
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+def test_bad_statement(table, aconns):
+    with pytest.raises(e.UndefinedTable):
+        with ParallelCopy(
+            aconns, "copy nosuchtable from stdin", batch_size=1, queue_size=1
+        ) as pcopy:
+            for i in range(100):
+                pcopy.write_row((i, i, "x"))
+
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+def test_bad_connection_state(table, aconns):
+    aconns[1].set_autocommit(True)
+    with pytest.raises(psycopg.ProgrammingError):
+        with ParallelCopy(aconns, "copy copy_parallel from stdin"):
+            pass
+
+    aconns[1].set_autocommit(False)
+    aconns[1].execute("select 1")
+    with pytest.raises(psycopg.ProgrammingError):
+        with ParallelCopy(aconns, "copy copy_parallel from stdin"):
+            pass
+
+
+def test_write_finished(table, aconns):
+    with ParallelCopy(aconns, "copy copy_parallel from stdin") as pcopy:
+        pass
+
+    assert pcopy.rowcount == 0
+    with pytest.raises(psycopg.ProgrammingError):
+        pcopy.write(sample_text)
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"queue_size": 0}])
+def test_bad_params(aconns, kwargs):
+    with pytest.raises(ValueError):
+        ParallelCopy(aconns, "copy copy_parallel from stdin", **kwargs)
+    with pytest.raises(ValueError):
+        ParallelCopy([], "copy copy_parallel from stdin")
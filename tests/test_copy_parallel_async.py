@@ -0,0 +1,185 @@
+import logging
+
+import pytest
+
+import psycopg
+from psycopg import errors as e
+from psycopg import pq
+from psycopg.copy import AsyncParallelCopy
+
+from ._test_copy import ensure_table_async, sample_records, sample_tabledef, sample_text
+
+pytestmark = pytest.mark.crdb_skip("copy")
+
+
+@pytest.fixture
+async def aconns(aconn_cls, dsn):
+    conns = [await aconn_cls.connect(dsn) for _ in range(3)]
+    yield conns
+    for conn in conns:
+        await conn.close()
+
+
+@pytest.fixture
+async def table(aconn):
+    await ensure_table_async(aconn.cursor(), sample_tabledef, name="copy_parallel")
+    await aconn.commit()
+    return aconn
+
+
+async def count_records(aconn):
+    cur = await aconn.execute("select count(*) from copy_parallel")
+    rec = await cur.fetchone()
+    await aconn.rollback()
+    return rec[0]
+
+
+@pytest.mark.parametrize("tpc", [False, True])
+async def test_write_row(table, aconns, tpc, request):
+    if tpc:
+        request.getfixturevalue("tpc")
+
+    async with AsyncParallelCopy(
+        aconns, "copy copy_parallel (col2, data) from stdin", batch_size=7, tpc=tpc
+    ) as pcopy:
+        for i in range(1000):
+            await pcopy.write_row((i, f"row {i}"))
+
+    assert pcopy.rowcount == 1000
+    assert await count_records(table) == 1000
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+        assert not conn._tpc
+
+
+async def test_write(table, aconns):
+    async with AsyncParallelCopy(aconns, "copy copy_parallel from stdin") as pcopy:
+        for line in sample_text.splitlines(keepends=True):
+            await pcopy.write(line)
+
+    assert pcopy.rowcount == 2
+    cur = await table.execute("select * from copy_parallel order by col1")
+    assert await cur.fetchall() == sample_records
+
+
+async def test_binary(table, aconns):
+    async with AsyncParallelCopy(
+        aconns,
+        "copy copy_parallel from stdin (format binary)",
+        types=["int4", "int4", "text"],
+        batch_size=1,
+    ) as pcopy:
+        for row in sample_records:
+            await pcopy.write_row(row)
+
+    cur = await table.execute("select * from copy_parallel order by col1")
+    assert await cur.fetchall() == sample_records
+
+
+async def test_binary_write(table, aconns):
+    async with AsyncParallelCopy(
+        aconns, "copy copy_parallel from stdin (format binary)"
+    ) as pcopy:
+        with pytest.raises(psycopg.ProgrammingError, match="write_row"):
+            await pcopy.write(b"PGCOPY\n\xff\r\n\0")
+
+    assert pcopy.rowcount == 0
+
+
+@pytest.mark.parametrize("tpc", [False, True])
+async def test_error_rollback(table, aconns, tpc, request):
+    if tpc:
+        request.getfixturevalue("tpc")
+
+    with pytest.raises(e.InvalidTextRepresentation):
+        async with AsyncParallelCopy(
+            aconns, "copy copy_parallel from stdin", batch_size=10, tpc=tpc
+        ) as pcopy:
+            for i in range(1000):
+                await pcopy.write_row((i, "bad" if i == 500 else i, "x"))
+
+    assert pcopy.rowcount == -1
+    assert await count_records(table) == 0
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+        assert not conn._tpc
+
+
+async def test_tpc_commit_error(table, aconns, tpc, monkeypatch, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg")
+    tpc_commit = aconns[1].tpc_commit
+
+    async def tpc_commit_fail():
+        raise e.OperationalError("commit failed")
+
+    monkeypatch.setattr(aconns[1], "tpc_commit", tpc_commit_fail)
+    with pytest.raises(e.OperationalError, match="commit failed"):
+        async with AsyncParallelCopy(
+            aconns, "copy copy_parallel (col2, data) from stdin", batch_size=1, tpc=True
+        ) as pcopy:
+            for i in range(30):
+                await pcopy.write_row((i, f"row {i}"))
+
+    # The transactions of the other connections are committed
+    assert not aconns[0]._tpc and not aconns[2]._tpc
+    assert aconns[1]._tpc
+    xid = aconns[1]._tpc[0]
+    assert await count_records(table) == 30 - pcopy._rowcounts[1]
+    assert str(xid) in caplog.records[-1].message
+
+    await tpc_commit()
+    assert await count_records(table) == 30
+
+
+async def test_exception_rollback(table, aconns):
+    with pytest.raises(ZeroDivisionError):
+        async with AsyncParallelCopy(aconns, "copy copy_parallel from stdin") as pcopy:
+            for i in range(100):
+                await pcopy.write_row((i, i, "x"))
+            1 / 0
+
+    assert await count_records(table) == 0
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+async def test_bad_statement(table, aconns):
+    with pytest.raises(e.UndefinedTable):
+        async with AsyncParallelCopy(
+            aconns, "copy nosuchtable from stdin", batch_size=1, queue_size=1
+        ) as pcopy:
+            for i in range(100):
+                await pcopy.write_row((i, i, "x"))
+
+    for conn in aconns:
+        assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+async def test_bad_connection_state(table, aconns):
+    await aconns[1].set_autocommit(True)
+    with pytest.raises(psycopg.ProgrammingError):
+        async with AsyncParallelCopy(aconns, "copy copy_parallel from stdin"):
+            pass
+
+    await aconns[1].set_autocommit(False)
+    await aconns[1].execute("select 1")
+    with pytest.raises(psycopg.ProgrammingError):
+        async with AsyncParallelCopy(aconns, "copy copy_parallel from stdin"):
+            pass
+
+
+async def test_write_finished(table, aconns):
+    async with AsyncParallelCopy(aconns, "copy copy_parallel from stdin") as pcopy:
+        pass
+
+    assert pcopy.rowcount == 0
+    with pytest.raises(psycopg.ProgrammingError):
+        await pcopy.write(sample_text)
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"queue_size": 0}])
+async def test_bad_params(aconns, kwargs):
+    with pytest.raises(ValueError):
+        AsyncParallelCopy(aconns, "copy copy_parallel from stdin", **kwargs)
+    with pytest.raises(ValueError):
+        AsyncParallelCopy([], "copy copy_parallel from stdin")
@@ -4,7 +4,6 @@ Tests common to psycopg.AsyncCursor and its subclasses.
 
 import weakref
 import datetime as dt
-from typing import Any
 from contextlib import aclosing
 
 import pytest
@@ -171,38 +170,31 @@ async def test_next(aconn):
 
 async def test_query_parse_cache_size(aconn):
     cur = aconn.cursor()
-    cls = type(cur)
-
-    # Warning: testing internal structures. Test might need refactoring with the code.
-    cache: Any
-    if cls is psycopg.AsyncCursor:
-        cache = psycopg._queries._query2pg
-    elif cls is psycopg.AsyncClientCursor:
-        cache = psycopg._queries._query2pg_client
-    elif cls is psycopg.AsyncRawCursor:
+    if type(cur) is psycopg.AsyncRawCursor:
         pytest.skip("RawCursor has no query parse cache")
-    else:
-        assert False, cls
 
-    cache.cache_clear()
-    ci = cache.cache_info()
-    h0, m0 = ci.hits, ci.misses
+    cache = psycopg.query_cache
+    cache.clear()
+    s0 = cache.pop_stats()
+    assert s0["size"] == 0
     tests = [
-        (f"select 1 -- {'x' * 3500}", (), h0, m0 + 1),
-        (f"select 1 -- {'x' * 3500}", (), h0 + 1, m0 + 1),
-        (f"select 1 -- {'x' * 4500}", (), h0 + 1, m0 + 1),
-        (f"select 1 -- {'x' * 4500}", (), h0 + 1, m0 + 1),
-        (f"select 1 -- {'%s' * 40}", ("x",) * 40, h0 + 1, m0 + 2),
-        (f"select 1 -- {'%s' * 40}", ("x",) * 40, h0 + 2, m0 + 2),
-        (f"select 1 -- {'%s' * 60}", ("x",) * 60, h0 + 2, m0 + 2),
-        (f"select 1 -- {'%s' * 60}", ("x",) * 60, h0 + 2, m0 + 2),
+        (f"select 1 -- {'x' * 3500}", (), 0, 1),
+        (f"select 1 -- {'x' * 3500}", (), 1, 1),
+        (f"select 1 -- {'x' * 4500}", (), 1, 1),
+        (f"select 1 -- {'x' * 4500}", (), 1, 1),
+        (f"select 1 -- {'%s' * 40}", ("x",) * 40, 1, 2),
+        (f"select 1 -- {'%s' * 40}", ("x",) * 40, 2, 2),
+        (f"select 1 -- {'%s' * 60}", ("x",) * 60, 2, 2),
+        (f"select 1 -- {'%s' * 60}", ("x",) * 60, 2, 2),
     ]
     for i, (query, params, hits, misses) in enumerate(tests):
         pq = cur._query_cls(psycopg.adapt.Transformer())
         pq.convert(query, params)
-        ci = cache.cache_info()
-        assert ci.hits == hits, f"at {i}"
-        assert ci.misses == misses, f"at {i}"
+        stats = cache.get_stats()
+        assert stats.get("hits", 0) == hits, f"at {i}"
+        assert stats.get("misses", 0) == misses, f"at {i}"
+
+    assert cache.get_stats()["uncached"] == 4
 
 
 async def test_execute_many_results(aconn):
@@ -464,6 +456,83 @@ async def test_executemany_null_first(aconn, fmt_in):
         )
 
 
+async def test_executemany_rows_per_insert(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+        [(10, "a"), (20, "b"), (30, "c"), (40, "d"), (50, "e")],
+        rows_per_insert=2,
+    )
+    assert cur.rowcount == 5
+    await cur.execute("select num, data from execmany order by 1")
+    rv = await cur.fetchall()
+    assert rv == [(10, "a"), (20, "b"), (30, "c"), (40, "d"), (50, "e")]
+
+
+async def test_executemany_rows_per_insert_returning(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%s, %s) returning num"),
+        [(10, "a"), (20, "b"), (30, "c")],
+        returning=True,
+        rows_per_insert=2,
+    )
+    ress = await alist(await res.fetchall() async for res in cur.results())
+    if isinstance(cur, psycopg.AsyncRawCursor):
+        # Raw queries are not merged
+        assert ress == [[(10,)], [(20,)], [(30,)]]
+    else:
+        assert ress == [[(10,), (20,)], [(30,)]]
+
+
+async def test_executemany_rows_per_insert_no_insert(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        ph(cur, "insert into execmany(num, data) values (%(num)s, %(data)s)"),
+        [{"num": 11, "data": "hello"}, {"num": 21, "data": "world"}],
+        rows_per_insert=10,
+    )
+    await cur.executemany(
+        ph(cur, "update execmany set data = %s where num = %s"),
+        [("foo", 11), ("bar", 21)],
+        rows_per_insert=10,
+    )
+    await cur.execute("select num, data from execmany order by 1")
+    assert (await cur.fetchall()) == [(11, "foo"), (21, "bar")]
+
+
+async def test_executemany_rows_per_insert_do_update(aconn):
+    cur = aconn.cursor()
+    await cur.execute("create temp table upsert (k int primary key, v text)")
+    await cur.executemany(
+        ph(
+            cur,
+            "insert into upsert values (%s, %s)"
+            " on conflict (k) do update set v = excluded.v",
+        ),
+        [(1, "a"), (2, "b"), (1, "c")],
+        rows_per_insert=10,
+    )
+    await cur.execute("select k, v from upsert order by k")
+    assert await cur.fetchall() == [(1, "c"), (2, "b")]
+
+
+async def test_executemany_rows_per_insert_bad_params(aconn, execmany):
+    cur = aconn.cursor()
+    with pytest.raises(ValueError):
+        await cur.executemany(
+            ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+            [(10, "a")],
+            rows_per_insert=0,
+        )
+    with pytest.raises(psycopg.ProgrammingError, match="2 placeholders"):
+        await cur.executemany(
+            ph(cur, "insert into execmany(num, data) values (%s, %s)"),
+            [(10, "a"), (20,)],
+            rows_per_insert=2,
+        )
+
+
 @pytest.mark.slow
 async def test_executemany_lock(aconn):
     async def do_execmany():
@@ -750,6 +819,43 @@ async def test_stream_chunked_row_factory(aconn):
         assert [c.name for c in cur.description] == ["a"]
 
 
+async def test_stream_batches(aconn):
+    cur = aconn.cursor()
+    batches = await alist(
+        cur.stream_batches(ph(cur, "select generate_series(1, %s) as a"), [3])
+    )
+    assert batches == [[(1,)], [(2,)], [(3,)]]
+
+
+async def test_stream_batches_no_row(aconn):
+    cur = aconn.cursor()
+    batches = await alist(cur.stream_batches("select generate_series(2, 1) as a"))
+    assert batches == []
+
+
+@pytest.mark.libpq(">= 17")
+async def test_stream_batches_chunked(aconn):
+    cur = aconn.cursor(row_factory=rows.scalar_row)
+    batches = await alist(
+        cur.stream_batches("select generate_series(1, 5) as a", size=2)
+    )
+    assert batches == [[1, 2], [3, 4], [5]]
+
+
+async def test_stream_batches_error_python_to_consume(aconn):
+    cur = aconn.cursor()
+    with pytest.raises(ZeroDivisionError):
+        async with aclosing(
+            cur.stream_batches("select generate_series(1, 10000)")
+        ) as gen:
+            async for batch in gen:
+                1 / 0
+    assert aconn.info.transaction_status in (
+        pq.TransactionStatus.INTRANS,
+        pq.TransactionStatus.INERROR,
+    )
+
+
 @pytest.mark.crdb_skip("no col query")
 async def test_stream_no_col(aconn):
     cur = aconn.cursor()
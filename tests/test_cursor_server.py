@@ -8,6 +8,7 @@ import psycopg
 from psycopg import errors as e
 from psycopg import pq, rows
 
+from .acompat import is_alive, sleep
 from ._test_cursor import ph
 
 pytestmark = pytest.mark.crdb_skip("server-side cursor")
@@ -453,6 +454,189 @@ def test_itersize(conn, commands):
             assert "fetch forward 2" in cmd.lower()
 
 
+def test_iter_pages(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 3
+        cur.execute("select generate_series(1, 10) as bar")
+        recs = list(cur)
+    assert recs == [(i,) for i in range(1, 11)]
+
+
+@pytest.mark.parametrize("n", [0, 1, 9, 10])
+def test_prefetch(conn, commands, n):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 3
+        cur.prefetch = True
+        cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (n,))
+        commands.popall()
+
+        recs = []
+        for rec in cur:
+            recs.append(rec)
+            if len(recs) == 1 and n > 3:
+                # The next page is fetched while the current is consumed.
+                assert cur._prefetcher
+
+    assert recs == [(i,) for i in range(1, n + 1)]
+    cmds = [cmd for cmd in commands.popall() if cmd.startswith("FETCH")]
+    assert cmds == ['FETCH FORWARD 3 FROM "foo"'] * (n // 3 + 1)
+
+
+def test_prefetch_break(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        cur.execute("select generate_series(1, 10) as bar")
+        for rec in cur:
+            break
+
+        # The connection can be used while the prefetch is running.
+        conn.commit()
+
+        cur.execute("select generate_series(1, 3) as bar")
+        assert list(cur) == [(1,), (2,), (3,)]
+
+
+def test_prefetch_error(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        cur.execute("select 1 / (5 - x) from generate_series(1, 10) as x")
+        recs = []
+        with pytest.raises(e.DivisionByZero):
+            for rec in cur:
+                recs.append(rec)
+        assert len(recs) == 4
+
+
+def test_itersize_bytes(conn, commands):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 10
+        cur.itersize_bytes = 10000
+        cur.execute("select repeat('x', 100) from generate_series(1, 500)")
+        commands.popall()
+
+        assert len(list(cur)) == 500
+        sizes = fetch_sizes(commands)
+        assert sizes[:5] == [10, 20, 40, 80, 95]
+        assert set(sizes[4:]) == {95}
+
+        # The adapted size is reset on execute.
+        cur.execute("select repeat('x', 5000) from generate_series(1, 10)")
+        commands.popall()
+        assert len(list(cur)) == 10
+        sizes = fetch_sizes(commands)
+        assert sizes == [10, 1]
+
+    assert cur.itersize == 10
+
+
+def test_prefetch_itersize_bytes(conn, commands):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 10
+        cur.itersize_bytes = 10000
+        cur.prefetch = True
+        cur.execute("select repeat('x', 100) from generate_series(1, 500)")
+        commands.popall()
+
+        assert len(list(cur)) == 500
+        sizes = fetch_sizes(commands)
+        assert sizes[:5] == [10, 20, 40, 80, 95]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_prefetch_fetch(conn, prefetch):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = prefetch
+        cur.execute("select generate_series(1, 10) as bar")
+        assert next(cur) == (1,)
+
+        # The records fetched and not consumed by the iteration are not lost.
+        assert cur.fetchone() == (2,)
+        assert cur.rownumber == 2
+        assert cur.fetchmany(3) == [(3,), (4,), (5,)]
+        assert cur.rownumber == 5
+        assert next(cur) == (6,)
+        assert cur.rownumber == 6
+        assert cur.fetchall() == [(i,) for i in range(7, 11)]
+        assert cur.rownumber == 10
+        assert not cur._prefetch_size
+
+
+@pytest.mark.crdb_skip("scroll cursor")
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_prefetch_scroll(conn, prefetch):
+    with conn.cursor("foo", scrollable=True) as cur:
+        cur.itersize = 2
+        cur.prefetch = prefetch
+        cur.execute("select generate_series(1, 10) as bar")
+        assert next(cur) == (1,)
+
+        cur.scroll(2)
+        assert cur.rownumber == 3
+        assert cur.fetchone() == (4,)
+        assert next(cur) == (5,)
+        cur.scroll(-2)
+        assert cur.rownumber == 3
+        assert next(cur) == (4,)
+
+
+def test_prefetch_execute(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        cur.execute("select generate_series(1, 10) as bar")
+        for rec in cur:
+            break
+        assert cur._prefetcher
+
+        # The worker of the iteration abandoned is stopped.
+        cur.execute("select generate_series(1, 3) as bar")
+        assert not cur._prefetcher
+
+
+def test_prefetch_del(conn, recwarn, gc_collect):
+    cur = conn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = True
+    cur.execute("select generate_series(1, 10) as bar")
+    for rec in cur:
+        break
+    worker = cur._prefetcher
+    assert worker
+    sleep(0.1)
+
+    # The worker doesn't keep the cursor alive and stops with it.
+    del cur
+    gc_collect()
+    assert recwarn.pop(ResourceWarning)
+    sleep(0.1)
+    assert not is_alive(worker)
+
+
+def test_prefetch_conn_busy(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        cur.execute("select generate_series(1, 10) as bar")
+        recs = []
+        for rec in cur:
+            recs.append(rec)
+            # If the connection is busy the prefetch is skipped, not lost.
+            with conn.lock:
+                sleep(0.01)
+
+        assert recs == [(i,) for i in range(1, 11)]
+        # The worker is stopped at the end of the iteration.
+        assert not cur._prefetcher
+
+
+def fetch_sizes(commands):
+    cmds = commands.popall()
+    return [int(cmd.split()[2]) for cmd in cmds if cmd.startswith("FETCH")]
+
+
 def test_next(conn):
     with conn.cursor() as cur:
         cur.execute("select 1")
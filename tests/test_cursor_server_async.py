@@ -5,7 +5,7 @@ import psycopg
 from psycopg import errors as e
 from psycopg import pq, rows
 
-from .acompat import alist
+from .acompat import alist, asleep, is_alive
 from ._test_cursor import ph
 
 pytestmark = pytest.mark.crdb_skip("server-side cursor")
@@ -459,6 +459,189 @@ async def test_itersize(aconn, acommands):
             assert "fetch forward 2" in cmd.lower()
 
 
+async def test_iter_pages(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 3
+        await cur.execute("select generate_series(1, 10) as bar")
+        recs = await alist(cur)
+    assert recs == [(i,) for i in range(1, 11)]
+
+
+@pytest.mark.parametrize("n", [0, 1, 9, 10])
+async def test_prefetch(aconn, acommands, n):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 3
+        cur.prefetch = True
+        await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (n,))
+        acommands.popall()
+
+        recs = []
+        async for rec in cur:
+            recs.append(rec)
+            if len(recs) == 1 and n > 3:
+                # The next page is fetched while the current is consumed.
+                assert cur._prefetcher
+
+    assert recs == [(i,) for i in range(1, n + 1)]
+    cmds = [cmd for cmd in acommands.popall() if cmd.startswith("FETCH")]
+    assert cmds == ['FETCH FORWARD 3 FROM "foo"'] * (n // 3 + 1)
+
+
+async def test_prefetch_break(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        await cur.execute("select generate_series(1, 10) as bar")
+        async for rec in cur:
+            break
+
+        # The connection can be used while the prefetch is running.
+        await aconn.commit()
+
+        await cur.execute("select generate_series(1, 3) as bar")
+        assert await alist(cur) == [(1,), (2,), (3,)]
+
+
+async def test_prefetch_error(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        await cur.execute("select 1 / (5 - x) from generate_series(1, 10) as x")
+        recs = []
+        with pytest.raises(e.DivisionByZero):
+            async for rec in cur:
+                recs.append(rec)
+        assert len(recs) == 4
+
+
+async def test_itersize_bytes(aconn, acommands):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 10
+        cur.itersize_bytes = 10_000
+        await cur.execute("select repeat('x', 100) from generate_series(1, 500)")
+        acommands.popall()
+
+        assert len(await alist(cur)) == 500
+        sizes = fetch_sizes(acommands)
+        assert sizes[:5] == [10, 20, 40, 80, 95]
+        assert set(sizes[4:]) == {95}
+
+        # The adapted size is reset on execute.
+        await cur.execute("select repeat('x', 5000) from generate_series(1, 10)")
+        acommands.popall()
+        assert len(await alist(cur)) == 10
+        sizes = fetch_sizes(acommands)
+        assert sizes == [10, 1]
+
+    assert cur.itersize == 10
+
+
+async def test_prefetch_itersize_bytes(aconn, acommands):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 10
+        cur.itersize_bytes = 10_000
+        cur.prefetch = True
+        await cur.execute("select repeat('x', 100) from generate_series(1, 500)")
+        acommands.popall()
+
+        assert len(await alist(cur)) == 500
+        sizes = fetch_sizes(acommands)
+        assert sizes[:5] == [10, 20, 40, 80, 95]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_prefetch_fetch(aconn, prefetch):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = prefetch
+        await cur.execute("select generate_series(1, 10) as bar")
+        assert await anext(cur) == (1,)
+
+        # The records fetched and not consumed by the iteration are not lost.
+        assert await cur.fetchone() == (2,)
+        assert cur.rownumber == 2
+        assert await cur.fetchmany(3) == [(3,), (4,), (5,)]
+        assert cur.rownumber == 5
+        assert await anext(cur) == (6,)
+        assert cur.rownumber == 6
+        assert await cur.fetchall() == [(i,) for i in range(7, 11)]
+        assert cur.rownumber == 10
+        assert not cur._prefetch_size
+
+
+@pytest.mark.crdb_skip("scroll cursor")
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_prefetch_scroll(aconn, prefetch):
+    async with aconn.cursor("foo", scrollable=True) as cur:
+        cur.itersize = 2
+        cur.prefetch = prefetch
+        await cur.execute("select generate_series(1, 10) as bar")
+        assert await anext(cur) == (1,)
+
+        await cur.scroll(2)
+        assert cur.rownumber == 3
+        assert await cur.fetchone() == (4,)
+        assert await anext(cur) == (5,)
+        await cur.scroll(-2)
+        assert cur.rownumber == 3
+        assert await anext(cur) == (4,)
+
+
+async def test_prefetch_execute(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        await cur.execute("select generate_series(1, 10) as bar")
+        async for rec in cur:
+            break
+        assert cur._prefetcher
+
+        # The worker of the iteration abandoned is stopped.
+        await cur.execute("select generate_series(1, 3) as bar")
+        assert not cur._prefetcher
+
+
+async def test_prefetch_del(aconn, recwarn, gc_collect):
+    cur = aconn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = True
+    await cur.execute("select generate_series(1, 10) as bar")
+    async for rec in cur:
+        break
+    worker = cur._prefetcher
+    assert worker
+    await asleep(0.1)
+
+    # The worker doesn't keep the cursor alive and stops with it.
+    del cur
+    gc_collect()
+    assert recwarn.pop(ResourceWarning)
+    await asleep(0.1)
+    assert not is_alive(worker)
+
+
+async def test_prefetch_conn_busy(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = True
+        await cur.execute("select generate_series(1, 10) as bar")
+        recs = []
+        async for rec in cur:
+            recs.append(rec)
+            # If the connection is busy the prefetch is skipped, not lost.
+            async with aconn.lock:
+                await asleep(0.01)
+
+        assert recs == [(i,) for i in range(1, 11)]
+        # The worker is stopped at the end of the iteration.
+        assert not cur._prefetcher
+
+
+def fetch_sizes(commands):
+    cmds = commands.popall()
+    return [int(cmd.split()[2]) for cmd in cmds if cmd.startswith("FETCH")]
+
+
 async def test_next(aconn):
     async with aconn.cursor() as cur:
         await cur.execute("select 1")
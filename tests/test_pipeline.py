@@ -402,6 +402,62 @@ def test_executemany_trace_returning(conn, trace):
     assert len([i for i in items if i.type == "Sync"]) == 1
 
 
+@pytest.mark.crdb("skip", reason="temp tables")
+def test_executemany_batch_size_trace(conn, trace):
+    conn.set_autocommit(True)
+    cur = conn.cursor()
+    cur.execute("create temp table trace (id int)")
+    t = trace.trace(conn)
+    cur.executemany(
+        "insert into trace (id) values (%s)", [(i,) for i in range(5)], batch_size=2
+    )
+    assert cur.rowcount == 5
+    conn.close()
+    items = list(t)
+    assert items[-1].type == "Terminate"
+    del items[-1]
+    assert len([i for i in items if i.type == "Sync"]) == 3
+    roundtrips = [k for k, g in groupby(items, key=attrgetter("direction"))]
+    assert roundtrips == ["F", "B"] * 3
+
+
+def test_executemany_batch_size_returning(conn):
+    conn.set_autocommit(True)
+    cur = conn.cursor()
+    cur.executemany(
+        "select %s::int", [(i,) for i in range(5)], returning=True, batch_size=2
+    )
+    got = []
+    while True:
+        got.append(cur.fetchone())
+        if not cur.nextset():
+            break
+    assert got == [(i,) for i in range(5)]
+
+
+@pytest.mark.crdb("skip", reason="temp tables")
+def test_executemany_batch_size_error(conn):
+    conn.set_autocommit(True)
+    cur = conn.cursor()
+    cur.execute("create temp table batchsize (id int primary key)")
+    with pytest.raises(e.UniqueViolation):
+        cur.executemany(
+            "insert into batchsize (id) values (%s)",
+            [(1,), (2,), (3,), (1,)],
+            batch_size=2,
+        )
+
+    # In autocommit, each batch is a separate transaction.
+    cur.execute("select id from batchsize order by id")
+    assert cur.fetchall() == [(1,), (2,)]
+
+
+def test_executemany_batch_size_bad(conn):
+    cur = conn.cursor()
+    with pytest.raises(ValueError):
+        cur.executemany("select %s", [(1,)], batch_size=0)
+
+
 def test_prepared(conn):
     conn.set_autocommit(True)
     with conn.pipeline():
@@ -399,6 +399,62 @@ async def test_executemany_trace_returning(aconn, trace):
     assert len([i for i in items if i.type == "Sync"]) == 1
 
 
+@pytest.mark.crdb("skip", reason="temp tables")
+async def test_executemany_batch_size_trace(aconn, trace):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    await cur.execute("create temp table trace (id int)")
+    t = trace.trace(aconn)
+    await cur.executemany(
+        "insert into trace (id) values (%s)", [(i,) for i in range(5)], batch_size=2
+    )
+    assert cur.rowcount == 5
+    await aconn.close()
+    items = list(t)
+    assert items[-1].type == "Terminate"
+    del items[-1]
+    assert len([i for i in items if i.type == "Sync"]) == 3
+    roundtrips = [k for k, g in groupby(items, key=attrgetter("direction"))]
+    assert roundtrips == ["F", "B"] * 3
+
+
+async def test_executemany_batch_size_returning(aconn):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    await cur.executemany(
+        "select %s::int", [(i,) for i in range(5)], returning=True, batch_size=2
+    )
+    got = []
+    while True:
+        got.append(await cur.fetchone())
+        if not cur.nextset():
+            break
+    assert got == [(i,) for i in range(5)]
+
+
+@pytest.mark.crdb("skip", reason="temp tables")
+async def test_executemany_batch_size_error(aconn):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    await cur.execute("create temp table batchsize (id int primary key)")
+    with pytest.raises(e.UniqueViolation):
+        await cur.executemany(
+            "insert into batchsize (id) values (%s)",
+            [(1,), (2,), (3,), (1,)],
+            batch_size=2,
+        )
+
+    # In autocommit, each batch is a separate transaction.
+    await cur.execute("select id from batchsize order by id")
+    assert await cur.fetchall() == [(1,), (2,)]
+
+
+async def test_executemany_batch_size_bad(aconn):
+    cur = aconn.cursor()
+    with pytest.raises(ValueError):
+        await cur.executemany("select %s", [(1,)], batch_size=0)
+
+
 async def test_prepared(aconn):
     await aconn.set_autocommit(True)
     async with aconn.pipeline():
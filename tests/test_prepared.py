@@ -179,6 +179,84 @@ def test_evict_lru_deallocate(conn):
     assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
 
 
+def test_prepare_policy_init(conn_cls, dsn):
+    policy = psycopg.LatencyPreparePolicy()
+    with conn_cls.connect(dsn, prepare_policy=policy) as conn:
+        assert conn.prepare_policy is policy
+
+    with conn_cls.connect(dsn) as conn:
+        assert type(conn.prepare_policy) is psycopg.PreparePolicy
+
+
+def test_prepare_policy_latency(conn):
+    conn.prepare_policy = psycopg.LatencyPreparePolicy(min_time=0.05)
+    conn.prepare_threshold = 2
+    for i in range(3):
+        conn.execute("select 1")
+        conn.execute("select pg_sleep(0.05)")
+
+    stmts = get_prepared_statements(conn)
+    assert [stmt.statement for stmt in stmts] == ["select pg_sleep(0.05)"]
+    assert conn._prepared._counts[b"select 1", ()] == 3
+    assert conn._prepared._times[b"select 1", ()] < 0.05 * 3
+
+
+def test_prepare_policy_untimed(conn):
+    conn.execute("select 1")
+    assert conn._prepared._counts[b"select 1", ()] == 1
+    assert (b"select 1", ()) not in conn._prepared._times
+
+
+def test_prepare_policy_evict_lfu(conn):
+    conn.prepare_policy = psycopg.LatencyPreparePolicy(min_time=0)
+    conn.prepared_max = 2
+    conn.prepare_threshold = 0
+    for i in range(3):
+        conn.execute("select 'a'")
+    conn.execute("select 'b'")
+    conn.execute("select 'c'")
+
+    assert list(conn._prepared._names) == [(b"select 'a'", ()), (b"select 'c'", ())]
+    stmts = get_prepared_statements(conn)
+    assert {stmt.statement for stmt in stmts} == {"select 'a'", "select 'c'"}
+
+
+def test_prepare_policy_evict_stale(conn):
+    conn.prepare_policy = psycopg.LatencyPreparePolicy(min_time=0)
+    conn.prepared_max = 2
+    conn.prepare_threshold = 0
+    for i in range(5):
+        conn.execute("select 'a'")
+        conn.execute("select 'b'")
+    assert conn._prepared.prepared_num == 2
+
+    # A new query replaces a stale one, although used less, and is not
+    # evicted by its following executions.
+    for i in range(3):
+        conn.execute("select 'c'")
+    assert list(conn._prepared._names) == [(b"select 'b'", ()), (b"select 'c'", ())]
+    assert conn._prepared.prepared_num == 3
+
+
+def test_prepare_policy_custom(conn):
+
+    class NoSelect(psycopg.PreparePolicy):
+
+        def should_prepare(self, key, count, elapsed, threshold):
+            if key[0].startswith(b"select"):
+                return False
+            return super().should_prepare(key, count, elapsed, threshold)
+
+    conn.prepare_policy = NoSelect()
+    conn.prepare_threshold = 0
+    conn.execute("select 1")
+    conn.execute("values (1)")
+    conn.execute("select 1", prepare=True)
+
+    stmts = get_prepared_statements(conn)
+    assert {stmt.statement for stmt in stmts} == {"values (1)", "select 1"}
+
+
 @pytest.mark.skipif("psycopg._cmodule._psycopg", reason="Python-only debug conn")
 def test_deallocate_or_close(conn, caplog):
     conn.pgconn = PGconnDebug(conn.pgconn)
@@ -303,6 +381,15 @@ def test_change_type_savepoint(conn):
                     raise ZeroDivisionError()
 
 
+@pytest.mark.parametrize("max", [0, 1])
+def test_prewarm_prepared_max(conn, max):
+    conn.prepared_max = max
+    keys = [(b"select 1", ()), (b"select 2", ())]
+    nprep = conn.wait(conn._prepared.prewarm_gen(conn, keys))
+    assert nprep == max
+    assert list(conn._prepared._names) == keys[2 - max :]
+
+
 def get_prepared_statements(conn):
     cur = conn.cursor(row_factory=namedtuple_row)
     # CRDB has 'PREPARE name AS' in the statement.
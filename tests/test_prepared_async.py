@@ -178,6 +178,82 @@ async def test_evict_lru_deallocate(aconn):
     assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
 
 
+async def test_prepare_policy_init(aconn_cls, dsn):
+    policy = psycopg.LatencyPreparePolicy()
+    async with await aconn_cls.connect(dsn, prepare_policy=policy) as conn:
+        assert conn.prepare_policy is policy
+
+    async with await aconn_cls.connect(dsn) as conn:
+        assert type(conn.prepare_policy) is psycopg.PreparePolicy
+
+
+async def test_prepare_policy_latency(aconn):
+    aconn.prepare_policy = psycopg.LatencyPreparePolicy(min_time=0.05)
+    aconn.prepare_threshold = 2
+    for i in range(3):
+        await aconn.execute("select 1")
+        await aconn.execute("select pg_sleep(0.05)")
+
+    stmts = await get_prepared_statements(aconn)
+    assert [stmt.statement for stmt in stmts] == ["select pg_sleep(0.05)"]
+    assert aconn._prepared._counts[b"select 1", ()] == 3
+    assert aconn._prepared._times[b"select 1", ()] < 0.05 * 3
+
+
+async def test_prepare_policy_untimed(aconn):
+    await aconn.execute("select 1")
+    assert aconn._prepared._counts[b"select 1", ()] == 1
+    assert (b"select 1", ()) not in aconn._prepared._times
+
+
+async def test_prepare_policy_evict_lfu(aconn):
+    aconn.prepare_policy = psycopg.LatencyPreparePolicy(min_time=0)
+    aconn.prepared_max = 2
+    aconn.prepare_threshold = 0
+    for i in range(3):
+        await aconn.execute("select 'a'")
+    await aconn.execute("select 'b'")
+    await aconn.execute("select 'c'")
+
+    assert list(aconn._prepared._names) == [(b"select 'a'", ()), (b"select 'c'", ())]
+    stmts = await get_prepared_statements(aconn)
+    assert {stmt.statement for stmt in stmts} == {"select 'a'", "select 'c'"}
+
+
+async def test_prepare_policy_evict_stale(aconn):
+    aconn.prepare_policy = psycopg.LatencyPreparePolicy(min_time=0)
+    aconn.prepared_max = 2
+    aconn.prepare_threshold = 0
+    for i in range(5):
+        await aconn.execute("select 'a'")
+        await aconn.execute("select 'b'")
+    assert aconn._prepared.prepared_num == 2
+
+    # A new query replaces a stale one, although used less, and is not
+    # evicted by its following executions.
+    for i in range(3):
+        await aconn.execute("select 'c'")
+    assert list(aconn._prepared._names) == [(b"select 'b'", ()), (b"select 'c'", ())]
+    assert aconn._prepared.prepared_num == 3
+
+
+async def test_prepare_policy_custom(aconn):
+    class NoSelect(psycopg.PreparePolicy):
+        def should_prepare(self, key, count, elapsed, threshold):
+            if key[0].startswith(b"select"):
+                return False
+            return super().should_prepare(key, count, elapsed, threshold)
+
+    aconn.prepare_policy = NoSelect()
+    aconn.prepare_threshold = 0
+    await aconn.execute("select 1")
+    await aconn.execute("values (1)")
+    await aconn.execute("select 1", prepare=True)
+
+    stmts = await get_prepared_statements(aconn)
+    assert {stmt.statement for stmt in stmts} == {"values (1)", "select 1"}
+
+
 @pytest.mark.skipif("psycopg._cmodule._psycopg", reason="Python-only debug conn")
 async def test_deallocate_or_close(aconn, caplog):
     aconn.pgconn = PGconnDebug(aconn.pgconn)
@@ -306,6 +382,15 @@ async def test_change_type_savepoint(aconn):
                     raise ZeroDivisionError()
 
 
+@pytest.mark.parametrize("max", [0, 1])
+async def test_prewarm_prepared_max(aconn, max):
+    aconn.prepared_max = max
+    keys = [(b"select 1", ()), (b"select 2", ())]
+    nprep = await aconn.wait(aconn._prepared.prewarm_gen(aconn, keys))
+    assert nprep == max
+    assert list(aconn._prepared._names) == keys[2 - max :]
+
+
 async def get_prepared_statements(aconn):
     cur = aconn.cursor(row_factory=namedtuple_row)
     # CRDB has 'PREPARE name AS' in the statement.
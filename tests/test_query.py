@@ -3,7 +3,8 @@ import pytest
 import psycopg
 from psycopg import pq
 from psycopg.adapt import PyFormat, Transformer
-from psycopg._queries import PostgresQuery, _split_query
+from psycopg._queries import PostgresQuery, QueryCache, _query2pg_client_nocache
+from psycopg._queries import _query2pg_nocache, _split_insert_values, _split_query
 
 
 @pytest.mark.parametrize(
@@ -160,3 +161,106 @@ def test_pq_query_badprog(query, params):
     pq = PostgresQuery(Transformer())
     with pytest.raises(psycopg.ProgrammingError):
         pq.convert(query, params)
+
+
+@pytest.mark.parametrize(
+    "query, split",
+    [
+        (b"insert into t values (%s, %s)", True),
+        (b"insert into t values (%s) on conflict do nothing", True),
+        (b"insert into t values (%s) on conflict (k) do update set v = 1", False),
+        (b"INSERT INTO t VALUES (%s) ON CONFLICT ON CONSTRAINT c DO UPDATE SET", False),
+    ],
+)
+def test_split_insert_values_on_conflict(query, split):
+    assert bool(_split_insert_values(query, "utf8")) is split
+
+
+def test_query_cache_lru():
+    cache = QueryCache(maxsize=2)
+    tx = Transformer()
+    for query in ["select %s", "select %s, 1", "select %s", "select %s, 2"]:
+        cache.convert(_query2pg_nocache, query, [1], tx)
+
+    stats = cache.get_stats()
+    assert stats == {"hits": 1, "misses": 3, "evictions": 1, "size": 2, "maxsize": 2}
+
+    # "select %s, 1" was evicted
+    cache.convert(_query2pg_nocache, "select %s", [1], tx)
+    assert cache.get_stats()["hits"] == 2
+    cache.convert(_query2pg_nocache, "select %s, 1", [1], tx)
+    assert cache.get_stats()["misses"] == 4
+
+    stats = cache.pop_stats()
+    assert stats == {"hits": 2, "misses": 4, "evictions": 2, "size": 2, "maxsize": 2}
+    assert cache.get_stats() == {"size": 2, "maxsize": 2}
+
+    # Resizing discards the queries cached, but they are not evictions.
+    cache.maxsize = 1
+    assert cache.get_stats() == {"size": 0, "maxsize": 1}
+    for query in ["select %s", "select %s", "select %s, 1"]:
+        cache.convert(_query2pg_nocache, query, [1], tx)
+    stats = cache.pop_stats()
+    assert stats == {"hits": 1, "misses": 2, "evictions": 1, "size": 1, "maxsize": 1}
+
+    cache.clear()
+    assert cache.get_stats() == {"size": 0, "maxsize": 1}
+
+    with pytest.raises(ValueError):
+        cache.maxsize = -1
+
+
+def test_query_cache_maxsize_funcs():
+    cache = QueryCache(maxsize=2)
+    tx = Transformer()
+    for func in [_query2pg_nocache, _query2pg_client_nocache]:
+        for query in ["select %s", "select %s, 1"]:
+            cache.convert(func, query, [1], tx)
+
+    # The maxsize is shared by all the conversion functions.
+    stats = cache.get_stats()
+    assert stats == {"misses": 4, "evictions": 2, "size": 2, "maxsize": 2}
+
+
+def test_query_cache_str_bytes():
+    cache = QueryCache()
+    tx = Transformer()
+    rv1 = cache.convert(_query2pg_nocache, "select %s", [1], tx)
+    rv2 = cache.convert(_query2pg_nocache, b"select %s", [1], tx)
+    assert rv1 == rv2
+    assert rv1[0] == b"select $1"
+    assert cache.get_stats()["misses"] == 2
+
+
+@pytest.mark.parametrize(
+    "attr, value, query, nparams",
+    [
+        ("maxsize", 0, "select %s", 1),
+        ("max_query_length", 10, "select %s -- long", 1),
+        ("max_params", 2, "select %s, %s, %s", 3),
+    ],
+)
+def test_query_cache_uncached(attr, value, query, nparams):
+    cache = QueryCache()
+    setattr(cache, attr, value)
+    for i in range(2):
+        rv = cache.convert(_query2pg_nocache, query, [1] * nparams, Transformer())
+        assert rv[0].startswith(b"select $1")
+
+    stats = cache.get_stats()
+    assert stats["uncached"] == 2
+    assert stats["size"] == 0
+
+
+def test_query_cache_length_bytes():
+    cache = QueryCache(max_query_length=11)
+    tx = Transformer()
+    pq = PostgresQuery(tx)
+    for query in ["select %s  ", "select %s \u00e0"]:
+        assert len(query) == 11
+        cache.convert(_query2pg_nocache, pq._ensure_key(query), [1], tx)
+
+    # The second query is 12 bytes long.
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["uncached"] == 1
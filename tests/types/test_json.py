@@ -215,6 +215,34 @@ def test_load_customise_context(conn, binary, pgtype):
     assert got["answer"] == 42
 
 
+@pytest.mark.parametrize("binary", [True, False])
+@pytest.mark.parametrize("pgtype", ["json", "jsonb"])
+@pytest.mark.parametrize("global_", [True, False])
+def test_load_customise_buffers(conn, binary, pgtype, global_):
+    types = []
+
+    def loads(data):
+        types.append(type(data))
+        return json.loads(bytes(data))
+
+    cur = conn.cursor(binary=binary)
+    set_json_loads(loads, None if global_ else cur, accepts_buffers=True)
+    try:
+        cur.execute(
+            f"""select '{{"foo": "bar"}}'::{pgtype}, %s::{pgtype}""",
+            ["[" + ", ".join(["1"] * 10000) + "]"],
+        )
+        assert cur.fetchone() == ({"foo": "bar"}, [1] * 10000)
+    finally:
+        set_json_loads(json.loads)
+
+    if pq.__impl__ == "python" and not (binary and pgtype == "jsonb"):
+        # The Python implementation gets a copy of the data from the result.
+        assert types == [bytes, bytes]
+    else:
+        assert types == [memoryview, memoryview]
+
+
 @pytest.mark.parametrize("binary", [True, False])
 @pytest.mark.parametrize("pgtype", ["json", "jsonb"])
 def test_dump_leak_with_local_functions(dsn, binary, pgtype, caplog):
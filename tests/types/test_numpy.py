@@ -1,10 +1,14 @@
 import struct
+import datetime as dt
+from io import BytesIO
 from math import isnan
 
 import pytest
 from packaging.version import parse as ver  # noqa: F401  # used in skipif
 
+import psycopg
 from psycopg.pq import Format
+from psycopg.copy import Copy, FileWriter
 from psycopg.adapt import PyFormat
 
 pytest.importorskip("numpy")
@@ -228,3 +232,260 @@ def test_random(conn, faker, fmt):
 
     for got, want in zip(recs, faker.records):
         faker.assert_record(got, want)
+
+
+@pytest.mark.parametrize(
+    "pgtype, dtype",
+    [
+        ("int2", "int16"),
+        ("int4", "int32"),
+        ("int8", "int64"),
+        ("oid", "uint32"),
+        ("float4", "float32"),
+        ("float8", "float64"),
+    ],
+)
+@pytest.mark.parametrize("fmt", Format)
+def test_fetch_arrays_numbers(conn, pgtype, dtype, fmt):
+    cur = conn.cursor(binary=fmt == Format.BINARY)
+    cur.execute(
+        f"select n::{pgtype}, case when n % 2 = 0 then n end::{pgtype}"
+        " from generate_series(1, 10) n"
+    )
+    arr1, arr2 = cur.fetch_arrays()
+    want = np.arange(1, 11)
+    if fmt == Format.BINARY:
+        assert arr1.dtype == np.dtype(dtype)
+    assert (arr1 == want).all()
+    assert not arr1.mask.any()
+    assert list(arr2.mask) == [n % 2 == 1 for n in want]
+    assert (arr2.compressed() == want[1::2]).all()
+    assert cur.fetchone() is None
+
+
+def test_fetch_arrays_types(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute(
+        """
+        select
+            n % 2 = 0,
+            '2000-01-01'::date + n,
+            '2000-01-01'::timestamp + n * '1 hour'::interval,
+            '2000-01-01Z'::timestamptz + n * '1 hour'::interval,
+            n::numeric
+        from generate_series(-1, 1) n
+        """
+    )
+    bools, dates, tss, tstzs, nums = cur.fetch_arrays()
+    assert bools.dtype == np.dtype(bool)
+    assert list(bools) == [False, True, False]
+    assert list(dates) == list(
+        np.array(["1999-12-31", "2000-01-01", "2000-01-02"], dtype="datetime64[D]")
+    )
+    want = np.array(
+        ["1999-12-31T23:00", "2000-01-01T00:00", "2000-01-01T01:00"],
+        dtype="datetime64[us]",
+    )
+    assert list(tss) == list(want)
+    assert list(tstzs) == list(want)
+    assert nums.dtype == np.dtype(object)
+    assert list(nums) == [-1, 0, 1]
+
+
+def test_fetch_arrays_pos(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute("select n from generate_series(1, 5) n")
+    assert cur.fetchone() == (1,)
+    (arr,) = cur.fetch_arrays()
+    assert list(arr) == [2, 3, 4, 5]
+    (arr,) = cur.fetch_arrays()
+    assert len(arr) == 0
+
+
+@pytest.mark.parametrize("fmt", Format)
+def test_fetch_arrays_writable(conn, fmt):
+    cur = conn.cursor(binary=fmt == Format.BINARY)
+    cur.execute("select case when n <> 2 then n end from generate_series(1, 3) n")
+    (arr,) = cur.fetch_arrays()
+    arr[0] = 10
+    arr[1] = 20
+    arr[2] = np.ma.masked
+    assert list(arr.filled(0)) == [10, 20, 0]
+
+
+@pytest.mark.parametrize("val", ["infinity", "-infinity"])
+@pytest.mark.parametrize("pgtype", ["date", "timestamp", "timestamptz"])
+def test_fetch_arrays_infinity(conn, pgtype, val):
+    cur = conn.cursor(binary=True)
+    cur.execute(f"select '{val}'::{pgtype}")
+    with pytest.raises(psycopg.DataError):
+        cur.fetch_arrays()
+
+
+def test_fetch_arrays_server_cursor(conn):
+    with conn.cursor("numpy", binary=True) as cur:
+        cur.execute("select n, n::text from generate_series(1, 5) n")
+        assert cur.fetchone() == (1, "1")
+        arr1, arr2 = cur.fetch_arrays()
+        assert arr1.dtype == np.dtype("int32")
+        assert list(arr1) == [2, 3, 4, 5]
+        assert list(arr2) == ["2", "3", "4", "5"]
+        assert cur.rownumber == 5
+
+
+@pytest.mark.parametrize("scrollable", [None, False])
+def test_fetch_arrays_server_cursor_iter_no_scroll(conn, scrollable):
+    with conn.cursor("numpy", binary=True, scrollable=scrollable) as cur:
+        cur.itersize = 3
+        cur.execute("select n from generate_series(1, 5) n")
+        assert next(cur) == (1,)
+        with pytest.raises(psycopg.ProgrammingError):
+            cur.fetch_arrays()
+
+        # The cursor is still usable.
+        assert cur.fetchall() == [(2,), (3,), (4,), (5,)]
+
+
+@pytest.mark.crdb_skip("scroll cursor")
+def test_fetch_arrays_server_cursor_iter(conn):
+    with conn.cursor("numpy", binary=True, scrollable=True) as cur:
+        cur.itersize = 3
+        cur.execute("select n from generate_series(1, 5) n")
+        assert next(cur) == (1,)
+        (arr,) = cur.fetch_arrays()
+        assert list(arr) == [2, 3, 4, 5]
+        assert cur.rownumber == 5
+
+
+@pytest.mark.parametrize("fmt", Format)
+@pytest.mark.parametrize("nulls", [False, True])
+@pytest.mark.crdb_skip("copy")
+def test_copy_write_columns(conn, fmt, nulls):
+    cur = conn.cursor()
+    types = "int2 int4 int8 float4 float8 bool date timestamp timestamptz".split()
+    fields = [f"f{i} {t}" for i, t in enumerate(types)]
+    cur.execute(f"create table numpycols (id serial primary key, {', '.join(fields)})")
+
+    n = 1000
+    cols = [
+        np.arange(n, dtype="int16"),
+        np.arange(n, dtype="int32"),
+        np.arange(n, dtype="int64") * 2**32,
+        np.arange(n, dtype="float32") / 2,
+        np.arange(n, dtype="float64") / 3,
+        np.arange(n) % 2 == 0,
+        np.arange(n).astype("datetime64[D]"),
+        np.arange(n).astype("datetime64[s]"),
+        np.arange(n).astype("datetime64[us]"),
+    ]
+    if nulls:
+        cols = [
+            np.ma.masked_where(np.arange(n) % 3 == i % 3, c) for i, c in enumerate(cols)
+        ]
+
+    fnames = [f"f{i}" for i in range(len(types))]
+    with cur.copy(
+        f"copy numpycols ({', '.join(fnames)}) from stdin (format {fmt.name})"
+    ) as copy:
+        copy.set_types(types)
+        copy.write_columns(cols)
+
+    cur.execute(f"select {', '.join(fnames)} from numpycols order by id")
+    recs = cur.fetchall()
+    assert len(recs) == n
+    want = list(zip(*(np.ma.asarray(c).tolist() for c in cols)))
+    for rec, w in zip(recs, want):
+        assert rec[:-1] == w[:-1]
+        assert (rec[-1] and rec[-1].replace(tzinfo=None)) == w[-1]
+
+
+@pytest.mark.parametrize("fmt", Format)
+@pytest.mark.crdb_skip("copy")
+def test_copy_write_columns_ns(conn, fmt):
+    cur = conn.cursor()
+    cur.execute("create table numpycols (ts timestamp)")
+    col = np.ma.masked_array(
+        np.array(["2020-01-01T12:34:56.123456789", "NaT"], dtype="datetime64[ns]"),
+        mask=[False, True],
+    )
+    with cur.copy(f"copy numpycols from stdin (format {fmt.name})") as copy:
+        copy.set_types(["timestamp"])
+        copy.write_columns([col])
+
+    cur.execute("select * from numpycols")
+    assert cur.fetchall() == [(dt.datetime(2020, 1, 1, 12, 34, 56, 123456),), (None,)]
+
+
+@pytest.mark.crdb_skip("copy")
+def test_copy_write_columns_timedelta_ns(conn):
+    cur = conn.cursor()
+    cur.execute("create table numpycols (iv interval)")
+    col = np.array([1_500_000_000], dtype="timedelta64[ns]")
+    with cur.copy("copy numpycols from stdin") as copy:
+        copy.write_columns([col])
+
+    cur.execute("select * from numpycols")
+    assert cur.fetchall() == [(dt.timedelta(seconds=1.5),)]
+
+
+@pytest.mark.crdb_skip("copy")
+def test_copy_write_columns_infer(conn):
+    cur = conn.cursor()
+    cur.execute("create table numpycols (a int2, b int8, c float8, d date)")
+    cols = [
+        np.array([1, 2], dtype="int8"),
+        np.array([2**40, 0]),
+        np.array([0.5, np.nan]),
+        np.array(["2020-01-01", "NaT"], dtype="datetime64[D]"),
+    ]
+    with cur.copy("copy numpycols from stdin (format binary)") as copy:
+        copy.write_columns(cols)
+
+    cur.execute("select * from numpycols")
+    recs = cur.fetchall()
+    assert recs[0] == (1, 2**40, 0.5, dt.date(2020, 1, 1))
+    assert recs[1][:2] == (2, 0)
+    assert isnan(recs[1][2])
+    assert recs[1][3] is None
+
+
+@pytest.mark.parametrize(
+    "types, cols",
+    [
+        (["int4"], [np.array([2**40])]),
+        (["int4"], [np.array([1.5])]),
+        (["int4", "int4"], [np.array([1])]),
+        (["int4", "int4"], [np.array([1]), np.array([1, 2])]),
+        (["date"], [np.array([1])]),
+        (["bool"], [np.array([2])]),
+        (["int4"], [np.array([True])]),
+    ],
+)
+def test_copy_write_columns_bad(conn, types, cols):
+    cur = conn.cursor()
+    copy = Copy(cur, binary=True, writer=FileWriter(BytesIO()))
+    copy.set_types(types)
+    with pytest.raises(psycopg.DataError):
+        copy.write_columns(cols)
+
+
+def test_copy_write_columns_bad_length_text(conn):
+    cur = conn.cursor()
+    copy = Copy(cur, binary=False, writer=FileWriter(BytesIO()))
+    copy.set_types(["int4", "int4"])
+    with pytest.raises(psycopg.DataError):
+        copy.write_columns([np.arange(3), np.arange(2)])
+
+
+def test_copy_write_columns_text_slices(conn):
+    cur = conn.cursor()
+    file = BytesIO()
+    n = np.arange(1000)
+    cols = [n, np.ma.masked_where(n % 2 == 0, n)]
+    with Copy(cur, writer=FileWriter(file), buffer_size=100) as copy:
+        copy.write_columns(cols)
+
+    file.seek(0)
+    rows = file.read().splitlines()
+    assert len(rows) == 1000
+    assert rows[:3] == [b"0\t\\N", b"1\t1", b"2\t\\N"]
@@ -32,23 +32,29 @@ PYVER = "3.11"
 ALL_INPUTS = """
     psycopg/psycopg/_conninfo_attempts_async.py
     psycopg/psycopg/_copy_async.py
+    psycopg/psycopg/_copy_parallel_async.py
     psycopg/psycopg/connection_async.py
     psycopg/psycopg/cursor_async.py
     psycopg/psycopg/_pipeline_async.py
     psycopg/psycopg/_server_cursor_async.py
+    psycopg_pool/psycopg_pool/manager_async.py
     psycopg_pool/psycopg_pool/null_pool_async.py
     psycopg_pool/psycopg_pool/pool_async.py
+    psycopg_pool/psycopg_pool/routing_async.py
     psycopg_pool/psycopg_pool/sched_async.py
     tests/crdb/test_connection_async.py
     tests/crdb/test_copy_async.py
     tests/crdb/test_cursor_async.py
+    tests/pool/test_manager_async.py
     tests/pool/test_pool_async.py
     tests/pool/test_pool_common_async.py
     tests/pool/test_pool_null_async.py
+    tests/pool/test_routing_async.py
     tests/pool/test_sched_async.py
     tests/test_connection_async.py
     tests/test_conninfo_attempts_async.py
     tests/test_copy_async.py
+    tests/test_copy_parallel_async.py
     tests/test_cursor_async.py
     tests/test_cursor_client_async.py
     tests/test_cursor_common_async.py
@@ -299,11 +305,14 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "AsyncIterator": "Iterator",
         "AsyncLibpqWriter": "LibpqWriter",
         "AsyncNullConnectionPool": "NullConnectionPool",
+        "AsyncParallelCopy": "ParallelCopy",
         "AsyncPipeline": "Pipeline",
+        "AsyncPoolManager": "PoolManager",
         "AsyncPoolConnection": "PoolConnection",
         "AsyncQueuedLibpqWriter": "QueuedLibpqWriter",
         "AsyncRawCursor": "RawCursor",
         "AsyncRawServerCursor": "RawServerCursor",
+        "AsyncRoutingPool": "RoutingPool",
         "AsyncRowFactory": "RowFactory",
         "AsyncScheduler": "Scheduler",
         "AsyncServerCursor": "ServerCursor",
@@ -317,6 +326,7 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "__aiter__": "__iter__",
         "__anext__": "__next__",
         "_copy_async": "_copy",
+        "_copy_parallel_async": "_copy_parallel",
         "_pipeline_async": "_pipeline",
         "_server_cursor_async": "_server_cursor",
         "aclose": "close",
@@ -337,9 +347,13 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "cursor_async": "cursor",
         "ensure_table_async": "ensure_table",
         "find_insert_problem_async": "find_insert_problem",
+        "manager_async": "manager",
         "pool_async": "pool",
+        "psycopg_pool.manager_async": "psycopg_pool.manager",
         "psycopg_pool.pool_async": "psycopg_pool.pool",
+        "psycopg_pool.routing_async": "psycopg_pool.routing",
         "psycopg_pool.sched_async": "psycopg_pool.sched",
+        "routing_async": "routing",
         "sched_async": "sched",
         "test_pool_common_async": "test_pool_common",
         "wait_async": "wait",